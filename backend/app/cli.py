@@ -0,0 +1,42 @@
+"""관리용 CLI.
+
+사용법 (backend 디렉터리에서):
+    python -m app.cli rag-export snapshot.npz
+    python -m app.cli rag-import snapshot.npz
+"""
+import argparse
+import logging
+
+from app.config import Settings
+from app.dependencies import build_rag_service
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export = sub.add_parser("rag-export", help="RAG 컬렉션을 스냅샷 파일로 내보내기")
+    export.add_argument("path")
+    load = sub.add_parser("rag-import", help="스냅샷 파일을 재임베딩 없이 가져오기")
+    load.add_argument("path")
+    args = parser.parse_args()
+
+    settings = Settings()
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level.upper(), logging.INFO),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    rag = build_rag_service(settings)
+    try:
+        if args.command == "rag-export":
+            manifest = rag.export_snapshot(args.path)
+            print(f"exported {manifest['collections']} -> {args.path}")
+        else:
+            result = rag.import_snapshot(args.path)
+            print(f"imported {result['imported']} <- {args.path}")
+    finally:
+        rag.close()
+
+
+if __name__ == "__main__":
+    main()
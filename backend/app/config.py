@@ -6,6 +6,40 @@ class Settings(BaseSettings):
     ai_base_url: str = "http://localhost:8000/v1"
     ai_api_key: str = ""
     ai_model_name: str = "default-model"
+    # 여러 추론 서버에 분산: "url[=가중치],url[=가중치]" (비어 있으면 ai_base_url만 사용)
+    ai_endpoints: str = ""
+    ai_endpoint_max_failures: int = 3  # 연속 실패 시 해당 서버를 잠시 제외
+    ai_endpoint_eject_seconds: float = 30.0
+    ai_endpoint_health_interval_seconds: float = 10.0  # 제외된 서버 복구 확인 주기
+    ai_max_concurrency: int = 8  # LLM 서버로 동시에 보내는 요청 수 상한
+    ai_background_max_concurrency: int = 4  # 그중 웹훅 분석 등 백그라운드 호출 상한
+    ai_interactive_queue_size: int = 64  # 대기열이 차면 503으로 거절
+    ai_background_queue_size: int = 32
+    ai_classify_mode: str = "two_step"  # two_step(분류 후 추출), combined(한 번의 호출)
+    ai_combined_min_confidence: float = 0.7  # combined 결과가 이보다 낮으면 two_step으로 재시도
+    # 서버의 JSON 출력 모드 사용: off, json_object, json_schema(필드 추출에 템플릿 스키마 적용)
+    ai_response_format: str = "off"
+    ai_classification_cache_size: int = 1024  # 0이면 분류 결과 캐시 끔
+    ai_classification_cache_ttl_seconds: int = 3600
+    # 템플릿 키워드 사전 분류: off, shadow(LLM과 일치율만 집계), on(적중 시 LLM 분류 생략)
+    ai_keyword_fast_path: str = "off"
+    ai_keyword_min_score: float = 1.0
+    ai_keyword_margin: float = 1.0  # 1위 템플릿이 2위보다 이만큼 앞서야 적중
+    # 확정 티켓 라벨이 붙은 과거 VOC 최근접 이웃 투표 분류: off, shadow, on
+    ai_knn_mode: str = "off"
+    ai_knn_k: int = 10
+    ai_knn_min_neighbors: int = 3
+    ai_knn_min_agreement: float = 0.8  # 1위 템플릿 가중 득표율 하한
+    ai_knn_max_distance: float = 0.6  # 가장 가까운 라벨 이웃 거리 상한
+    # 응답 지연/장애 대응
+    ai_hedge_delay_seconds: float = 0.0  # 이 시간 안에 응답이 없으면 같은 요청을 한 번 더 보냄 (0이면 끔)
+    ai_classify_timeout_seconds: float = 30.0  # 단계별 요청 타임아웃 (0이면 제한 없음)
+    ai_extract_timeout_seconds: float = 45.0
+    ai_analyze_timeout_seconds: float = 90.0
+    ai_breaker_failure_rate: float = 0.5  # 최근 호출 실패율이 이 이상이면 차단기 열림
+    ai_breaker_window: int = 20
+    ai_breaker_min_calls: int = 10
+    ai_breaker_open_seconds: float = 30.0  # 열린 뒤 시험 호출까지 대기
 
     # Jira Cloud
     jira_base_url: str = "https://yourorg.atlassian.net"
@@ -13,6 +47,32 @@ class Settings(BaseSettings):
     jira_api_token: str = ""
     jira_project_key: str = "VOC"
 
+    # RAG
+    rag_vector_backend: str = "chromadb"  # chromadb, numpy
+    rag_numpy_dtype: str = "int8"  # numpy 백엔드 임베딩 저장 형식: int8, float16, float32
+    rag_max_workers: int = 4
+    rag_search_mode: str = "vector"  # 프롬프트 컨텍스트 검색: vector, hybrid, lexical
+    rag_context_token_budget: int = 1000
+    rag_context_max_distance: float | None = 1.5  # 이보다 먼 검색 결과는 프롬프트에서 제외
+    rag_cache_size: int = 512
+    rag_cache_ttl_seconds: int = 300
+    rag_ingest_batch_size: int = 256
+    rag_ingest_max_concurrent_jobs: int = 1
+    rag_near_duplicate_threshold: float = 0.85  # VOC 유사 중복 병합 기준 (추정 Jaccard, 0이면 끔)
+
+    # Chat (LLM에 보내는 대화 이력)
+    chat_history_token_budget: int = 1500
+    chat_history_max_turn_tokens: int = 400  # 이보다 긴 턴은 잘라서 보냄
+    chat_history_summarize: bool = False  # 예산 밖의 이전 턴을 요약 한 건으로 포함
+    chat_delta_extraction: bool = False  # 후속 메시지에서는 바뀐 필드만 다시 추출
+
+    # Jira 웹훅 (즉시 응답 후 백그라운드 분석)
+    webhook_workers: int = 2
+    webhook_queue_size: int = 500  # 대기열이 차면 503으로 응답해 Jira가 재전송
+    webhook_dedupe_ttl_seconds: int = 3600  # 같은 이슈/이벤트를 다시 분석하지 않는 기간
+    webhook_max_attempts: int = 3  # LLM 과부하/장애 시 재시도 횟수
+    webhook_queue_path: str = ""  # 비우면 메모리 대기열, 경로를 주면 SQLite에 보관
+
     # Admin
     admin_password: str = ""
 
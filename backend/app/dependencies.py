@@ -1,11 +1,17 @@
+import asyncio
+
 from app.config import Settings
-from app.services.ai_service import AIService
+from app.services.ai_service import AIService, LLMUnavailable
 from app.services.chat_service import ChatService
+from app.services.ingest_jobs import IngestJobManager
 from app.services.jira_service import JiraService
+from app.services.knn_classifier import KnnClassifier
+from app.services.llm_scheduler import LLMScheduler, SchedulerOverloaded
 from app.services.rag_service import RagService
 from app.services.session_store import SessionStore
 from app.services.settings_service import SettingsService
 from app.services.template_service import TemplateService
+from app.services.webhook_queue import WebhookQueue
 
 _settings: Settings | None = None
 _template_service: TemplateService | None = None
@@ -15,6 +21,11 @@ _rag_service: RagService | None = None
 _session_store: SessionStore | None = None
 _chat_service: ChatService | None = None
 _settings_service: SettingsService | None = None
+_ingest_jobs: IngestJobManager | None = None
+_llm_scheduler: LLMScheduler | None = None
+_webhook_queue: WebhookQueue | None = None
+# 설정 변경으로 교체된 AI 엔드포인트 풀을 닫는 작업 (진행 중인 요청이 끝날 때까지 대기)
+_retiring_pools: set[asyncio.Task] = set()
 
 
 def _build_settings_from_effective(effective: dict) -> Settings:
@@ -24,10 +35,57 @@ def _build_settings_from_effective(effective: dict) -> Settings:
     return _settings.model_copy(update=overrides)
 
 
+def build_rag_service(settings: Settings) -> RagService:
+    return RagService(
+        max_workers=settings.rag_max_workers,
+        cache_size=settings.rag_cache_size,
+        cache_ttl_seconds=settings.rag_cache_ttl_seconds,
+        search_mode=settings.rag_search_mode,
+        context_token_budget=settings.rag_context_token_budget,
+        context_max_distance=settings.rag_context_max_distance,
+        vector_backend=settings.rag_vector_backend,
+        numpy_dtype=settings.rag_numpy_dtype,
+        near_duplicate_threshold=settings.rag_near_duplicate_threshold,
+    )
+
+
+def build_chat_service(settings: Settings) -> ChatService:
+    return ChatService(
+        ai_service=_ai_service,
+        template_service=_template_service,
+        jira_service=_jira_service,
+        session_store=_session_store,
+        rag_service=_rag_service,
+        keyword_fast_path=settings.ai_keyword_fast_path,
+        keyword_min_score=settings.ai_keyword_min_score,
+        keyword_margin=settings.ai_keyword_margin,
+        knn_classifier=KnnClassifier(
+            _rag_service,
+            k=settings.ai_knn_k,
+            min_neighbors=settings.ai_knn_min_neighbors,
+            min_agreement=settings.ai_knn_min_agreement,
+            max_distance=settings.ai_knn_max_distance,
+        ),
+        knn_mode=settings.ai_knn_mode,
+        history_token_budget=settings.chat_history_token_budget,
+        history_max_turn_tokens=settings.chat_history_max_turn_tokens,
+        history_summarize=settings.chat_history_summarize,
+        delta_extraction=settings.chat_delta_extraction,
+    )
+
+
+async def _analyze_new_issue(issue_key: str) -> None:
+    """웹훅으로 생성된 이슈를 AI로 분석해 댓글로 남김 (설정 변경 후에도 최신 서비스 사용)."""
+    jira = get_jira_service()
+    full_issue = await jira.get_issue(issue_key)
+    analysis = await get_ai_service().analyze_ticket(full_issue)
+    await jira.add_comment(issue_key, analysis)
+
+
 def init_services(settings: Settings):
     global _settings, _template_service, _ai_service
     global _jira_service, _rag_service, _session_store, _chat_service
-    global _settings_service
+    global _settings_service, _ingest_jobs, _llm_scheduler, _webhook_queue
 
     _settings = settings
     _settings_service = SettingsService(settings)
@@ -37,15 +95,32 @@ def init_services(settings: Settings):
     eff_settings = _build_settings_from_effective(effective)
 
     _template_service = TemplateService()
-    _rag_service = RagService()
-    _ai_service = AIService(eff_settings, _template_service, _rag_service)
+    _llm_scheduler = LLMScheduler(
+        max_concurrency=settings.ai_max_concurrency,
+        background_max_concurrency=settings.ai_background_max_concurrency,
+        interactive_queue_size=settings.ai_interactive_queue_size,
+        background_queue_size=settings.ai_background_queue_size,
+    )
+    _rag_service = build_rag_service(settings)
+    _ingest_jobs = IngestJobManager(
+        _rag_service,
+        batch_size=settings.rag_ingest_batch_size,
+        max_concurrent_jobs=settings.rag_ingest_max_concurrent_jobs,
+    )
+    _ai_service = AIService(
+        eff_settings, _template_service, _rag_service, _llm_scheduler
+    )
     _jira_service = JiraService(eff_settings)
     _session_store = SessionStore(ttl_hours=settings.session_ttl_hours)
-    _chat_service = ChatService(
-        ai_service=_ai_service,
-        template_service=_template_service,
-        jira_service=_jira_service,
-        session_store=_session_store,
+    _chat_service = build_chat_service(eff_settings)
+    _webhook_queue = WebhookQueue(
+        _analyze_new_issue,
+        workers=settings.webhook_workers,
+        max_size=settings.webhook_queue_size,
+        dedupe_ttl_seconds=settings.webhook_dedupe_ttl_seconds,
+        max_attempts=settings.webhook_max_attempts,
+        retry_on=(SchedulerOverloaded, LLMUnavailable),
+        path=settings.webhook_queue_path or None,
     )
 
 
@@ -58,15 +133,31 @@ async def reinit_services(effective: dict) -> None:
     # 기존 Jira 클라이언트 닫기
     if _jira_service:
         await _jira_service.close()
-
-    _ai_service = AIService(eff_settings, _template_service, _rag_service)
-    _jira_service = JiraService(eff_settings)
-    _chat_service = ChatService(
-        ai_service=_ai_service,
-        template_service=_template_service,
-        jira_service=_jira_service,
-        session_store=_session_store,
+    # 진행 중인 요청이 있을 수 있어 기존 클라이언트는 요청이 끝난 뒤 닫음
+    if _ai_service:
+        task = asyncio.create_task(_ai_service.endpoints.close_when_idle())
+        _retiring_pools.add(task)
+        task.add_done_callback(_retiring_pools.discard)
+
+    _ai_service = AIService(
+        eff_settings, _template_service, _rag_service, _llm_scheduler
     )
+    _jira_service = JiraService(eff_settings)
+    _chat_service = build_chat_service(eff_settings)
+
+
+async def shutdown_services() -> None:
+    for task in list(_retiring_pools):
+        task.cancel()
+    await asyncio.gather(*_retiring_pools, return_exceptions=True)
+    if _webhook_queue:
+        await _webhook_queue.close()
+    if _ai_service:
+        await _ai_service.endpoints.close()
+    if _ingest_jobs:
+        await _ingest_jobs.close()
+    if _rag_service:
+        _rag_service.close()
 
 
 def get_settings() -> Settings:
@@ -107,3 +198,13 @@ def get_chat_service() -> ChatService:
 def get_settings_service() -> SettingsService:
     assert _settings_service is not None
     return _settings_service
+
+
+def get_ingest_job_manager() -> IngestJobManager:
+    assert _ingest_jobs is not None
+    return _ingest_jobs
+
+
+def get_webhook_queue() -> WebhookQueue:
+    assert _webhook_queue is not None
+    return _webhook_queue
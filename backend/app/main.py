@@ -5,8 +5,13 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import Settings
-from app.dependencies import init_services, get_jira_service
-from app.routers import admin, chat, jira_tickets, jira_webhooks, rag, templates
+from app.dependencies import (
+    get_jira_service,
+    get_webhook_queue,
+    init_services,
+    shutdown_services,
+)
+from app.routers import admin, chat, jira_tickets, jira_webhooks, metrics, rag, templates
 
 settings = Settings()
 
@@ -20,8 +25,10 @@ logging.basicConfig(
 async def lifespan(app: FastAPI):
     # Startup
     init_services(settings)
+    await get_webhook_queue().start()
     yield
-    # Shutdown
+    # Shutdown (웹훅 워커를 먼저 멈춰 처리 중인 작업이 닫힌 Jira 클라이언트를 쓰지 않게 함)
+    await shutdown_services()
     jira = get_jira_service()
     await jira.close()
 
@@ -42,6 +49,7 @@ app.include_router(templates.router)
 app.include_router(jira_tickets.router)
 app.include_router(jira_webhooks.router)
 app.include_router(rag.router)
+app.include_router(metrics.router)
 
 
 @app.get("/health")
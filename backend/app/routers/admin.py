@@ -1,11 +1,24 @@
-from fastapi import APIRouter, Header, HTTPException
+import asyncio
+import os
+import shutil
+import tempfile
 
-from app.dependencies import get_settings, get_settings_service, reinit_services
+from fastapi import APIRouter, File, Header, HTTPException, UploadFile
+from fastapi.responses import FileResponse
+from starlette.background import BackgroundTask
+
+from app.dependencies import (
+    get_rag_service,
+    get_settings,
+    get_settings_service,
+    reinit_services,
+)
 from app.schemas.settings import (
     AdminSettingsResponse,
     AdminSettingsUpdate,
     VerifyPasswordRequest,
 )
+from app.services.llm_endpoints import parse_endpoints
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
@@ -41,6 +54,51 @@ async def update_admin_settings(
     updates = body.model_dump(exclude_none=True)
     if not updates:
         raise HTTPException(status_code=400, detail="No fields to update")
+    if "ai_endpoints" in updates:
+        try:
+            parse_endpoints(updates["ai_endpoints"])
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
     new_effective = svc.update(updates)
     await reinit_services(new_effective)
     return AdminSettingsResponse(**svc.get_masked())
+
+
+# ── RAG 스냅샷 ──
+
+@router.get("/rag/snapshot", summary="RAG 컬렉션 스냅샷 내보내기 (임베딩 포함)")
+async def export_rag_snapshot(x_admin_password: str = Header()):
+    _check_password(x_admin_password)
+    rag = get_rag_service()
+    fd, path = tempfile.mkstemp(prefix="rag-snapshot-", suffix=".npz")
+    os.close(fd)
+    try:
+        await rag.aexport_snapshot(path)
+    except Exception:
+        os.unlink(path)
+        raise
+    return FileResponse(
+        path,
+        media_type="application/octet-stream",
+        filename="rag_snapshot.npz",
+        background=BackgroundTask(os.unlink, path),
+    )
+
+
+@router.post("/rag/snapshot", summary="RAG 스냅샷 가져오기 (재임베딩 없음)")
+async def import_rag_snapshot(
+    file: UploadFile = File(...),
+    x_admin_password: str = Header(),
+):
+    _check_password(x_admin_password)
+    rag = get_rag_service()
+    fd, path = tempfile.mkstemp(prefix="rag-snapshot-", suffix=".npz")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            await asyncio.to_thread(shutil.copyfileobj, file.file, out)
+        result = await rag.aimport_snapshot(path)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        os.unlink(path)
+    return {"imported": result["imported"]}
@@ -1,7 +1,12 @@
+import json
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from app.dependencies import get_chat_service, get_session_store
 from app.schemas.chat import ChatRequest, ChatResponse, ConfirmRequest
+from app.services.chat_service import OVERLOADED_MESSAGE, OVERLOADED_RETRY_AFTER_SECONDS
+from app.services.llm_scheduler import SchedulerOverloaded
 
 router = APIRouter(prefix="/api/chat", tags=["chat"])
 
@@ -9,7 +14,33 @@ router = APIRouter(prefix="/api/chat", tags=["chat"])
 @router.post("", response_model=ChatResponse)
 async def send_message(request: ChatRequest):
     service = get_chat_service()
-    return await service.handle_message(request.session_id, request.message)
+    try:
+        return await service.handle_message(request.session_id, request.message)
+    except SchedulerOverloaded:
+        raise HTTPException(
+            status_code=503,
+            detail=OVERLOADED_MESSAGE,
+            headers={"Retry-After": str(OVERLOADED_RETRY_AFTER_SECONDS)},
+        )
+
+
+@router.post("/stream")
+async def stream_message(request: ChatRequest):
+    """SSE로 진행 단계(stage), 부분 필드(fields), 최종 응답(message)을 전송."""
+    service = get_chat_service()
+
+    async def event_source():
+        async for event, data in service.handle_message_stream(
+            request.session_id, request.message
+        ):
+            payload = json.dumps(data, ensure_ascii=False)
+            yield f"event: {event}\ndata: {payload}\n\n"
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/{session_id}/history")
@@ -1,37 +1,43 @@
 import logging
 
 from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
 
-from app.dependencies import get_ai_service, get_jira_service
+from app.dependencies import get_webhook_queue
+from app.services.webhook_queue import SUBMIT_FULL
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/webhooks", tags=["webhooks"])
 
+# 큐가 찼을 때 Jira에 재전송을 요청하는 간격 (초)
+RETRY_AFTER_SECONDS = 30
 
-@router.post("/jira")
+
+@router.post("/jira", status_code=202)
 async def handle_jira_webhook(request: Request):
+    """웹훅을 받으면 분석 작업을 대기열에 넣고 바로 응답 (분석은 워커가 처리)."""
     payload = await request.json()
     event = payload.get("webhookEvent", "")
 
     logger.info("Received Jira webhook event: %s", event)
 
-    if event == "jira:issue_created":
-        issue = payload.get("issue", {})
-        issue_key = issue.get("key")
-
-        if not issue_key:
-            return {"status": "ignored", "reason": "no issue key"}
-
-        jira = get_jira_service()
-        ai = get_ai_service()
-
-        try:
-            full_issue = await jira.get_issue(issue_key)
-            analysis = await ai.analyze_ticket(full_issue)
-            await jira.add_comment(issue_key, analysis)
-            logger.info("AI analysis posted as comment on %s", issue_key)
-        except Exception:
-            logger.exception("Failed to analyze ticket %s", issue_key)
-
-    return {"status": "ok"}
+    if event != "jira:issue_created":
+        return {"status": "ignored", "reason": "unsupported event"}
+
+    issue = payload.get("issue", {})
+    issue_key = issue.get("key")
+    if not issue_key:
+        return {"status": "ignored", "reason": "no issue key"}
+
+    # Jira는 재전송해도 같은 식별자 헤더를 보낸다 (없으면 이슈 키로만 중복 판단)
+    event_id = request.headers.get("X-Atlassian-Webhook-Identifier", "")
+    result = get_webhook_queue().submit(issue_key, event_id)
+    if result == SUBMIT_FULL:
+        logger.warning("Webhook queue full, rejected %s", issue_key)
+        return JSONResponse(
+            status_code=503,
+            content={"status": "rejected", "reason": "queue full"},
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+        )
+    return {"status": result, "issue_key": issue_key}
@@ -0,0 +1,35 @@
+from fastapi import APIRouter
+
+from app.dependencies import (
+    get_ai_service,
+    get_chat_service,
+    get_rag_service,
+    get_webhook_queue,
+)
+
+router = APIRouter(prefix="/api/metrics", tags=["metrics"])
+
+
+@router.get("")
+async def get_metrics():
+    """서비스 내부 캐시/실행기 지표."""
+    ai = get_ai_service()
+    rag = get_rag_service()
+    return {
+        "ai": {
+            "scheduler": ai.get_scheduler_stats(),
+            "endpoints": ai.get_endpoint_stats(),
+            "classification_cache": ai.get_classification_cache_stats(),
+            "resilience": ai.get_resilience_stats(),
+            "json_parsing": ai.get_json_parsing_stats(),
+        },
+        "chat": {
+            "classifier": get_chat_service().get_classifier_stats(),
+        },
+        "rag": {
+            "executor": rag.get_executor_stats(),
+            "cache": rag.get_cache_stats(),
+            "embedding_cache": rag.get_embedding_cache_stats(),
+        },
+        "webhooks": get_webhook_queue().stats(),
+    }
@@ -1,9 +1,12 @@
-from fastapi import APIRouter, UploadFile, File
+from dataclasses import asdict
 
-from app.dependencies import get_rag_service
+from fastapi import APIRouter, HTTPException, UploadFile, File
+
+from app.dependencies import get_ingest_job_manager, get_rag_service
 from app.schemas.rag import (
     BatchDocumentInput,
     DocumentInput,
+    IngestJobStatus,
     RagStats,
     SearchRequest,
     SearchResult,
@@ -20,6 +23,9 @@ async def get_stats():
     return RagStats(
         voc_count=rag.get_voc_count(),
         guide_count=rag.get_guide_count(),
+        executor=rag.get_executor_stats(),
+        cache=rag.get_cache_stats(),
+        embedding_cache=rag.get_embedding_cache_stats(),
     )
 
 
@@ -28,7 +34,7 @@ async def get_stats():
 @router.post("/vocs", summary="VOC 1건 추가")
 async def add_voc(doc: DocumentInput):
     rag = get_rag_service()
-    doc_id = rag.add_voc(doc.content, doc.metadata)
+    doc_id = await rag.aadd_voc(doc.content, doc.metadata)
     return {"id": doc_id}
 
 
@@ -37,25 +43,26 @@ async def add_vocs_batch(batch: BatchDocumentInput):
     rag = get_rag_service()
     contents = [d.content for d in batch.documents]
     metadatas = [d.metadata or {} for d in batch.documents]
-    ids = rag.add_vocs_batch(contents, metadatas)
-    return {"count": len(ids), "ids": ids}
+    report = await rag.aadd_vocs_batch(contents, metadatas)
+    return {"count": len(report.ids), **asdict(report)}
 
 
-@router.post("/vocs/upload", summary="VOC 텍스트 파일 업로드 (줄 단위 분리)")
+@router.post(
+    "/vocs/upload",
+    response_model=IngestJobStatus,
+    status_code=202,
+    summary="VOC 텍스트 파일 업로드 (줄 단위 분리, 백그라운드 적재)",
+)
 async def upload_vocs_file(file: UploadFile = File(...)):
-    rag = get_rag_service()
-    raw = await file.read()
-    text = raw.decode("utf-8")
-    lines = [line.strip() for line in text.split("\n") if line.strip()]
-    metadatas = [{"source": file.filename}] * len(lines)
-    ids = rag.add_vocs_batch(lines, metadatas)
-    return {"count": len(ids), "filename": file.filename}
+    jobs = get_ingest_job_manager()
+    job = await jobs.submit("vocs", file)
+    return job.to_dict()
 
 
 @router.post("/vocs/search", response_model=list[SearchResult])
 async def search_vocs(req: SearchRequest):
     rag = get_rag_service()
-    results = rag.search_vocs(req.query, top_k=req.top_k)
+    results = await rag.asearch_vocs(req.query, top_k=req.top_k, mode=req.mode)
     return results
 
 
@@ -64,7 +71,7 @@ async def search_vocs(req: SearchRequest):
 @router.post("/guides", summary="가이드 1건 추가")
 async def add_guide(doc: DocumentInput):
     rag = get_rag_service()
-    doc_id = rag.add_guide(doc.content, doc.metadata)
+    doc_id = await rag.aadd_guide(doc.content, doc.metadata)
     return {"id": doc_id}
 
 
@@ -73,24 +80,41 @@ async def add_guides_batch(batch: BatchDocumentInput):
     rag = get_rag_service()
     contents = [d.content for d in batch.documents]
     metadatas = [d.metadata or {} for d in batch.documents]
-    ids = rag.add_guides_batch(contents, metadatas)
-    return {"count": len(ids), "ids": ids}
+    report = await rag.aadd_guides_batch(contents, metadatas)
+    return {"count": len(report.ids), **asdict(report)}
 
 
-@router.post("/guides/upload", summary="가이드 텍스트 파일 업로드 (빈 줄 기준 단락 분리)")
+@router.post(
+    "/guides/upload",
+    response_model=IngestJobStatus,
+    status_code=202,
+    summary="가이드 텍스트 파일 업로드 (빈 줄 기준 단락 분리, 백그라운드 적재)",
+)
 async def upload_guides_file(file: UploadFile = File(...)):
-    rag = get_rag_service()
-    raw = await file.read()
-    text = raw.decode("utf-8")
-    # 빈 줄 기준으로 단락 분리
-    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
-    metadatas = [{"source": file.filename, "title": file.filename}] * len(paragraphs)
-    ids = rag.add_guides_batch(paragraphs, metadatas)
-    return {"count": len(ids), "filename": file.filename}
+    jobs = get_ingest_job_manager()
+    job = await jobs.submit("guides", file)
+    return job.to_dict()
 
 
 @router.post("/guides/search", response_model=list[SearchResult])
 async def search_guides(req: SearchRequest):
     rag = get_rag_service()
-    results = rag.search_guides(req.query, top_k=req.top_k)
+    results = await rag.asearch_guides(req.query, top_k=req.top_k, mode=req.mode)
     return results
+
+
+# ── 업로드 작업 상태 ──
+
+@router.get("/jobs", response_model=list[IngestJobStatus])
+async def list_ingest_jobs():
+    jobs = get_ingest_job_manager()
+    return [job.to_dict() for job in jobs.list_jobs()]
+
+
+@router.get("/jobs/{job_id}", response_model=IngestJobStatus)
+async def get_ingest_job(job_id: str):
+    jobs = get_ingest_job_manager()
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
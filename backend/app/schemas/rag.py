@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
 
@@ -13,6 +15,8 @@ class BatchDocumentInput(BaseModel):
 class SearchRequest(BaseModel):
     query: str
     top_k: int = 5
+    # vector: 임베딩 검색, hybrid: 임베딩 + BM25 융합, lexical: BM25만 (가장 빠름)
+    mode: Literal["vector", "hybrid", "lexical"] = "vector"
 
 
 class SearchResult(BaseModel):
@@ -20,8 +24,55 @@ class SearchResult(BaseModel):
     content: str
     metadata: dict
     distance: float | None = None
+    score: float | None = None  # hybrid/lexical 모드의 순위 점수
+
+
+class IngestJobStatus(BaseModel):
+    job_id: str
+    kind: str  # vocs, guides
+    filename: str
+    status: str  # pending, running, completed, failed
+    progress: float  # 0.0 ~ 1.0 (읽은 바이트 기준)
+    total_bytes: int
+    bytes_read: int
+    documents: int
+    batches: int
+    new: int
+    duplicate: int
+    updated: int
+    merged: int = 0  # 유사 VOC에 합쳐진 문서 수
+    error: str | None = None
+    created_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
+
+
+class RagExecutorStats(BaseModel):
+    max_workers: int
+    queue_depth: int
+    active: int
+    completed: int
+    failed: int
+    wait: dict  # 큐 대기 시간 (ms)
+    run: dict  # 실행 시간 (ms)
+
+
+class RagCacheStats(BaseModel):
+    size: int
+    max_size: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    hit_rate: float
+    generations: dict[str, int]
+    query_embeddings: dict | None = None
 
 
 class RagStats(BaseModel):
     voc_count: int
     guide_count: int
+    executor: RagExecutorStats | None = None
+    cache: RagCacheStats | None = None
+    embedding_cache: dict | None = None
@@ -5,6 +5,7 @@ class AdminSettingsResponse(BaseModel):
     ai_base_url: str = ""
     ai_api_key: str = ""  # 마스킹된 값
     ai_model_name: str = ""
+    ai_endpoints: str = ""  # "url[=가중치],..." 비어 있으면 ai_base_url만 사용
     jira_base_url: str = ""
     jira_user_email: str = ""
     jira_api_token: str = ""  # 마스킹된 값
@@ -15,6 +16,7 @@ class AdminSettingsUpdate(BaseModel):
     ai_base_url: str | None = None
     ai_api_key: str | None = None
     ai_model_name: str | None = None
+    ai_endpoints: str | None = None
     jira_base_url: str | None = None
     jira_user_email: str | None = None
     jira_api_token: str | None = None
@@ -1,18 +1,78 @@
+import asyncio
+import copy
 import json
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
 
-from openai import AsyncOpenAI
+from openai import APIError, AsyncOpenAI
 
 from app.config import Settings
 from app.prompts.voc_classifier import SYSTEM_PROMPT as CLASSIFIER_PROMPT
+from app.prompts.voc_classify_extract import SYSTEM_PROMPT as CLASSIFY_EXTRACT_PROMPT
 from app.prompts.field_extractor import SYSTEM_PROMPT as EXTRACTOR_PROMPT
+from app.prompts.field_updater import SYSTEM_PROMPT as UPDATER_PROMPT
 from app.prompts.ticket_analyzer import SYSTEM_PROMPT as ANALYZER_PROMPT
 from app.schemas.template import JiraTemplate
+from app.services.cache import TTLCache
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.json_utils import extract_object
+from app.services.llm_endpoints import EndpointPool, parse_endpoints
+from app.services.llm_scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    LLMScheduler,
+)
+from app.services.metrics import Counters
 from app.services.rag_service import RagService
+from app.services.template_schema import fields_json_schema, validate_fields
 from app.services.template_service import TemplateService
+from app.services.text_utils import normalize_text
 
 logger = logging.getLogger(__name__)
 
+# 첫 메시지 처리 방식: 분류 후 추출(LLM 2회) / 분류+추출 한 번에(LLM 1회)
+CLASSIFY_MODE_TWO_STEP = "two_step"
+CLASSIFY_MODE_COMBINED = "combined"
+
+RAG_CONTEXT_HEADER = "[참고할 수 있는 과거 데이터]"
+
+# 호출 단계 (단계별 타임아웃 구분)
+STAGE_CLASSIFY = "classify"
+STAGE_EXTRACT = "extract"
+STAGE_ANALYZE = "analyze"
+
+# 응답 형식 강제: off, json_object(JSON 모드), json_schema(필드 추출은 템플릿 스키마로 제한)
+RESPONSE_FORMAT_OFF = "off"
+RESPONSE_FORMAT_JSON_OBJECT = "json_object"
+RESPONSE_FORMAT_JSON_SCHEMA = "json_schema"
+
+UNAVAILABLE_QUESTION = "AI 응답이 지연되고 있습니다. 잠시 후 다시 말씀해 주시겠어요?"
+
+
+class LLMUnavailable(Exception):
+    """LLM 호출이 타임아웃/오류로 실패했거나 차단기가 열려 호출하지 않음."""
+
+    def __init__(self, reason: str):
+        super().__init__(f"LLM unavailable ({reason})")
+        self.reason = reason
+
+
+@dataclass(frozen=True)
+class CompiledPrompts:
+    """템플릿 세트 버전별로 한 번만 렌더링하는 시스템 프롬프트.
+
+    요청마다 달라지는 RAG 컨텍스트는 여기에 넣지 않고 마지막 사용자 메시지에
+    붙이므로, 시스템 프롬프트가 바이트 단위로 같아 vLLM 등 서버의
+    prefix(KV) 캐시를 재사용할 수 있다.
+    """
+
+    version: str
+    classifier: str
+    combined: str
+    extractors: dict[str, str]
+    updaters: dict[str, str]
+
 
 class AIService:
     def __init__(
@@ -20,71 +80,260 @@ class AIService:
         settings: Settings,
         template_service: TemplateService,
         rag_service: RagService,
+        scheduler: LLMScheduler | None = None,
     ):
-        self.client = AsyncOpenAI(
-            base_url=settings.ai_base_url,
+        # AI_ENDPOINTS가 비어 있으면 AI_BASE_URL 하나만 사용
+        self.endpoints = EndpointPool(
+            parse_endpoints(settings.ai_endpoints) or [(settings.ai_base_url, 1)],
             api_key=settings.ai_api_key,
+            max_failures=settings.ai_endpoint_max_failures,
+            eject_seconds=settings.ai_endpoint_eject_seconds,
+            health_interval=settings.ai_endpoint_health_interval_seconds,
         )
         self.model = settings.ai_model_name
+        self.classify_mode = settings.ai_classify_mode
+        self.combined_min_confidence = settings.ai_combined_min_confidence
         self.template_service = template_service
         self.rag = rag_service
+        # 설정 변경으로 AIService가 다시 만들어져도 동시 실행 제한이 유지되도록
+        # 스케줄러는 바깥(dependencies)에서 한 번 만들어 넘겨받는다
+        self.scheduler = scheduler or LLMScheduler()
+        # 분류 결과 캐시. 설정이 바뀌면 AIService가 새로 만들어지므로 함께 비워지고,
+        # 키에 모델명과 템플릿 버전이 들어가 템플릿 변경 시에도 이전 결과를 쓰지 않는다
+        self._classification_cache = TTLCache(
+            max_size=settings.ai_classification_cache_size,
+            ttl_seconds=settings.ai_classification_cache_ttl_seconds,
+        )
+        self._compiled: CompiledPrompts | None = None
+        # 응답 지연/장애 대응: 헤징, 단계별 타임아웃, 회로 차단기
+        self.hedge_delay = settings.ai_hedge_delay_seconds
+        self._timeouts = {
+            STAGE_CLASSIFY: settings.ai_classify_timeout_seconds,
+            STAGE_EXTRACT: settings.ai_extract_timeout_seconds,
+            STAGE_ANALYZE: settings.ai_analyze_timeout_seconds,
+        }
+        self.breaker = CircuitBreaker(
+            failure_rate=settings.ai_breaker_failure_rate,
+            window=settings.ai_breaker_window,
+            min_calls=settings.ai_breaker_min_calls,
+            open_seconds=settings.ai_breaker_open_seconds,
+        )
+        self._resilience = Counters(
+            "timeouts", "errors", "short_circuited", "hedged", "hedge_wins"
+        )
+        self.response_format = settings.ai_response_format
+        # parsed: 그대로 파싱, repaired: 보정 후 파싱, failed: 파싱 실패(대체 응답)
+        self._json_parsing = Counters("parsed", "repaired", "failed", "field_fixes")
 
     async def classify_voc(
         self,
         voc_text: str,
         conversation_history: list[dict] | None = None,
+        on_delta: Callable[[str], None] | None = None,
     ) -> dict:
-        templates_summary = self.template_service.get_templates_summary_text()
-        system_prompt = CLASSIFIER_PROMPT.format(
-            templates_summary=templates_summary
+        cache_key = self._classification_cache_key(
+            "classify", voc_text, conversation_history
         )
+        cached = self._classification_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
 
         # RAG: 유사 과거 VOC 사례를 컨텍스트로 추가
-        rag_context = self.rag.format_context_for_prompt(voc_text, top_k=3)
-        if rag_context:
-            system_prompt += f"\n\n참고할 수 있는 과거 데이터:\n{rag_context}"
+        rag_context = await self.rag.aformat_context_for_prompt(voc_text, top_k=3)
+        messages = self.build_messages(
+            self.compiled_prompts().classifier,
+            voc_text,
+            conversation_history,
+            rag_context,
+        )
 
-        messages = [{"role": "system", "content": system_prompt}]
-        if conversation_history:
-            messages.extend(conversation_history)
-        messages.append({"role": "user", "content": voc_text})
+        try:
+            content = await self._complete(
+                messages,
+                0.1,
+                on_delta,
+                stage=STAGE_CLASSIFY,
+                response_format=self._response_format(),
+            )
+        except LLMUnavailable:
+            return self._unavailable_response()
+        result = self._loads_json(content)
+        if result is None:
+            return self._parse_failure_response()
+        self._classification_cache.set(cache_key, copy.deepcopy(result))
+        return result
 
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=0.1,
+    async def classify_and_extract(
+        self,
+        voc_text: str,
+        conversation_history: list[dict] | None = None,
+        on_delta: Callable[[str], None] | None = None,
+    ) -> dict | None:
+        """한 번의 LLM 호출로 템플릿 분류와 필드 추출을 함께 수행.
+
+        clarify 응답은 그대로 돌려주고, 파싱 실패/낮은 확신도/알 수 없는 템플릿/
+        필드 누락이면 None을 반환해 호출 측이 2단계 방식으로 재시도하게 한다.
+        LLM 장애 시에는 재시도해도 같으므로 바로 clarify 응답을 돌려준다.
+        """
+        cache_key = self._classification_cache_key(
+            "combined", voc_text, conversation_history
+        )
+        cached = self._classification_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        rag_context = await self.rag.aformat_context_for_prompt(voc_text, top_k=3)
+        messages = self.build_messages(
+            self.compiled_prompts().combined,
+            voc_text,
+            conversation_history,
+            rag_context,
         )
 
-        content = response.choices[0].message.content
-        return self._parse_json_response(content)
+        try:
+            content = await self._complete(
+                messages,
+                0.1,
+                on_delta,
+                stage=STAGE_EXTRACT,
+                response_format=self._response_format(),
+            )
+        except LLMUnavailable:
+            return self._unavailable_response()
+        result = self._loads_json(content)
+        if result is None:
+            logger.info("Combined classify/extract unparsable, falling back")
+            return None
+        if result.get("action") == "clarify":
+            self._classification_cache.set(cache_key, copy.deepcopy(result))
+            return result
+
+        try:
+            confidence = float(result.get("confidence", 0.0))
+        except (TypeError, ValueError):
+            confidence = 0.0
+        template = self.template_service.get_template(result.get("template_id", ""))
+        if (
+            result.get("action") != "match"
+            or confidence < self.combined_min_confidence
+            or template is None
+            or not isinstance(result.get("fields"), dict)
+        ):
+            logger.info(
+                "Combined classify/extract not usable (confidence=%.2f), falling back",
+                confidence,
+            )
+            return None
+        result["fields"] = self._validate_fields(template, result["fields"])
+        self._classification_cache.set(cache_key, copy.deepcopy(result))
+        return result
+
+    def get_scheduler_stats(self) -> dict:
+        return self.scheduler.stats()
+
+    def get_endpoint_stats(self) -> dict:
+        return self.endpoints.stats()
+
+    def get_json_parsing_stats(self) -> dict:
+        counts = self._json_parsing.snapshot()
+        total = counts["parsed"] + counts["repaired"] + counts["failed"]
+        return {
+            "response_format": self.response_format,
+            **counts,
+            "repair_rate": round(counts["repaired"] / total, 4) if total else 0.0,
+            "fallback_rate": round(counts["failed"] / total, 4) if total else 0.0,
+        }
+
+    def get_resilience_stats(self) -> dict:
+        return {
+            "breaker": self.breaker.stats(),
+            "hedge_delay_seconds": self.hedge_delay,
+            "timeouts_seconds": dict(self._timeouts),
+            **self._resilience.snapshot(),
+        }
+
+    def get_classification_cache_stats(self) -> dict:
+        return {
+            **self._classification_cache.stats(),
+            "template_version": self.template_service.version,
+            "model": self.model,
+        }
+
+    def _classification_cache_key(
+        self, kind: str, voc_text: str, conversation_history: list[dict] | None
+    ) -> tuple:
+        # 공백/구두점/대소문자만 다른 메시지는 같은 키가 된다
+        history = tuple(
+            (m.get("role", ""), normalize_text(m.get("content", "")))
+            for m in conversation_history or []
+        )
+        return (
+            kind,
+            self.model,
+            self.template_service.version,
+            normalize_text(voc_text),
+            history,
+        )
 
     async def extract_fields(
         self,
         voc_text: str,
         template: JiraTemplate,
         conversation_history: list[dict] | None = None,
+        on_delta: Callable[[str], None] | None = None,
     ) -> dict:
-        fields_definition = self.template_service.get_fields_definition_text(
-            template
-        )
-        system_prompt = EXTRACTOR_PROMPT.format(
-            template_name=template.name,
-            fields_definition=fields_definition,
+        """템플릿 정의에 맞게 정리된 필드를 반환. 응답을 해석하지 못하면
+        기본값만 채운 필드를 돌려준다. LLM 장애 시 LLMUnavailable이 그대로 올라간다.
+        """
+        system_prompt = self.compiled_prompts().extractors.get(template.id)
+        if system_prompt is None:
+            # 템플릿 세트에 없는 템플릿 객체가 넘어온 경우에만 즉석 렌더링
+            system_prompt = self._render_extractor_prompt(template)
+        messages = self.build_messages(system_prompt, voc_text, conversation_history)
+
+        content = await self._complete(
+            messages,
+            0.2,
+            on_delta,
+            stage=STAGE_EXTRACT,
+            response_format=self._response_format(template),
         )
+        parsed = self._loads_json(content)
+        return self._validate_fields(template, parsed or {})
 
-        messages = [{"role": "system", "content": system_prompt}]
-        if conversation_history:
-            messages.extend(conversation_history)
-        messages.append({"role": "user", "content": voc_text})
+    async def extract_field_updates(
+        self,
+        voc_text: str,
+        template: JiraTemplate,
+        current_fields: dict,
+        conversation_history: list[dict] | None = None,
+        on_delta: Callable[[str], None] | None = None,
+    ) -> dict:
+        """후속 메시지로 바뀌는 필드만 추출. 현재 값에 덮어쓸 변경분 dict를 반환.
 
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=0.2,
+        바뀌지 않은 필드(긴 description 등)를 다시 생성하지 않아 출력 토큰이 줄어든다.
+        현재 필드 값은 요청마다 달라지므로 시스템 프롬프트가 아닌 마지막
+        사용자 메시지에 넣는다. LLM 장애 시 LLMUnavailable이 그대로 올라간다.
+        """
+        system_prompt = self.compiled_prompts().updaters.get(template.id)
+        if system_prompt is None:
+            system_prompt = self._render_extractor_prompt(template, UPDATER_PROMPT)
+        current = json.dumps(current_fields, ensure_ascii=False, indent=2)
+        messages = self.build_messages(
+            system_prompt,
+            f"[현재 필드 값]\n{current}\n\n[추가 메시지]\n{voc_text}",
+            conversation_history,
         )
 
-        content = response.choices[0].message.content
-        return self._parse_json_response(content)
+        content = await self._complete(
+            messages,
+            0.2,
+            on_delta,
+            stage=STAGE_EXTRACT,
+            response_format=self._response_format(template, partial=True),
+        )
+        parsed = self._loads_json(content)
+        return self._validate_fields(template, parsed or {}, fill_defaults=False)
 
     async def analyze_ticket(self, ticket_data: dict) -> str:
         fields = ticket_data.get("fields", {})
@@ -100,7 +349,9 @@ class AIService:
 
         # RAG: 유사 VOC + 관련 가이드를 참고 자료로 검색
         search_query = f"{summary} {description[:200]}"
-        rag_context = self.rag.format_context_for_prompt(search_query, top_k=3)
+        rag_context = await self.rag.aformat_context_for_prompt(
+            search_query, top_k=3
+        )
         additional = ""
         if rag_context:
             additional = f"\n\n참고 자료:\n{rag_context}"
@@ -119,33 +370,255 @@ class AIService:
             {"role": "user", "content": "이 티켓을 분석하고 가이드를 제공해주세요."},
         ]
 
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=0.3,
+        return await self._complete(
+            messages, 0.3, priority=PRIORITY_BACKGROUND, stage=STAGE_ANALYZE
         )
 
-        return response.choices[0].message.content
+    # ── 프롬프트 구성 ──
+
+    def compiled_prompts(self) -> CompiledPrompts:
+        version = self.template_service.version
+        if self._compiled is None or self._compiled.version != version:
+            ts = self.template_service
+            self._compiled = CompiledPrompts(
+                version=version,
+                classifier=CLASSIFIER_PROMPT.format(
+                    templates_summary=ts.get_templates_summary_text()
+                ),
+                combined=CLASSIFY_EXTRACT_PROMPT.format(
+                    templates_summary=ts.get_templates_summary_text(),
+                    fields_definitions=ts.get_all_fields_definition_text(),
+                ),
+                extractors={
+                    t.id: self._render_extractor_prompt(t)
+                    for t in ts.get_all_templates()
+                },
+                updaters={
+                    t.id: self._render_extractor_prompt(t, UPDATER_PROMPT)
+                    for t in ts.get_all_templates()
+                },
+            )
+        return self._compiled
+
+    def _render_extractor_prompt(
+        self, template: JiraTemplate, prompt: str = EXTRACTOR_PROMPT
+    ) -> str:
+        return prompt.format(
+            template_name=template.name,
+            fields_definition=self.template_service.get_fields_definition_text(
+                template
+            ),
+        )
+
+    @staticmethod
+    def build_messages(
+        system_prompt: str,
+        voc_text: str,
+        conversation_history: list[dict] | None = None,
+        rag_context: str = "",
+    ) -> list[dict]:
+        """고정 시스템 프롬프트 → 대화 이력 → (VOC + RAG 컨텍스트) 순서로 구성.
+
+        요청마다 바뀌는 부분을 뒤로 몰아 앞쪽 접두사가 요청 간에 공유되게 한다.
+        """
+        messages = [{"role": "system", "content": system_prompt}]
+        if conversation_history:
+            messages.extend(conversation_history)
+        content = voc_text
+        if rag_context:
+            content += f"\n\n{RAG_CONTEXT_HEADER}\n{rag_context}"
+        messages.append({"role": "user", "content": content})
+        return messages
+
+    async def _complete(
+        self,
+        messages: list[dict],
+        temperature: float,
+        on_delta: Callable[[str], None] | None = None,
+        priority: str = PRIORITY_INTERACTIVE,
+        stage: str = STAGE_CLASSIFY,
+        response_format: dict | None = None,
+    ) -> str:
+        """채팅 완성 호출. on_delta가 있으면 stream=True로 받아
+        토큰이 도착할 때마다 지금까지 누적된 텍스트를 전달한다.
 
-    def _parse_json_response(self, content: str) -> dict:
-        content = content.strip()
-        # Strip markdown code fences if present
-        if content.startswith("```"):
-            lines = content.split("\n")
-            lines = lines[1:]  # remove opening fence
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            content = "\n".join(lines)
+        스케줄러 슬롯을 얻은 뒤에 호출하며, 대기열이 가득 차면
+        SchedulerOverloaded가 그대로 올라간다. 타임아웃/API 오류이거나
+        차단기가 열려 있으면 LLMUnavailable을 던진다.
+        스트리밍이 아닌 호출은 hedge_delay가 지나도록 응답이 없으면
+        같은 요청을 한 번 더 보내 먼저 온 응답을 쓴다.
+        """
+        if not self.breaker.allow():
+            self._resilience.incr("short_circuited")
+            raise LLMUnavailable("circuit_open")
+        timeout = self._timeouts.get(stage) or None
+        params: dict = {"temperature": temperature}
+        if response_format:
+            params["response_format"] = response_format
+        try:
+            if on_delta is None and self.hedge_delay > 0:
+                content = await self._hedged_request(
+                    messages, params, priority, timeout
+                )
+            else:
+                content = await self._request(
+                    messages, params, on_delta, priority, timeout
+                )
+        except asyncio.TimeoutError as e:
+            self._resilience.incr("timeouts")
+            self.breaker.record_failure()
+            logger.warning("LLM %s call timed out after %ss", stage, timeout)
+            raise LLMUnavailable("timeout") from e
+        except APIError as e:
+            self._resilience.incr("errors")
+            self.breaker.record_failure()
+            logger.warning("LLM %s call failed: %s", stage, e)
+            raise LLMUnavailable("error") from e
+        except BaseException:
+            # 과부하 거절/취소 등은 백엔드 상태와 무관하므로 집계하지 않는다
+            self.breaker.release_probe()
+            raise
+        self.breaker.record_success()
+        return content
 
+    async def _hedged_request(
+        self,
+        messages: list[dict],
+        params: dict,
+        priority: str,
+        timeout: float | None,
+    ) -> str:
+        """hedge_delay 안에 끝나지 않으면 두 번째 요청을 보내고 먼저 성공한
+        응답을 쓴다. 남은 요청은 취소한다. 스케줄러에 빈 자리가 없으면
+        헤징하지 않는다 (과부하 상황에서 부하를 더 늘리지 않도록).
+        """
+        primary = asyncio.create_task(
+            self._request(messages, params, None, priority, timeout)
+        )
+        tasks = [primary]
         try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            logger.warning("Failed to parse AI JSON response: %s", content)
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay)
+            if done or not self.scheduler.has_capacity(priority):
+                return await primary
+
+            self._resilience.incr("hedged")
+            hedge = asyncio.create_task(
+                self._request(messages, params, None, priority, timeout)
+            )
+            tasks.append(hedge)
+            pending = set(tasks)
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._resilience.incr("hedge_wins")
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _request(
+        self,
+        messages: list[dict],
+        params: dict,
+        on_delta: Callable[[str], None] | None,
+        priority: str,
+        timeout: float | None,
+    ) -> str:
+        # 타임아웃은 슬롯을 얻은 뒤 실제 요청에만 적용 (대기열 대기는 제외)
+        async with self.scheduler.slot(priority), self.endpoints.acquire() as endpoint:
+            return await asyncio.wait_for(
+                self._create_completion(
+                    endpoint.client, messages, params, on_delta
+                ),
+                timeout,
+            )
+
+    async def _create_completion(
+        self,
+        client: AsyncOpenAI,
+        messages: list[dict],
+        params: dict,
+        on_delta: Callable[[str], None] | None,
+    ) -> str:
+        if on_delta is None:
+            response = await client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                **params,
+            )
+            return response.choices[0].message.content
+
+        stream = await client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            stream=True,
+            **params,
+        )
+        parts: list[str] = []
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+                on_delta("".join(parts))
+        return "".join(parts)
+
+    @staticmethod
+    def _unavailable_response() -> dict:
+        return {"action": "clarify", "question": UNAVAILABLE_QUESTION, "candidates": []}
+
+    def _response_format(
+        self, template: JiraTemplate | None = None, partial: bool = False
+    ) -> dict | None:
+        if self.response_format == RESPONSE_FORMAT_OFF:
+            return None
+        if self.response_format == RESPONSE_FORMAT_JSON_SCHEMA and template is not None:
             return {
-                "action": "clarify",
-                "question": "죄송합니다, 다시 한번 말씀해 주시겠어요? 좀 더 구체적으로 설명해 주시면 도움이 됩니다.",
-                "candidates": [],
+                "type": "json_schema",
+                "json_schema": {
+                    "name": f"{template.id}_fields",
+                    "schema": fields_json_schema(template, partial=partial),
+                },
             }
+        return {"type": "json_object"}
+
+    def _validate_fields(
+        self, template: JiraTemplate, fields: dict, fill_defaults: bool = True
+    ) -> dict:
+        cleaned, fixes = validate_fields(template, fields, fill_defaults)
+        if fixes:
+            self._json_parsing.incr("field_fixes", fixes)
+        return cleaned
+
+    @staticmethod
+    def _parse_failure_response() -> dict:
+        return {
+            "action": "clarify",
+            "question": "죄송합니다, 다시 한번 말씀해 주시겠어요? 좀 더 구체적으로 설명해 주시면 도움이 됩니다.",
+            "candidates": [],
+        }
+
+    def _loads_json(self, content: str | None) -> dict | None:
+        """응답에서 JSON 객체를 찾아 파싱 (설명문/코드 펜스/끝 쉼표/잘림 보정)."""
+        parsed, repaired = extract_object(content)
+        if parsed is None:
+            self._json_parsing.incr("failed")
+            logger.warning("Failed to parse AI JSON response: %s", content)
+        elif repaired:
+            self._json_parsing.incr("repaired")
+            logger.info("Repaired malformed AI JSON response")
+        else:
+            self._json_parsing.incr("parsed")
+        return parsed
 
     def _extract_text_from_adf(self, adf: dict) -> str:
         texts = []
@@ -1,13 +1,38 @@
+import asyncio
 import logging
+from collections.abc import AsyncIterator, Callable
 
 from app.schemas.chat import ChatResponse
-from app.services.ai_service import AIService
+from app.services.ai_service import (
+    CLASSIFY_MODE_COMBINED,
+    UNAVAILABLE_QUESTION,
+    AIService,
+    LLMUnavailable,
+)
 from app.services.jira_service import JiraService
+from app.services.knn_classifier import LABEL_KEY, KnnClassifier
+from app.services.json_utils import parse_partial_object
+from app.services.llm_scheduler import SchedulerOverloaded
+from app.services.metrics import Counters
+from app.services.rag_service import RagService
 from app.services.session_store import SessionStore
 from app.services.template_service import TemplateService
 
 logger = logging.getLogger(__name__)
 
+# on_event(event, data) 콜백 타입. 스트리밍 응답(SSE)에서 진행 상황 전달에 사용
+EventCallback = Callable[[str, dict], None]
+
+# LLM 분류 전에 시도하는 사전 분류(키워드, kNN)의 동작 모드
+SHORTCUT_OFF = "off"
+SHORTCUT_SHADOW = "shadow"  # LLM 분류는 그대로 하고 일치 여부만 집계
+SHORTCUT_ON = "on"  # 적중하면 LLM 분류를 생략
+
+# 사용자에게 보여 주는 오류 메시지 (내부 오류 내용은 로그에만 남김)
+OVERLOADED_MESSAGE = "요청이 많아 잠시 후 다시 시도해 주세요."
+OVERLOADED_RETRY_AFTER_SECONDS = 5
+FAILED_MESSAGE = "요청을 처리하는 중 오류가 발생했습니다. 잠시 후 다시 시도해 주세요."
+
 
 class ChatService:
     def __init__(
@@ -16,14 +41,85 @@ class ChatService:
         template_service: TemplateService,
         jira_service: JiraService,
         session_store: SessionStore,
+        rag_service: RagService | None = None,
+        keyword_fast_path: str = SHORTCUT_OFF,
+        keyword_min_score: float = 1.0,
+        keyword_margin: float = 1.0,
+        knn_classifier: KnnClassifier | None = None,
+        knn_mode: str = SHORTCUT_OFF,
+        history_token_budget: int = 1500,
+        history_max_turn_tokens: int = 400,
+        history_summarize: bool = False,
+        delta_extraction: bool = False,
     ):
         self.ai = ai_service
         self.templates = template_service
         self.jira = jira_service
         self.sessions = session_store
+        self.rag = rag_service
+        self.keyword_fast_path = keyword_fast_path
+        self.keyword_min_score = keyword_min_score
+        self.keyword_margin = keyword_margin
+        self.history_token_budget = history_token_budget
+        self.history_max_turn_tokens = history_max_turn_tokens
+        self.history_summarize = history_summarize
+        # 후속 메시지에서 바뀐 필드만 다시 추출해 기존 값에 합칠지
+        self.delta_extraction = delta_extraction
+        self.knn = knn_classifier
+        self.knn_mode = knn_mode if knn_classifier is not None else SHORTCUT_OFF
+        # 응답을 기다리게 하지 않는 후처리 작업 (확정 VOC 저장)
+        self._background: set[asyncio.Task] = set()
+        self._classifier_stats = Counters(
+            *(
+                f"{source}_{name}"
+                for source in ("keyword", "knn")
+                for name in ("evaluated", "fired", "llm_skipped", "agreed", "disagreed")
+            )
+        )
 
-    async def handle_message(
+    async def handle_message_stream(
         self, session_id: str, user_message: str
+    ) -> AsyncIterator[tuple[str, dict]]:
+        """handle_message의 스트리밍 버전. (event, data)를 차례로 내보낸다.
+
+        - stage: {"stage": "classifying" | "extracting", ...}
+        - fields: 토큰이 도착하는 대로 파싱한 미리보기 필드
+        - message: 최종 ChatResponse (handle_message 반환값과 동일)
+        - error: 처리 실패 ({"detail"}, 과부하면 "retry_after" 포함)
+        """
+        events: asyncio.Queue = asyncio.Queue()
+        # 클라이언트 연결이 끊겨도 처리는 끝까지 진행해 세션 기록을 남긴다
+        task = asyncio.create_task(
+            self.handle_message(
+                session_id,
+                user_message,
+                on_event=lambda event, data: events.put_nowait((event, data)),
+            )
+        )
+        task.add_done_callback(lambda _: events.put_nowait(None))
+
+        while (item := await events.get()) is not None:
+            yield item
+        try:
+            response = task.result()
+        except SchedulerOverloaded:
+            logger.warning("LLM busy, rejected streaming chat for session %s", session_id)
+            yield "error", {
+                "detail": OVERLOADED_MESSAGE,
+                "retry_after": OVERLOADED_RETRY_AFTER_SECONDS,
+            }
+            return
+        except Exception:
+            logger.exception("Streaming chat failed for session %s", session_id)
+            yield "error", {"detail": FAILED_MESSAGE}
+            return
+        yield "message", response.model_dump()
+
+    async def handle_message(
+        self,
+        session_id: str,
+        user_message: str,
+        on_event: EventCallback | None = None,
     ) -> ChatResponse:
         session = self.sessions.get_or_create(session_id)
         session.add_message("user", user_message)
@@ -31,14 +127,38 @@ class ChatService:
         # If we already matched a template and are awaiting more info
         if session.pending_template_id:
             return await self._continue_field_extraction(
-                session, user_message
+                session, user_message, on_event
             )
 
-        # Classify VOC against templates
-        classification = await self.ai.classify_voc(
-            voc_text=user_message,
-            conversation_history=session.recent_messages(limit=10),
+        # Classify VOC against templates (combined 모드면 필드까지 한 번에 추출)
+        self._emit(on_event, "stage", {"stage": "classifying"})
+        keyword_match = self._match_keywords(user_message)
+        knn_match = None
+        if not (keyword_match and self.keyword_fast_path == SHORTCUT_ON):
+            knn_match = await self._predict_knn(user_message)
+        classification = None
+        extracted_fields = None
+        if keyword_match and self.keyword_fast_path == SHORTCUT_ON:
+            classification = self._shortcut_classification("keyword", keyword_match)
+        elif knn_match and self.knn_mode == SHORTCUT_ON:
+            classification = self._shortcut_classification("knn", knn_match)
+        elif self.ai.classify_mode == CLASSIFY_MODE_COMBINED:
+            classification = await self.ai.classify_and_extract(
+                voc_text=user_message,
+                conversation_history=self._history(session),
+                on_delta=self._partial_fields_emitter(on_event, key="fields"),
+            )
+            if classification is not None:
+                extracted_fields = classification.get("fields")
+        if classification is None:
+            classification = await self.ai.classify_voc(
+                voc_text=user_message,
+                conversation_history=self._history(session),
+            )
+        self._record_shadow(
+            "keyword", self.keyword_fast_path, keyword_match, classification
         )
+        self._record_shadow("knn", self.knn_mode, knn_match, classification)
 
         if classification.get("action") == "clarify":
             question = classification.get("question", "좀 더 자세히 설명해 주시겠어요?")
@@ -60,14 +180,24 @@ class ChatService:
                 session_id=session_id, message=msg, type="text"
             )
 
-        extracted_fields = await self.ai.extract_fields(
-            voc_text=user_message,
-            template=template,
-            conversation_history=session.recent_messages(limit=10),
-        )
+        if extracted_fields is None:
+            self._emit(on_event, "stage", self._extracting_stage(template))
+            try:
+                extracted_fields = await self.ai.extract_fields(
+                    voc_text=user_message,
+                    template=template,
+                    conversation_history=self._history(session),
+                    on_delta=self._partial_fields_emitter(on_event),
+                )
+            except LLMUnavailable:
+                session.add_message("assistant", UNAVAILABLE_QUESTION)
+                return ChatResponse(
+                    session_id=session_id, message=UNAVAILABLE_QUESTION, type="text"
+                )
 
         session.pending_template_id = template.id
         session.pending_fields = extracted_fields
+        session.pending_voc_text = user_message
 
         preview_message = self._format_preview(template, extracted_fields)
         session.add_message(
@@ -92,7 +222,9 @@ class ChatService:
             },
         )
 
-    async def _continue_field_extraction(self, session, user_message: str) -> ChatResponse:
+    async def _continue_field_extraction(
+        self, session, user_message: str, on_event: EventCallback | None = None
+    ) -> ChatResponse:
         template = self.templates.get_template(session.pending_template_id)
         if template is None:
             session.pending_template_id = None
@@ -103,11 +235,33 @@ class ChatService:
                 session_id=session.id, message=msg, type="text"
             )
 
-        extracted_fields = await self.ai.extract_fields(
-            voc_text=user_message,
-            template=template,
-            conversation_history=session.recent_messages(limit=10),
-        )
+        self._emit(on_event, "stage", self._extracting_stage(template))
+        current_fields = session.pending_fields or {}
+        try:
+            if self.delta_extraction and current_fields:
+                updates = await self.ai.extract_field_updates(
+                    voc_text=user_message,
+                    template=template,
+                    current_fields=current_fields,
+                    conversation_history=self._history(session),
+                    on_delta=self._partial_fields_emitter(
+                        on_event, base=current_fields
+                    ),
+                )
+                extracted_fields = {**current_fields, **updates}
+            else:
+                extracted_fields = await self.ai.extract_fields(
+                    voc_text=user_message,
+                    template=template,
+                    conversation_history=self._history(session),
+                    on_delta=self._partial_fields_emitter(on_event),
+                )
+        except LLMUnavailable:
+            # 이전에 추출한 필드는 그대로 두고 다시 입력을 기다린다
+            session.add_message("assistant", UNAVAILABLE_QUESTION)
+            return ChatResponse(
+                session_id=session.id, message=UNAVAILABLE_QUESTION, type="text"
+            )
 
         session.pending_fields = extracted_fields
 
@@ -149,10 +303,19 @@ class ChatService:
             issue_type=template.jira_issue_type, fields=fields
         )
 
+        voc_text = session.pending_voc_text
         session.pending_template_id = None
         session.pending_fields = None
+        session.pending_voc_text = None
 
         ticket_key = result.get("key", "")
+        # kNN을 쓸 때(shadow 포함)만 라벨을 모은다. 저장은 응답 뒤에 백그라운드로 처리
+        if voc_text and self.rag is not None and self.knn_mode != SHORTCUT_OFF:
+            task = asyncio.create_task(
+                self._remember_labeled_voc(voc_text, template.id, ticket_key)
+            )
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
         ticket_url = f"{self.jira.base_url}/browse/{ticket_key}"
         ticket_message = f"Jira 티켓 **{ticket_key}**이(가) 성공적으로 생성되었습니다!\n링크: {ticket_url}"
 
@@ -168,6 +331,133 @@ class ChatService:
             "ticket_url": ticket_url,
         }
 
+    def _history(self, session) -> list[dict]:
+        return session.history_for_prompt(
+            token_budget=self.history_token_budget,
+            max_turn_tokens=self.history_max_turn_tokens,
+            summarize_older=self.history_summarize,
+        )
+
+    def get_classifier_stats(self) -> dict:
+        return {
+            "keyword_fast_path": self.keyword_fast_path,
+            "knn_mode": self.knn_mode,
+            **self._classifier_stats.snapshot(),
+        }
+
+    async def _remember_labeled_voc(
+        self, voc_text: str, template_id: str, ticket_key: str
+    ) -> None:
+        """확정된 VOC를 템플릿 ID와 함께 past_vocs에 저장 (kNN 분류/RAG 참고용)."""
+        try:
+            await self.rag.aadd_vocs_batch(
+                [voc_text],
+                [
+                    {
+                        "source": f"jira:{ticket_key}",
+                        LABEL_KEY: template_id,
+                        "ticket_key": ticket_key,
+                    }
+                ],
+            )
+        except Exception:
+            # 티켓은 이미 생성됐으므로 저장 실패는 기록만 한다
+            logger.exception("Failed to store confirmed VOC for %s", ticket_key)
+
+    async def _predict_knn(self, user_message: str) -> tuple[str, float] | None:
+        if self.knn_mode == SHORTCUT_OFF:
+            return None
+        self._classifier_stats.incr("knn_evaluated")
+        match = await self.knn.predict(user_message)
+        if match is not None:
+            self._classifier_stats.incr("knn_fired")
+        return match
+
+    def _shortcut_classification(
+        self, source: str, match: tuple[str, float]
+    ) -> dict:
+        self._classifier_stats.incr(f"{source}_llm_skipped")
+        template_id, score = match
+        return {
+            "action": "match",
+            "template_id": template_id,
+            "confidence": score if source == "knn" else 1.0,
+            "reasoning": f"{source} match (score={score:.2f})",
+        }
+
+    def _record_shadow(
+        self,
+        source: str,
+        mode: str,
+        match: tuple[str, float] | None,
+        classification: dict,
+    ) -> None:
+        if match is None or mode != SHORTCUT_SHADOW:
+            return
+        agreed = (
+            classification.get("action") == "match"
+            and classification.get("template_id") == match[0]
+        )
+        self._classifier_stats.incr(
+            f"{source}_agreed" if agreed else f"{source}_disagreed"
+        )
+
+    def _match_keywords(self, user_message: str) -> tuple[str, float] | None:
+        if self.keyword_fast_path == SHORTCUT_OFF:
+            return None
+        self._classifier_stats.incr("keyword_evaluated")
+        match = self.templates.keyword_matcher.best_match(
+            user_message,
+            min_score=self.keyword_min_score,
+            margin=self.keyword_margin,
+        )
+        if match is not None:
+            self._classifier_stats.incr("keyword_fired")
+        return match
+
+    # ── 스트리밍 이벤트 ──
+
+    @staticmethod
+    def _emit(on_event: EventCallback | None, event: str, data: dict) -> None:
+        if on_event is not None:
+            on_event(event, data)
+
+    @staticmethod
+    def _extracting_stage(template) -> dict:
+        return {
+            "stage": "extracting",
+            "template_id": template.id,
+            "template_name": template.name,
+        }
+
+    @staticmethod
+    def _partial_fields_emitter(
+        on_event: EventCallback | None,
+        key: str | None = None,
+        base: dict | None = None,
+    ) -> Callable[[str], None] | None:
+        """LLM 누적 응답을 부분 파싱해 필드가 바뀔 때마다 fields 이벤트를 보내는 콜백.
+
+        key가 있으면 응답 객체의 해당 키(combined 모드의 "fields") 아래를 본다.
+        base가 있으면 응답(변경분)을 base에 덮어쓴 전체 필드를 보낸다.
+        """
+        if on_event is None:
+            return None
+        last: dict = {}
+
+        def on_delta(text: str) -> None:
+            nonlocal last
+            fields = parse_partial_object(text)
+            if key is not None:
+                fields = fields.get(key)
+            if isinstance(fields, dict) and fields and base:
+                fields = {**base, **fields}
+            if isinstance(fields, dict) and fields and fields != last:
+                last = fields
+                on_event("fields", {"fields": fields})
+
+        return on_delta
+
     def _format_preview(self, template, fields: dict) -> str:
         lines = [f"**[{template.name}]** 템플릿으로 Jira 티켓을 생성할 준비가 되었습니다.\n"]
         lines.append("**미리보기:**")
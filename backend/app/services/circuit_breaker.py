@@ -0,0 +1,102 @@
+import threading
+import time
+from collections import deque
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """최근 호출 결과의 실패율로 여닫는 회로 차단기.
+
+    - closed: 최근 window건 중 min_calls건 이상이고 실패율이 failure_rate 이상이면 open
+    - open: open_seconds 동안 모든 호출을 즉시 거절
+    - half_open: 시험 호출 1건만 허용해 성공하면 closed, 실패하면 다시 open
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        open_seconds: float = 30.0,
+    ):
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self._outcomes: deque[bool] = deque(maxlen=window)  # True = 실패
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._times_opened = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self._current_state()
+            if state == STATE_CLOSED:
+                return True
+            if state == STATE_HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._current_state() == STATE_HALF_OPEN:
+                self._state = STATE_CLOSED
+                self._outcomes.clear()
+                self._probe_in_flight = False
+            self._outcomes.append(False)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            state = self._current_state()
+            self._outcomes.append(True)
+            if state == STATE_HALF_OPEN:
+                self._open()
+                return
+            failures = sum(self._outcomes)
+            if (
+                state == STATE_CLOSED
+                and len(self._outcomes) >= self.min_calls
+                and failures / len(self._outcomes) >= self.failure_rate
+            ):
+                self._open()
+
+    def release_probe(self) -> None:
+        """허용된 호출이 결과 없이 끝남 (취소 등). 시험 호출 자리를 되돌린다."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def stats(self) -> dict:
+        with self._lock:
+            outcomes = len(self._outcomes)
+            return {
+                "state": self._current_state(),
+                "recent_calls": outcomes,
+                "recent_failure_rate": (
+                    round(sum(self._outcomes) / outcomes, 4) if outcomes else 0.0
+                ),
+                "times_opened": self._times_opened,
+            }
+
+    def _open(self) -> None:
+        self._state = STATE_OPEN
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+        self._times_opened += 1
+
+    def _current_state(self) -> str:
+        if (
+            self._state == STATE_OPEN
+            and time.monotonic() - self._opened_at >= self.open_seconds
+        ):
+            self._state = STATE_HALF_OPEN
+        return self._state
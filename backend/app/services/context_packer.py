@@ -0,0 +1,108 @@
+from app.services.lexical_index import tokenize
+from app.services.text_utils import estimate_tokens, split_sentences, truncate_to_tokens
+
+# 문서 라벨/구분선 등 본문 외 서식에 드는 대략적인 토큰 수
+_DOC_OVERHEAD_TOKENS = 8
+_SECTION_OVERHEAD_TOKENS = 10
+# 남은 예산이 이보다 작으면 문서를 잘라 넣지 않는다
+_MIN_SNIPPET_TOKENS = 20
+
+
+class ContextPacker:
+    """RAG 검색 결과를 토큰 예산 안에 들어가도록 골라 담는다.
+
+    1. distance가 임계값을 넘는(유사도가 낮은) 결과 제거
+    2. 내용이 거의 같은 결과 제거 (토큰 Jaccard 유사도)
+    3. 긴 문서는 질의와 관련 높은 문장만 남기도록 축약
+    4. VOC/가이드를 순위대로 번갈아 담다가 예산을 넘으면 중단
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 1000,
+        max_distance: float | None = None,
+        max_doc_tokens: int = 250,
+        dedup_threshold: float = 0.8,
+    ):
+        self.token_budget = token_budget
+        self.max_distance = max_distance
+        self.max_doc_tokens = max_doc_tokens
+        self.dedup_threshold = dedup_threshold
+
+    def pack(
+        self, query: str, results: dict, token_budget: int | None = None
+    ) -> dict:
+        budget = self.token_budget if token_budget is None else token_budget
+        query_terms = set(tokenize(query))
+
+        vocs = self._filter(results.get("vocs", []))
+        guides = self._filter(results.get("guides", []))
+
+        packed: dict[str, list[dict]] = {"vocs": [], "guides": []}
+        seen: list[set[str]] = []
+        used = 0
+        for section, doc in _interleave(vocs, guides):
+            terms = set(tokenize(doc["content"]))
+            if self._is_duplicate(terms, seen):
+                continue
+            overhead = _DOC_OVERHEAD_TOKENS
+            if not packed[section]:
+                overhead += _SECTION_OVERHEAD_TOKENS
+            limit = min(self.max_doc_tokens, budget - used - overhead)
+            if limit < _MIN_SNIPPET_TOKENS:
+                continue
+            content = self._trim(doc["content"], query_terms, limit)
+            used += estimate_tokens(content) + overhead
+            seen.append(terms)
+            packed[section].append({**doc, "content": content})
+        return packed
+
+    def _filter(self, docs: list[dict]) -> list[dict]:
+        if self.max_distance is None:
+            return list(docs)
+        return [
+            d
+            for d in docs
+            if d.get("distance") is None or d["distance"] <= self.max_distance
+        ]
+
+    def _is_duplicate(self, terms: set[str], seen: list[set[str]]) -> bool:
+        if not terms:
+            return False
+        for other in seen:
+            union = len(terms | other)
+            if union and len(terms & other) / union >= self.dedup_threshold:
+                return True
+        return False
+
+    def _trim(self, content: str, query_terms: set[str], limit: int) -> str:
+        if estimate_tokens(content) <= limit:
+            return content
+        sentences = split_sentences(content)
+        scored = sorted(
+            range(len(sentences)),
+            key=lambda i: (
+                -len(query_terms & set(tokenize(sentences[i]))),
+                i,
+            ),
+        )
+        keep: list[int] = []
+        used = 0
+        for i in scored:
+            cost = estimate_tokens(sentences[i])
+            if used + cost > limit:
+                continue
+            keep.append(i)
+            used += cost
+        if not keep:
+            # 문장 하나가 예산보다 긴 경우 앞부분만 자른다
+            return truncate_to_tokens(sentences[scored[0]], limit)
+        return " … ".join(sentences[i] for i in sorted(keep))
+
+
+def _interleave(vocs: list[dict], guides: list[dict]):
+    for i in range(max(len(vocs), len(guides))):
+        if i < len(vocs):
+            yield "vocs", vocs[i]
+        if i < len(guides):
+            yield "guides", guides[i]
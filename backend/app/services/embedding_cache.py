@@ -0,0 +1,74 @@
+import sqlite3
+import threading
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """콘텐츠 해시 → 임베딩 영구 캐시 (SQLite).
+
+    같은 문서를 다시 업로드하거나 컬렉션을 재구성할 때 임베딩 모델을
+    다시 돌리지 않도록 계산된 벡터를 보관한다. 임베딩 모델이 바뀌면
+    다른 벡터가 나오므로 모델 이름을 키에 포함한다.
+    """
+
+    def __init__(self, path: str, model: str):
+        self._model = model
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " hash TEXT NOT NULL,"
+            " model TEXT NOT NULL,"
+            " vector BLOB NOT NULL,"
+            " PRIMARY KEY (hash, model))"
+        )
+        self._conn.commit()
+        self._hits = 0
+        self._misses = 0
+
+    def get_many(self, hashes: list[str]) -> dict[str, np.ndarray]:
+        found: dict[str, np.ndarray] = {}
+        if not hashes:
+            return found
+        with self._lock:
+            # SQLite 바인딩 변수 개수 제한을 피하기 위해 나눠서 조회
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT hash, vector FROM embeddings"
+                    f" WHERE model = ? AND hash IN ({placeholders})",
+                    [self._model, *chunk],
+                ).fetchall()
+                for h, blob in rows:
+                    found[h] = np.frombuffer(blob, dtype=np.float32)
+            self._hits += len(found)
+            self._misses += len(set(hashes)) - len(found)
+        return found
+
+    def put_many(self, items: dict[str, np.ndarray]) -> None:
+        if not items:
+            return
+        rows = [
+            (h, self._model, np.asarray(v, dtype=np.float32).tobytes())
+            for h, v in items.items()
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (hash, model, vector)"
+                " VALUES (?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            (size,) = self._conn.execute(
+                "SELECT COUNT(*) FROM embeddings WHERE model = ?", (self._model,)
+            ).fetchone()
+            return {"size": size, "hits": self._hits, "misses": self._misses}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
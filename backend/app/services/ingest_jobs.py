@@ -0,0 +1,214 @@
+import asyncio
+import codecs
+import logging
+import os
+import tempfile
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from fastapi import UploadFile
+
+from app.services.rag_service import IngestReport, RagService
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_SIZE = 1024 * 1024  # 1MB
+MAX_RETAINED_JOBS = 100
+
+
+class LineSplitter:
+    """스트림으로 들어오는 텍스트를 줄 단위 문서로 분리."""
+
+    def __init__(self):
+        self._buffer = ""
+
+    def feed(self, text: str) -> list[str]:
+        self._buffer += text
+        *complete, self._buffer = self._buffer.split("\n")
+        return [line.strip() for line in complete if line.strip()]
+
+    def flush(self) -> list[str]:
+        rest, self._buffer = self._buffer.strip(), ""
+        return [rest] if rest else []
+
+
+class ParagraphSplitter:
+    """스트림으로 들어오는 텍스트를 빈 줄 기준 단락으로 분리."""
+
+    def __init__(self):
+        self._buffer = ""
+
+    def feed(self, text: str) -> list[str]:
+        self._buffer += text
+        *complete, self._buffer = self._buffer.split("\n\n")
+        return [p.strip() for p in complete if p.strip()]
+
+    def flush(self) -> list[str]:
+        rest, self._buffer = self._buffer.strip(), ""
+        return [rest] if rest else []
+
+
+@dataclass
+class IngestJob:
+    id: str
+    kind: str  # vocs, guides
+    filename: str
+    status: str = "pending"  # pending, running, completed, failed
+    total_bytes: int = 0
+    bytes_read: int = 0
+    documents: int = 0
+    batches: int = 0
+    report: IngestReport = field(default_factory=IngestReport)
+    error: str | None = None
+    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    started_at: str | None = None
+    finished_at: str | None = None
+
+    def to_dict(self) -> dict:
+        progress = (
+            round(self.bytes_read / self.total_bytes, 4)
+            if self.total_bytes
+            else (1.0 if self.status == "completed" else 0.0)
+        )
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "filename": self.filename,
+            "status": self.status,
+            "progress": progress,
+            "total_bytes": self.total_bytes,
+            "bytes_read": self.bytes_read,
+            "documents": self.documents,
+            "batches": self.batches,
+            "new": self.report.new,
+            "duplicate": self.report.duplicate,
+            "updated": self.report.updated,
+            "merged": self.report.merged,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class IngestJobManager:
+    """대용량 업로드를 백그라운드에서 스트리밍 방식으로 적재.
+
+    업로드는 청크 단위로 임시 파일에 옮긴 뒤 즉시 응답하고, 백그라운드 작업이
+    파일을 조금씩 읽어 줄/단락으로 나누고 배치 단위로 RAG에 적재한다.
+    """
+
+    def __init__(
+        self,
+        rag: RagService,
+        batch_size: int = 256,
+        max_concurrent_jobs: int = 1,
+    ):
+        self._rag = rag
+        self._batch_size = max(1, min(batch_size, rag.max_batch_size))
+        self._slots = asyncio.Semaphore(max(1, max_concurrent_jobs))
+        self._jobs: OrderedDict[str, IngestJob] = OrderedDict()
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, kind: str, upload: UploadFile) -> IngestJob:
+        job = IngestJob(
+            id=str(uuid.uuid4()),
+            kind=kind,
+            filename=upload.filename or "",
+        )
+        path, size = await self._spool(upload)
+        job.total_bytes = size
+        self._remember(job)
+
+        task = asyncio.create_task(self._run(job, path))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    def get(self, job_id: str) -> IngestJob | None:
+        return self._jobs.get(job_id)
+
+    def list_jobs(self) -> list[IngestJob]:
+        return list(reversed(self._jobs.values()))
+
+    async def close(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    # ── 내부 ──
+
+    async def _spool(self, upload: UploadFile) -> tuple[str, int]:
+        fd, path = tempfile.mkstemp(prefix="rag-ingest-", suffix=".txt")
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while chunk := await upload.read(READ_CHUNK_SIZE):
+                    await asyncio.to_thread(out.write, chunk)
+                    size += len(chunk)
+        except BaseException:
+            os.unlink(path)
+            raise
+        return path, size
+
+    def _remember(self, job: IngestJob) -> None:
+        self._jobs[job.id] = job
+        while len(self._jobs) > MAX_RETAINED_JOBS:
+            oldest_id, oldest = next(iter(self._jobs.items()))
+            if oldest.status in ("pending", "running"):
+                break
+            del self._jobs[oldest_id]
+
+    async def _run(self, job: IngestJob, path: str) -> None:
+        async with self._slots:
+            job.status = "running"
+            job.started_at = datetime.utcnow().isoformat()
+            try:
+                await self._process(job, path)
+                job.status = "completed"
+            except asyncio.CancelledError:
+                job.status = "failed"
+                job.error = "cancelled"
+                raise
+            except Exception as e:
+                logger.exception("RAG ingest job %s failed", job.id)
+                job.status = "failed"
+                job.error = str(e)
+            finally:
+                job.finished_at = datetime.utcnow().isoformat()
+                os.unlink(path)
+
+    async def _process(self, job: IngestJob, path: str) -> None:
+        if job.kind == "vocs":
+            splitter = LineSplitter()
+            metadata = {"source": job.filename}
+            add_batch = self._rag.aadd_vocs_batch
+        else:
+            splitter = ParagraphSplitter()
+            metadata = {"source": job.filename, "title": job.filename}
+            add_batch = self._rag.aadd_guides_batch
+
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        pending: list[str] = []
+
+        async def flush_batches(final: bool = False) -> None:
+            while len(pending) >= self._batch_size or (final and pending):
+                batch = pending[: self._batch_size]
+                del pending[: self._batch_size]
+                report = await add_batch(batch, [dict(metadata) for _ in batch])
+                # ids는 작업 상태에 누적하지 않는다 (대용량 업로드 시 메모리 절약)
+                report.ids = []
+                job.report.merge(report)
+                job.documents += len(batch)
+                job.batches += 1
+
+        with open(path, "rb") as f:
+            while chunk := await asyncio.to_thread(f.read, READ_CHUNK_SIZE):
+                job.bytes_read += len(chunk)
+                pending.extend(splitter.feed(decoder.decode(chunk)))
+                await flush_batches()
+            pending.extend(splitter.feed(decoder.decode(b"", final=True)))
+            pending.extend(splitter.flush())
+            await flush_batches(final=True)
@@ -0,0 +1,166 @@
+import json
+
+
+def parse_partial_object(text: str) -> dict:
+    """스트리밍 중인(끝나지 않은) JSON 객체에서 지금까지 완성된 부분을 파싱.
+
+    열린 문자열/괄호를 닫아 파싱해 보고, 실패하면 마지막 쉼표나 여는 괄호
+    지점까지 잘라 다시 시도한다. 작성 중인 문자열 값은 지금까지의 내용으로
+    포함된다. 객체가 시작되지 않았거나 파싱할 수 없으면 빈 dict.
+    """
+    start = text.find("{")
+    if start < 0:
+        return {}
+    text = text[start:]
+
+    stack: list[str] = []
+    # (잘라낼 위치, 그 시점에 닫아야 할 괄호) — 뒤에서부터 재시도에 사용
+    safe_points: list[tuple[int, str]] = []
+    in_string = False
+    escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+            safe_points.append((i + 1, "".join(reversed(stack))))
+        elif ch in "}]":
+            if stack:
+                stack.pop()
+            if not stack:
+                return _loads_object(text[: i + 1]) or {}
+        elif ch == ",":
+            safe_points.append((i, "".join(reversed(stack))))
+
+    candidate = text[:-1] if escaped else text
+    if in_string:
+        candidate += '"'
+    parsed = _loads_object(candidate + "".join(reversed(stack)))
+    if parsed is not None:
+        return parsed
+    for end, closing in reversed(safe_points):
+        parsed = _loads_object(text[:end] + closing)
+        if parsed is not None:
+            return parsed
+    return {}
+
+
+def extract_object(text: str | None) -> tuple[dict | None, bool]:
+    """LLM 응답에서 JSON 객체를 찾아 파싱. (객체, 보정 여부)를 반환.
+
+    그대로 파싱되지 않으면 코드 펜스/앞뒤 설명문 속에서 처음으로 괄호가
+    맞는 객체를 찾고, 끝 쉼표를 지워 다시 시도한다. 닫히지 않은(잘린)
+    객체는 parse_partial_object로 닫아서 파싱한다. 찾지 못하면 (None, False).
+    """
+    if not text:
+        return None, False
+    stripped = text.strip()
+    parsed = _loads_object(stripped)
+    if parsed is not None:
+        return parsed, False
+    fenced = _strip_code_fence(stripped)
+    parsed = _loads_object(fenced)
+    if parsed is not None:
+        return parsed, False
+
+    start = fenced.find("{")
+    while start >= 0:
+        end = _balanced_end(fenced, start)
+        if end is None:
+            # 닫히지 않은 채 끝남 (max_tokens 등으로 잘림)
+            parsed = parse_partial_object(_remove_trailing_commas(fenced[start:]))
+            return (parsed, True) if parsed else (None, False)
+        candidate = fenced[start:end]
+        parsed = _loads_object(candidate) or _loads_object(
+            _remove_trailing_commas(candidate)
+        )
+        if parsed is not None:
+            return parsed, True
+        start = fenced.find("{", start + 1)
+    return None, False
+
+
+def _strip_code_fence(text: str) -> str:
+    if not text.startswith("```"):
+        return text
+    lines = text.split("\n")[1:]  # 여는 펜스 제거
+    if lines and lines[-1].strip() == "```":
+        lines = lines[:-1]
+    return "\n".join(lines)
+
+
+def _balanced_end(text: str, start: int) -> int | None:
+    """text[start]의 여는 괄호와 짝이 맞는 닫는 괄호 다음 위치. 없으면 None."""
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return None
+
+
+def _remove_trailing_commas(text: str) -> str:
+    """문자열 밖에서 닫는 괄호 바로 앞(공백 무시)에 오는 쉼표를 제거."""
+    out: list[str] = []
+    pending_comma: list[str] = []  # 쉼표 + 그 뒤 공백 (다음 문자를 보고 결정)
+    in_string = False
+    escaped = False
+    for ch in text:
+        if in_string:
+            out.append(ch)
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if pending_comma:
+            if ch.isspace():
+                pending_comma.append(ch)
+                continue
+            if ch in "}]":
+                out.extend(pending_comma[1:])
+            else:
+                out.extend(pending_comma)
+            pending_comma = []
+        if ch == ",":
+            pending_comma = [ch]
+            continue
+        if ch == '"':
+            in_string = True
+        out.append(ch)
+    out.extend(pending_comma)
+    return "".join(out)
+
+
+def _loads_object(text: str) -> dict | None:
+    try:
+        value = json.loads(text)
+    except json.JSONDecodeError:
+        return None
+    return value if isinstance(value, dict) else None
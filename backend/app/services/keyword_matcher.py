@@ -0,0 +1,105 @@
+from collections import deque
+
+from app.services.text_utils import normalize_text
+
+
+def _is_ascii_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+class KeywordMatcher:
+    """템플릿 키워드 전체를 하나의 Aho-Corasick 오토마톤으로 컴파일한 매처.
+
+    VOC 텍스트를 한 번 훑어 템플릿별 점수를 낸다. 여러 템플릿에 걸친 키워드
+    ("요청" 등)는 1/템플릿 수만큼만 기여하고, 같은 키워드는 여러 번 나와도
+    한 번만 센다. 영문 키워드는 단어 경계에서만 매칭하고("add" ≠ "address"),
+    한글 키워드는 조사가 붙어도 맞도록 부분 문자열로 매칭한다.
+    """
+
+    def __init__(self, keywords_by_template: dict[str, list[str]]):
+        weights: dict[str, dict[str, float]] = {}
+        for template_id, keywords in keywords_by_template.items():
+            for keyword in keywords:
+                normalized = normalize_text(keyword)
+                if normalized:
+                    weights.setdefault(normalized, {})[template_id] = 1.0
+        for owners in weights.values():
+            share = 1.0 / len(owners)
+            for template_id in owners:
+                owners[template_id] = share
+        self._weights = weights
+        self.template_ids = list(keywords_by_template)
+
+        # 트라이 + 실패 링크
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[str]] = [[]]
+        for keyword in weights:
+            node = 0
+            for ch in keyword:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                node = nxt
+            self._output[node].append(keyword)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child].extend(self._output[self._fail[child]])
+
+    def find(self, text: str) -> set[str]:
+        """텍스트에 나타난 (정규화된) 키워드 집합."""
+        text = normalize_text(text)
+        found: set[str] = set()
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for keyword in self._output[node]:
+                if keyword not in found and self._on_boundary(text, i, keyword):
+                    found.add(keyword)
+        return found
+
+    def score(self, text: str) -> dict[str, float]:
+        scores = {template_id: 0.0 for template_id in self.template_ids}
+        for keyword in self.find(text):
+            for template_id, weight in self._weights[keyword].items():
+                scores[template_id] += weight
+        return scores
+
+    def best_match(
+        self, text: str, min_score: float = 1.0, margin: float = 1.0
+    ) -> tuple[str, float] | None:
+        """1위 템플릿이 min_score 이상이고 2위보다 margin 이상 앞설 때만 (id, 점수)."""
+        ranked = sorted(self.score(text).items(), key=lambda kv: kv[1], reverse=True)
+        if not ranked:
+            return None
+        best_id, best = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        if best >= min_score and best - runner_up >= margin:
+            return best_id, best
+        return None
+
+    @staticmethod
+    def _on_boundary(text: str, end: int, keyword: str) -> bool:
+        start = end - len(keyword) + 1
+        if _is_ascii_word_char(keyword[0]) and start > 0:
+            if _is_ascii_word_char(text[start - 1]):
+                return False
+        if _is_ascii_word_char(keyword[-1]) and end + 1 < len(text):
+            if _is_ascii_word_char(text[end + 1]):
+                return False
+        return True
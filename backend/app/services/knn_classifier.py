@@ -0,0 +1,53 @@
+from app.services.rag_service import SEARCH_MODE_VECTOR, RagService
+
+# 확정된 티켓의 템플릿 ID를 past_vocs 메타데이터에 남길 때 쓰는 키
+LABEL_KEY = "template_id"
+
+
+class KnnClassifier:
+    """템플릿 ID가 기록된 과거 VOC의 최근접 이웃 가중 투표로 분류.
+
+    이웃 가중치는 occurrences / (1 + distance). 라벨 없는 VOC가 섞여 있으므로
+    k의 3배를 검색한 뒤 라벨 있는 이웃만 최대 k개 쓴다. 라벨 이웃이 부족하거나,
+    가장 가까운 이웃이 max_distance보다 멀거나, 1위 득표율이 min_agreement
+    미만이면 None을 반환해 LLM 분류로 넘긴다.
+    """
+
+    def __init__(
+        self,
+        rag: RagService,
+        k: int = 10,
+        min_neighbors: int = 3,
+        min_agreement: float = 0.8,
+        max_distance: float = 0.6,
+    ):
+        self.rag = rag
+        self.k = k
+        self.min_neighbors = min_neighbors
+        self.min_agreement = min_agreement
+        self.max_distance = max_distance
+
+    async def predict(self, text: str) -> tuple[str, float] | None:
+        """(template_id, 득표율) 또는 None"""
+        results = await self.rag.asearch_vocs(
+            text, top_k=self.k * 3, mode=SEARCH_MODE_VECTOR
+        )
+        neighbors = [
+            r for r in results
+            if r.get("metadata", {}).get(LABEL_KEY) and r.get("distance") is not None
+        ][: self.k]
+        if len(neighbors) < self.min_neighbors:
+            return None
+        if neighbors[0]["distance"] > self.max_distance:
+            return None
+
+        votes: dict[str, float] = {}
+        for r in neighbors:
+            meta = r["metadata"]
+            weight = meta.get("occurrences", 1) / (1.0 + r["distance"])
+            votes[meta[LABEL_KEY]] = votes.get(meta[LABEL_KEY], 0.0) + weight
+        template_id, best = max(votes.items(), key=lambda kv: kv[1])
+        agreement = best / sum(votes.values())
+        if agreement < self.min_agreement:
+            return None
+        return template_id, round(agreement, 4)
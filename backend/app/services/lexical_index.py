@@ -0,0 +1,121 @@
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter
+
+_TOKEN_RE = re.compile(r"[가-힣]+|[^\W_]+")
+_HANGUL_RE = re.compile(r"[가-힣]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """BM25용 토큰화.
+
+    한국어는 조사/어미가 붙어 어절 단위로는 잘 일치하지 않으므로
+    ("로그인이" vs "로그인") 한글 어절은 원형과 함께 글자 bigram도 토큰으로 쓴다.
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    tokens: list[str] = []
+    for word in _TOKEN_RE.findall(text):
+        tokens.append(word)
+        if _HANGUL_RE.fullmatch(word) and len(word) > 2:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+class BM25Index:
+    """컬렉션과 나란히 유지되는 인메모리 BM25 역색인 (스레드 안전)."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, dict[str, int]] = {}
+        self._doc_terms: dict[str, Counter] = {}
+        self._doc_len: dict[str, int] = {}
+        self._docs: dict[str, tuple[str, dict]] = {}
+        self._total_len = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, doc_id: str, content: str, metadata: dict | None = None) -> None:
+        terms = Counter(tokenize(content))
+        with self._lock:
+            self._remove_locked(doc_id)
+            self._docs[doc_id] = (content, dict(metadata or {}))
+            self._doc_terms[doc_id] = terms
+            self._doc_len[doc_id] = sum(terms.values())
+            self._total_len += self._doc_len[doc_id]
+            for term, tf in terms.items():
+                self._postings.setdefault(term, {})[doc_id] = tf
+
+    def update_metadata(self, doc_id: str, metadata: dict) -> None:
+        with self._lock:
+            if doc_id in self._docs:
+                content, current = self._docs[doc_id]
+                self._docs[doc_id] = (content, {**current, **metadata})
+
+    def remove(self, doc_id: str) -> None:
+        with self._lock:
+            self._remove_locked(doc_id)
+
+    def search(self, query: str, top_k: int = 5) -> list[dict]:
+        query_terms = set(tokenize(query))
+        with self._lock:
+            n_docs = len(self._docs)
+            if n_docs == 0 or not query_terms:
+                return []
+            avg_len = self._total_len / n_docs
+            scores: dict[str, float] = {}
+            for term in query_terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                df = len(postings)
+                idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+                for doc_id, tf in postings.items():
+                    doc_len = self._doc_len[doc_id]
+                    norm = tf + self.k1 * (1 - self.b + self.b * doc_len / avg_len)
+                    scores[doc_id] = (
+                        scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / norm
+                    )
+            best = heapq.nlargest(top_k, scores.items(), key=lambda kv: kv[1])
+            return [
+                {
+                    "id": doc_id,
+                    "content": self._docs[doc_id][0],
+                    "metadata": self._docs[doc_id][1],
+                    "distance": None,
+                    "score": score,
+                }
+                for doc_id, score in best
+            ]
+
+    def _remove_locked(self, doc_id: str) -> None:
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        self._docs.pop(doc_id, None)
+        self._total_len -= self._doc_len.pop(doc_id)
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+
+
+def reciprocal_rank_fusion(
+    rankings: list[list[dict]], top_k: int, k: int = 60
+) -> list[dict]:
+    """여러 순위 목록을 RRF(1 / (k + rank))로 합친다. 같은 ID는 먼저 나온 결과를 유지."""
+    fused: dict[str, float] = {}
+    docs: dict[str, dict] = {}
+    for ranking in rankings:
+        for rank, doc in enumerate(ranking, 1):
+            fused[doc["id"]] = fused.get(doc["id"], 0.0) + 1.0 / (k + rank)
+            docs.setdefault(doc["id"], doc)
+    best = heapq.nlargest(top_k, fused.items(), key=lambda kv: kv[1])
+    return [{**docs[doc_id], "score": score} for doc_id, score in best]
@@ -0,0 +1,194 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from openai import APIError, AsyncOpenAI
+
+from app.services.metrics import LatencyStats
+
+logger = logging.getLogger(__name__)
+
+# 이 예외로 끝난 요청은 해당 엔드포인트의 실패로 집계 (취소/과부하 거절 등은 제외)
+ENDPOINT_FAILURES = (asyncio.TimeoutError, APIError)
+
+
+def parse_endpoints(spec: str) -> list[tuple[str, int]]:
+    """"url[=weight],url[=weight]" 형식을 [(url, weight)]로 변환. 가중치 기본값 1."""
+    endpoints: list[tuple[str, int]] = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        url, sep, weight = item.rpartition("=")
+        if sep and weight.strip().isdigit():
+            url, weight = url.strip(), int(weight)
+        else:
+            url, weight = item, 1
+        if not url or weight < 1:
+            raise ValueError(f"Invalid AI endpoint: {item!r}")
+        endpoints.append((url, weight))
+    return endpoints
+
+
+class LLMEndpoint:
+    def __init__(self, base_url: str, weight: int, api_key: str):
+        self.base_url = base_url
+        self.weight = weight
+        self.client = AsyncOpenAI(base_url=base_url, api_key=api_key)
+        self.outstanding = 0
+        self.served = 0
+        self.errors = 0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.times_ejected = 0
+        self.latency = LatencyStats()
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.ejected_until
+
+    def stats(self) -> dict:
+        return {
+            "base_url": self.base_url,
+            "weight": self.weight,
+            "healthy": self.healthy,
+            "outstanding": self.outstanding,
+            "requests": self.served,
+            "errors": self.errors,
+            "consecutive_failures": self.consecutive_failures,
+            "times_ejected": self.times_ejected,
+            "latency": self.latency.snapshot(),
+        }
+
+
+class EndpointPool:
+    """여러 OpenAI 호환 추론 서버에 요청을 나눠 보내는 풀.
+
+    - 가중치 대비 처리 중 요청 수(outstanding/weight)가 가장 적은 서버로 보냄
+    - 연속 max_failures번 실패한 서버는 eject_seconds 동안 제외하고,
+      제외된 서버는 health_interval마다 /models 호출로 복구 여부를 확인
+    - 모든 서버가 제외되면 제외 여부와 무관하게 고른다 (요청을 막지는 않음)
+    """
+
+    def __init__(
+        self,
+        endpoints: list[tuple[str, int]],
+        api_key: str,
+        max_failures: int = 3,
+        eject_seconds: float = 30.0,
+        health_interval: float = 10.0,
+    ):
+        if not endpoints:
+            raise ValueError("At least one AI endpoint is required")
+        self.endpoints = [LLMEndpoint(url, w, api_key) for url, w in endpoints]
+        self.max_failures = max(1, max_failures)
+        self.eject_seconds = eject_seconds
+        self.health_interval = health_interval
+        self._health_task: asyncio.Task | None = None
+        self._retired = False
+        self._last_acquired = 0.0
+
+    @asynccontextmanager
+    async def acquire(self):
+        """요청을 보낼 엔드포인트를 골라 블록 안에서 사용. 결과는 자동 집계."""
+        self._ensure_health_checks()
+        endpoint = self._choose()
+        endpoint.outstanding += 1
+        self._last_acquired = time.monotonic()
+        started = time.perf_counter()
+        try:
+            yield endpoint
+        except ENDPOINT_FAILURES:
+            endpoint.errors += 1
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= self.max_failures and endpoint.healthy:
+                self._eject(endpoint)
+            raise
+        else:
+            endpoint.served += 1
+            endpoint.consecutive_failures = 0
+            endpoint.latency.record(time.perf_counter() - started)
+        finally:
+            endpoint.outstanding -= 1
+
+    def stats(self) -> dict:
+        return {
+            "healthy": sum(1 for e in self.endpoints if e.healthy),
+            "endpoints": [e.stats() for e in self.endpoints],
+        }
+
+    def stop_health_checks(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+
+    async def close(self) -> None:
+        self.stop_health_checks()
+        for endpoint in self.endpoints:
+            await endpoint.client.close()
+
+    async def close_when_idle(
+        self, idle_seconds: float = 5.0, max_wait_seconds: float = 300.0
+    ) -> None:
+        """진행 중인 요청이 끝나면 클라이언트를 닫는다 (설정 변경으로 교체된 풀 정리용).
+
+        교체 전에 시작된 채팅 요청은 같은 AIService로 분류 → 필드 추출을 이어서
+        호출하므로 idle_seconds 동안 새 요청이 없을 때 닫는다. max_wait_seconds가
+        지나거나 취소되면(종료 시) 기다리지 않고 닫는다.
+        """
+        self._retired = True
+        self.stop_health_checks()
+        deadline = time.monotonic() + max_wait_seconds
+        try:
+            while time.monotonic() < deadline:
+                busy = any(e.outstanding for e in self.endpoints)
+                if not busy and time.monotonic() - self._last_acquired >= idle_seconds:
+                    break
+                await asyncio.sleep(min(1.0, idle_seconds))
+        finally:
+            await self.close()
+
+    # ── 내부 ──
+
+    def _choose(self) -> LLMEndpoint:
+        candidates = [e for e in self.endpoints if e.healthy] or self.endpoints
+        # 동률이면 지금까지 처리량이 가중치 대비 적은 쪽 → 한가할 때도 가중치대로 분산
+        return min(
+            candidates,
+            key=lambda e: (e.outstanding / e.weight, e.served / e.weight),
+        )
+
+    def _eject(self, endpoint: LLMEndpoint) -> None:
+        endpoint.ejected_until = time.monotonic() + self.eject_seconds
+        endpoint.times_ejected += 1
+        logger.warning(
+            "AI endpoint %s ejected after %d consecutive failures",
+            endpoint.base_url,
+            endpoint.consecutive_failures,
+        )
+
+    def _ensure_health_checks(self) -> None:
+        if self._retired or len(self.endpoints) < 2 or self.health_interval <= 0:
+            return
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.get_running_loop().create_task(
+                self._health_loop()
+            )
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_interval)
+            for endpoint in self.endpoints:
+                if not endpoint.healthy:
+                    await self._check(endpoint)
+
+    async def _check(self, endpoint: LLMEndpoint) -> None:
+        try:
+            await asyncio.wait_for(endpoint.client.models.list(), self.health_interval)
+        except (*ENDPOINT_FAILURES, OSError):
+            endpoint.ejected_until = time.monotonic() + self.eject_seconds
+            return
+        endpoint.ejected_until = 0.0
+        endpoint.consecutive_failures = 0
+        logger.info("AI endpoint %s passed health check, restored", endpoint.base_url)
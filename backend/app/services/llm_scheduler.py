@@ -0,0 +1,136 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+
+from app.services.metrics import LatencyStats
+
+# 우선순위 레인 (앞쪽이 먼저 배정됨)
+PRIORITY_INTERACTIVE = "interactive"  # /api/chat 등 사용자가 기다리는 호출
+PRIORITY_BACKGROUND = "background"  # 웹훅 티켓 분석 등
+_LANES = (PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND)
+
+
+class SchedulerOverloaded(Exception):
+    """레인 대기열이 가득 차 요청을 받지 않음 (load shedding)."""
+
+    def __init__(self, priority: str):
+        super().__init__(f"LLM scheduler queue is full ({priority})")
+        self.priority = priority
+
+
+class LLMScheduler:
+    """LLM 호출 동시 실행 수를 제한하고 우선순위 레인별로 대기시키는 스케줄러.
+
+    - 전체 동시 실행 수는 max_concurrency로 제한
+    - 자리가 나면 interactive 대기열을 먼저 비운다
+    - background는 background_max_concurrency까지만 동시에 실행해
+      interactive 요청이 항상 들어갈 자리를 남긴다
+    - 레인별 대기열이 가득 차면 SchedulerOverloaded로 즉시 거절
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        background_max_concurrency: int = 4,
+        interactive_queue_size: int = 64,
+        background_queue_size: int = 32,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self._lane_limits = {
+            PRIORITY_INTERACTIVE: self.max_concurrency,
+            PRIORITY_BACKGROUND: max(
+                1, min(background_max_concurrency, self.max_concurrency)
+            ),
+        }
+        self._queue_limits = {
+            PRIORITY_INTERACTIVE: interactive_queue_size,
+            PRIORITY_BACKGROUND: background_queue_size,
+        }
+        self._waiters: dict[str, deque[asyncio.Future]] = {
+            lane: deque() for lane in _LANES
+        }
+        self._in_flight = {lane: 0 for lane in _LANES}
+        self._wait_stats = {lane: LatencyStats() for lane in _LANES}
+        self._completed = {lane: 0 for lane in _LANES}
+        self._shed = {lane: 0 for lane in _LANES}
+
+    @asynccontextmanager
+    async def slot(self, priority: str = PRIORITY_INTERACTIVE):
+        """실행 슬롯을 얻을 때까지 대기. 블록을 벗어나면 반납."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release(priority)
+
+    def has_capacity(self, priority: str = PRIORITY_INTERACTIVE) -> bool:
+        """지금 요청하면 기다리지 않고 바로 실행되는지."""
+        ahead = any(self._waiters[other] for other in _LANES[: _LANES.index(priority) + 1])
+        return not ahead and self._can_start(priority)
+
+    def stats(self) -> dict:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": sum(self._in_flight.values()),
+            "lanes": {
+                lane: {
+                    "in_flight": self._in_flight[lane],
+                    "max_in_flight": self._lane_limits[lane],
+                    "queued": len(self._waiters[lane]),
+                    "max_queue": self._queue_limits[lane],
+                    "completed": self._completed[lane],
+                    "shed": self._shed[lane],
+                    "wait": self._wait_stats[lane].snapshot(),
+                }
+                for lane in _LANES
+            },
+        }
+
+    # ── 내부 ──
+
+    def _can_start(self, lane: str) -> bool:
+        return (
+            sum(self._in_flight.values()) < self.max_concurrency
+            and self._in_flight[lane] < self._lane_limits[lane]
+        )
+
+    async def _acquire(self, lane: str) -> None:
+        if lane not in self._waiters:
+            raise ValueError(f"Unknown LLM priority: {lane}")
+        started = time.perf_counter()
+        # 먼저 온 같은/상위 레인 대기자가 없을 때만 바로 실행
+        if self.has_capacity(lane):
+            self._in_flight[lane] += 1
+            self._wait_stats[lane].record(0.0)
+            return
+
+        if len(self._waiters[lane]) >= self._queue_limits[lane]:
+            self._shed[lane] += 1
+            raise SchedulerOverloaded(lane)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[lane].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 배정받은 직후 취소됨 → 다음 대기자에게 넘긴다
+                self._release(lane, completed=False)
+            else:
+                self._waiters[lane].remove(waiter)
+            raise
+        self._wait_stats[lane].record(time.perf_counter() - started)
+
+    def _release(self, lane: str, completed: bool = True) -> None:
+        self._in_flight[lane] -= 1
+        if completed:
+            self._completed[lane] += 1
+        for next_lane in _LANES:
+            waiters = self._waiters[next_lane]
+            while waiters and self._can_start(next_lane):
+                waiter = waiters.popleft()
+                if waiter.done():
+                    continue
+                self._in_flight[next_lane] += 1
+                waiter.set_result(None)
@@ -0,0 +1,57 @@
+import threading
+from collections import deque
+
+
+class LatencyStats:
+    """최근 샘플 윈도우 기반 지연 시간 통계 (스레드 안전)."""
+
+    def __init__(self, window: int = 1024):
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+            self._count += 1
+            self._total += seconds
+            if seconds > self._max:
+                self._max = seconds
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            samples = sorted(self._samples)
+            count, total, peak = self._count, self._total, self._max
+        return {
+            "count": count,
+            "avg_ms": round(total / count * 1000, 3) if count else 0.0,
+            "p50_ms": _percentile_ms(samples, 0.50),
+            "p95_ms": _percentile_ms(samples, 0.95),
+            "p99_ms": _percentile_ms(samples, 0.99),
+            "max_ms": round(peak * 1000, 3),
+        }
+
+
+def _percentile_ms(sorted_samples: list[float], q: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    idx = min(len(sorted_samples) - 1, int(round(q * (len(sorted_samples) - 1))))
+    return round(sorted_samples[idx] * 1000, 3)
+
+
+class Counters:
+    """이름별 누적 카운터 (스레드 안전)."""
+
+    def __init__(self, *names: str):
+        self._values: dict[str, int] = {name: 0 for name in names}
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._values[name] = self._values.get(name, 0) + n
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._values)
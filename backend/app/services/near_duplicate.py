@@ -0,0 +1,135 @@
+import sqlite3
+import threading
+import zlib
+
+import numpy as np
+
+from app.services.text_utils import normalize_text
+
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+class MinHasher:
+    """문자 n-gram(shingle) 집합의 MinHash 서명 계산.
+
+    한국어 VOC는 띄어쓰기/조사 차이가 많아 단어보다 글자 n-gram이 안정적이다.
+    """
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 3, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self._a = rng.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.int64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.int64)
+
+    def signature(self, text: str) -> np.ndarray:
+        text = normalize_text(text)
+        n = self.shingle_size
+        shingles = {text[i:i + n] for i in range(max(1, len(text) - n + 1))}
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) % _MERSENNE_PRIME for s in shingles),
+            dtype=np.int64,
+            count=len(shingles),
+        )
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+
+class NearDuplicateIndex:
+    """MinHash + LSH 밴딩으로 거의 같은 VOC를 찾는 인덱스.
+
+    대표 문서의 서명은 메모리에 두고(시작 시 컬렉션에서 재구성), 대표 문서에
+    합쳐진 문서의 콘텐츠 해시는 SQLite에 남겨 같은 파일을 다시 올려도
+    occurrences가 중복으로 늘지 않게 한다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        threshold: float = 0.85,
+        num_perm: int = 64,
+        bands: int = 16,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self._hasher = MinHasher(num_perm=num_perm)
+        self._bands = bands
+        self._rows = num_perm // bands
+        self._buckets: dict[tuple[int, bytes], set[str]] = {}
+        self._signatures: dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS merged ("
+            " hash TEXT PRIMARY KEY,"
+            " canonical_id TEXT NOT NULL)"
+        )
+        self._db.commit()
+
+    def signature(self, text: str) -> np.ndarray:
+        return self._hasher.signature(text)
+
+    def add(self, doc_id: str, signature: np.ndarray) -> None:
+        with self._lock:
+            self._signatures[doc_id] = signature
+            for key in self._band_keys(signature):
+                self._buckets.setdefault(key, set()).add(doc_id)
+
+    def discard(self, doc_ids: list[str]) -> None:
+        with self._lock:
+            for doc_id in doc_ids:
+                signature = self._signatures.pop(doc_id, None)
+                if signature is None:
+                    continue
+                for key in self._band_keys(signature):
+                    bucket = self._buckets.get(key)
+                    if bucket is not None:
+                        bucket.discard(doc_id)
+                        if not bucket:
+                            del self._buckets[key]
+
+    def find(self, signature: np.ndarray) -> tuple[str, float] | None:
+        """임계값 이상으로 가장 비슷한 대표 문서 (id, 추정 Jaccard)."""
+        with self._lock:
+            candidates: set[str] = set()
+            for key in self._band_keys(signature):
+                candidates |= self._buckets.get(key, set())
+            best: tuple[str, float] | None = None
+            for doc_id in candidates:
+                similarity = float(np.mean(self._signatures[doc_id] == signature))
+                if similarity >= self.threshold and (
+                    best is None or similarity > best[1]
+                ):
+                    best = (doc_id, similarity)
+            return best
+
+    def merged_into(self, content_hash: str) -> str | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT canonical_id FROM merged WHERE hash = ?", (content_hash,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def record_merges(self, merges: dict[str, str]) -> None:
+        """{content_hash: canonical_id}"""
+        if not merges:
+            return
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO merged (hash, canonical_id) VALUES (?, ?)",
+                list(merges.items()),
+            )
+            self._db.commit()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _band_keys(self, signature: np.ndarray):
+        for band in range(self._bands):
+            start = band * self._rows
+            yield band, signature[start:start + self._rows].tobytes()
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from app.services.metrics import LatencyStats
+
+logger = logging.getLogger(__name__)
+
+
+class RagExecutor:
+    """RAG 작업 전용 스레드 풀.
+
+    chromadb 조회와 임베딩 계산은 CPU/IO를 오래 점유하므로 이벤트 루프가 아닌
+    크기가 제한된 전용 풀에서 실행하고, 대기열 길이와 대기 시간을 기록한다.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max(1, max_workers)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="rag"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+        self.wait_time = LatencyStats()
+        self.run_time = LatencyStats()
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        submitted = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+
+        def task():
+            started = time.perf_counter()
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+            self.wait_time.record(started - submitted)
+            ok = False
+            try:
+                result = fn(*args, **kwargs)
+                ok = True
+                return result
+            finally:
+                self.run_time.record(time.perf_counter() - started)
+                with self._lock:
+                    self._active -= 1
+                    if ok:
+                        self._completed += 1
+                    else:
+                        self._failed += 1
+
+        return await loop.run_in_executor(self._pool, task)
+
+    def stats(self) -> dict:
+        with self._lock:
+            queued, active = self._queued, self._active
+            completed, failed = self._completed, self._failed
+        return {
+            "max_workers": self.max_workers,
+            "queue_depth": queued,
+            "active": active,
+            "completed": completed,
+            "failed": failed,
+            "wait": self.wait_time.snapshot(),
+            "run": self.run_time.snapshot(),
+        }
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
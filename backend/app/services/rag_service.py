@@ -1,8 +1,30 @@
+import hashlib
 import logging
-import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import chromadb
+import numpy as np
+from chromadb.api.types import Embedding, EmbeddingFunction
+from chromadb.utils import embedding_functions
+
+from app.services.cache import TTLCache
+from app.services.context_packer import ContextPacker
+from app.services.embedding_cache import EmbeddingCache
+from app.services.lexical_index import BM25Index, reciprocal_rank_fusion
+from app.services.near_duplicate import NearDuplicateIndex
+from app.services.rag_executor import RagExecutor
+from app.services.rag_snapshot import read_snapshot, write_snapshot
+from app.services.text_utils import normalize_text
+from app.services.vector_backend import (
+    BACKEND_CHROMADB,
+    BACKEND_NUMPY,
+    ChromaBackend,
+    NumpyBackend,
+    VectorBackend,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -10,24 +32,127 @@ logger = logging.getLogger(__name__)
 COLLECTION_VOCS = "past_vocs"
 COLLECTION_GUIDES = "guides"
 
+EMBEDDING_CACHE_FILE = "embedding_cache.sqlite3"
+NEAR_DUPLICATE_FILE = "near_duplicates.sqlite3"
+NUMPY_INDEX_DIR = "numpy_index"
+
+# 검색 모드: 벡터 / 벡터+BM25 융합 / BM25 단독 (임베딩 생략)
+SEARCH_MODE_VECTOR = "vector"
+SEARCH_MODE_HYBRID = "hybrid"
+SEARCH_MODE_LEXICAL = "lexical"
+
+
+def content_hash(content: str) -> str:
+    """문서 내용 기반 ID. 같은 내용은 항상 같은 ID가 되어 upsert로 중복을 막는다."""
+    return hashlib.sha256(content.strip().encode("utf-8")).hexdigest()
+
+
+@dataclass
+class IngestReport:
+    ids: list[str] = field(default_factory=list)
+    new: int = 0
+    duplicate: int = 0
+    updated: int = 0
+    embedded: int = 0  # 실제로 임베딩 모델을 돌린 문서 수
+    embedding_cache_hits: int = 0
+    merged: int = 0  # 유사 VOC에 합쳐진(occurrences만 증가) 문서 수
+
+    def merge(self, other: "IngestReport") -> None:
+        self.ids.extend(other.ids)
+        self.new += other.new
+        self.duplicate += other.duplicate
+        self.merged += other.merged
+        self.updated += other.updated
+        self.embedded += other.embedded
+        self.embedding_cache_hits += other.embedding_cache_hits
+
 
 class RagService:
-    def __init__(self, persist_dir: str | None = None):
+    def __init__(
+        self,
+        persist_dir: str | None = None,
+        max_workers: int = 4,
+        embedding_function: EmbeddingFunction | None = None,
+        cache_size: int = 512,
+        cache_ttl_seconds: float = 300.0,
+        search_mode: str = SEARCH_MODE_VECTOR,
+        context_token_budget: int = 1000,
+        context_max_distance: float | None = None,
+        vector_backend: str = BACKEND_CHROMADB,
+        numpy_dtype: str = "int8",
+        near_duplicate_threshold: float = 0.85,
+    ):
         if persist_dir is None:
             persist_dir = str(
                 Path(__file__).parent.parent.parent / "chromadb_data"
             )
-        self._client = chromadb.PersistentClient(path=persist_dir)
-        self._vocs = self._client.get_or_create_collection(
-            name=COLLECTION_VOCS,
-            metadata={"description": "과거 VOC 데이터"},
+        # 쿼리 임베딩을 한 번만 계산해 두 컬렉션에 재사용하기 위해 직접 보관
+        self._embedding_fn = (
+            embedding_function or embedding_functions.DefaultEmbeddingFunction()
+        )
+        Path(persist_dir).mkdir(parents=True, exist_ok=True)
+        self._embedding_cache = EmbeddingCache(
+            str(Path(persist_dir) / EMBEDDING_CACHE_FILE),
+            model=self._embedding_fn.name(),
+        )
+        if vector_backend == BACKEND_NUMPY:
+            numpy_dir = str(Path(persist_dir) / NUMPY_INDEX_DIR)
+            self._vocs: VectorBackend = NumpyBackend(
+                numpy_dir, COLLECTION_VOCS, dtype=numpy_dtype
+            )
+            self._guides: VectorBackend = NumpyBackend(
+                numpy_dir, COLLECTION_GUIDES, dtype=numpy_dtype
+            )
+        elif vector_backend == BACKEND_CHROMADB:
+            client = chromadb.PersistentClient(path=persist_dir)
+            self._vocs = ChromaBackend(
+                client, COLLECTION_VOCS, "과거 VOC 데이터", self._embedding_fn
+            )
+            self._guides = ChromaBackend(
+                client, COLLECTION_GUIDES, "가이드 문서", self._embedding_fn
+            )
+        else:
+            raise ValueError(f"Unknown RAG vector backend: {vector_backend}")
+        self._executor = RagExecutor(max_workers=max_workers)
+        # search_all에서 가이드 조회를 VOC 조회와 병렬로 실행하기 위한 풀
+        self._fanout = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="rag-fanout"
+        )
+        # 검색 결과 캐시. 컬렉션에 문서가 추가될 때마다 세대(generation)를
+        # 올려 키를 바꾸므로 오래된 결과는 조회되지 않고 LRU로 밀려난다.
+        self._cache = TTLCache(max_size=cache_size, ttl_seconds=cache_ttl_seconds)
+        # 같은 메시지를 kNN 분류와 프롬프트 컨텍스트 검색이 각각 임베딩하지 않도록
+        # 최근 쿼리 임베딩을 보관 (검색 결과 캐시는 top_k가 달라 공유되지 않음)
+        self._query_embeddings = TTLCache(
+            max_size=cache_size, ttl_seconds=cache_ttl_seconds
         )
-        self._guides = self._client.get_or_create_collection(
-            name=COLLECTION_GUIDES,
-            metadata={"description": "가이드 문서"},
+        self._generations = {COLLECTION_VOCS: 0, COLLECTION_GUIDES: 0}
+        self._generation_lock = threading.Lock()
+        # 짧고 키워드 위주인 VOC를 임베딩 없이 찾기 위한 BM25 역색인
+        self.search_mode = search_mode
+        self._lexical = {
+            COLLECTION_VOCS: BM25Index(),
+            COLLECTION_GUIDES: BM25Index(),
+        }
+        self._load_lexical_index(self._vocs, self._lexical[COLLECTION_VOCS])
+        self._load_lexical_index(self._guides, self._lexical[COLLECTION_GUIDES])
+        # 거의 같은 VOC는 새 문서로 넣지 않고 대표 문서의 occurrences만 올린다 (0이면 끔)
+        self._near_dup: NearDuplicateIndex | None = None
+        # 유사 중복 조회 → 대표 등록/occurrences 증가 → 병합 기록을 한 단위로 묶는 잠금
+        self._near_dup_lock = threading.Lock()
+        if near_duplicate_threshold > 0:
+            self._near_dup = NearDuplicateIndex(
+                str(Path(persist_dir) / NEAR_DUPLICATE_FILE),
+                threshold=near_duplicate_threshold,
+            )
+            self._load_near_duplicate_index(self._vocs, self._near_dup)
+        self._packer = ContextPacker(
+            token_budget=context_token_budget,
+            max_distance=context_max_distance,
         )
         logger.info(
-            "RAG initialized: vocs=%d, guides=%d",
+            "RAG initialized (%s): vocs=%d, guides=%d",
+            self._vocs.name,
             self._vocs.count(),
             self._guides.count(),
         )
@@ -40,28 +165,32 @@ class RagService:
         metadata: dict | None = None,
         doc_id: str | None = None,
     ) -> str:
-        doc_id = doc_id or str(uuid.uuid4())
-        self._vocs.add(
-            documents=[content],
-            metadatas=[metadata or {}],
-            ids=[doc_id],
+        report = self._ingest(
+            self._vocs,
+            COLLECTION_VOCS,
+            [content],
+            [metadata or {}],
+            ids=[doc_id] if doc_id else None,
         )
-        return doc_id
+        return report.ids[0]
 
     def add_vocs_batch(
         self,
         contents: list[str],
         metadatas: list[dict] | None = None,
-    ) -> list[str]:
-        ids = [str(uuid.uuid4()) for _ in contents]
-        if metadatas is None:
-            metadatas = [{} for _ in contents]
-        self._vocs.add(documents=contents, metadatas=metadatas, ids=ids)
-        return ids
+    ) -> IngestReport:
+        return self._ingest(self._vocs, COLLECTION_VOCS, contents, metadatas)
 
-    def search_vocs(self, query: str, top_k: int = 5) -> list[dict]:
-        results = self._vocs.query(query_texts=[query], n_results=top_k)
-        return self._format_results(results)
+    def search_vocs(
+        self,
+        query: str,
+        top_k: int = 5,
+        query_embedding: Embedding | None = None,
+        mode: str = SEARCH_MODE_VECTOR,
+    ) -> list[dict]:
+        return self._search(
+            self._vocs, COLLECTION_VOCS, query, top_k, query_embedding, mode
+        )
 
     def get_voc_count(self) -> int:
         return self._vocs.count()
@@ -74,42 +203,79 @@ class RagService:
         metadata: dict | None = None,
         doc_id: str | None = None,
     ) -> str:
-        doc_id = doc_id or str(uuid.uuid4())
-        self._guides.add(
-            documents=[content],
-            metadatas=[metadata or {}],
-            ids=[doc_id],
+        report = self._ingest(
+            self._guides,
+            COLLECTION_GUIDES,
+            [content],
+            [metadata or {}],
+            ids=[doc_id] if doc_id else None,
         )
-        return doc_id
+        return report.ids[0]
 
     def add_guides_batch(
         self,
         contents: list[str],
         metadatas: list[dict] | None = None,
-    ) -> list[str]:
-        ids = [str(uuid.uuid4()) for _ in contents]
-        if metadatas is None:
-            metadatas = [{} for _ in contents]
-        self._guides.add(documents=contents, metadatas=metadatas, ids=ids)
-        return ids
+    ) -> IngestReport:
+        return self._ingest(self._guides, COLLECTION_GUIDES, contents, metadatas)
 
-    def search_guides(self, query: str, top_k: int = 5) -> list[dict]:
-        results = self._guides.query(query_texts=[query], n_results=top_k)
-        return self._format_results(results)
+    def search_guides(
+        self,
+        query: str,
+        top_k: int = 5,
+        query_embedding: Embedding | None = None,
+        mode: str = SEARCH_MODE_VECTOR,
+    ) -> list[dict]:
+        return self._search(
+            self._guides, COLLECTION_GUIDES, query, top_k, query_embedding, mode
+        )
 
     def get_guide_count(self) -> int:
         return self._guides.count()
 
     # ── 통합 검색 (VOC + 가이드 동시) ──
 
+    def embed_query(self, query: str) -> Embedding:
+        cached = self._query_embeddings.get(query)
+        if cached is not None:
+            return cached
+        embedding = self._embedding_fn([query])[0]
+        self._query_embeddings.set(query, embedding)
+        return embedding
+
     def search_all(self, query: str, top_k: int = 3) -> dict:
-        vocs = self.search_vocs(query, top_k=top_k)
-        guides = self.search_guides(query, top_k=top_k)
-        return {"vocs": vocs, "guides": guides}
+        cache_key = self._cache_key(query, top_k, self.search_mode)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        results = self._search_all_uncached(query, top_k, self.search_mode)
+        self._cache.set(cache_key, results)
+        return results
 
-    def format_context_for_prompt(self, query: str, top_k: int = 3) -> str:
-        """검색 결과를 AI 프롬프트에 넣을 수 있는 텍스트로 변환"""
+    def _search_all_uncached(self, query: str, top_k: int, mode: str) -> dict:
+        # 임베딩은 한 번만 계산하고, 두 컬렉션 조회는 병렬로 수행
+        embedding = None
+        if mode != SEARCH_MODE_LEXICAL:
+            embedding = self.embed_query(query)
+        guides_future = self._fanout.submit(
+            self.search_guides, query, top_k, embedding, mode
+        )
+        vocs = self.search_vocs(
+            query, top_k=top_k, query_embedding=embedding, mode=mode
+        )
+        return {"vocs": vocs, "guides": guides_future.result()}
+
+    def format_context_for_prompt(
+        self, query: str, top_k: int = 3, token_budget: int | None = None
+    ) -> str:
+        """검색 결과를 토큰 예산 안에서 AI 프롬프트에 넣을 수 있는 텍스트로 변환"""
         results = self.search_all(query, top_k=top_k)
+        return self._format_context(query, results, token_budget)
+
+    def _format_context(
+        self, query: str, results: dict, token_budget: int | None = None
+    ) -> str:
+        results = self._packer.pack(query, results, token_budget=token_budget)
         parts = []
 
         if results["vocs"]:
@@ -118,6 +284,9 @@ class RagService:
                 meta = doc.get("metadata", {})
                 source = meta.get("source", "")
                 label = f" ({source})" if source else ""
+                occurrences = meta.get("occurrences", 1)
+                if occurrences > 1:
+                    label += f" - 유사 접수 {occurrences}건"
                 parts.append(f"[사례 {i}]{label}\n{doc['content']}")
 
         if results["guides"]:
@@ -129,19 +298,423 @@ class RagService:
 
         return "\n\n".join(parts) if parts else ""
 
-    # ── 내부 유틸 ──
+    # ── 비동기 API (전용 스레드 풀에서 실행) ──
+
+    async def aadd_voc(
+        self, content: str, metadata: dict | None = None, doc_id: str | None = None
+    ) -> str:
+        return await self._executor.run(self.add_voc, content, metadata, doc_id)
+
+    async def aadd_guide(
+        self, content: str, metadata: dict | None = None, doc_id: str | None = None
+    ) -> str:
+        return await self._executor.run(self.add_guide, content, metadata, doc_id)
+
+    async def aadd_vocs_batch(
+        self, contents: list[str], metadatas: list[dict] | None = None
+    ) -> IngestReport:
+        return await self._executor.run(self.add_vocs_batch, contents, metadatas)
+
+    async def aadd_guides_batch(
+        self, contents: list[str], metadatas: list[dict] | None = None
+    ) -> IngestReport:
+        return await self._executor.run(self.add_guides_batch, contents, metadatas)
+
+    async def asearch_vocs(
+        self, query: str, top_k: int = 5, mode: str = SEARCH_MODE_VECTOR
+    ) -> list[dict]:
+        return await self._executor.run(
+            self.search_vocs, query, top_k, None, mode
+        )
+
+    async def asearch_guides(
+        self, query: str, top_k: int = 5, mode: str = SEARCH_MODE_VECTOR
+    ) -> list[dict]:
+        return await self._executor.run(
+            self.search_guides, query, top_k, None, mode
+        )
+
+    async def asearch_all(self, query: str, top_k: int = 3) -> dict:
+        # 캐시 적중 시에는 스레드 풀을 거치지 않고 바로 반환
+        cache_key = self._cache_key(query, top_k, self.search_mode)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        results = await self._executor.run(
+            self._search_all_uncached, query, top_k, self.search_mode
+        )
+        self._cache.set(cache_key, results)
+        return results
+
+    async def aformat_context_for_prompt(
+        self, query: str, top_k: int = 3, token_budget: int | None = None
+    ) -> str:
+        results = await self.asearch_all(query, top_k=top_k)
+        return self._format_context(query, results, token_budget)
+
+    async def aexport_snapshot(self, path: str) -> dict:
+        return await self._executor.run(self.export_snapshot, path)
+
+    async def aimport_snapshot(self, path: str) -> dict:
+        return await self._executor.run(self.import_snapshot, path)
+
+    def get_executor_stats(self) -> dict:
+        return self._executor.stats()
+
+    def get_cache_stats(self) -> dict:
+        with self._generation_lock:
+            generations = dict(self._generations)
+        return {
+            **self._cache.stats(),
+            "generations": generations,
+            "query_embeddings": self._query_embeddings.stats(),
+        }
+
+    def get_embedding_cache_stats(self) -> dict:
+        return self._embedding_cache.stats()
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        self._fanout.shutdown(wait=False, cancel_futures=True)
+        self._embedding_cache.close()
+        if self._near_dup is not None:
+            self._near_dup.close()
+        self._vocs.close()
+        self._guides.close()
 
-    def _format_results(self, raw: dict) -> list[dict]:
-        docs = raw.get("documents", [[]])[0]
-        metas = raw.get("metadatas", [[]])[0]
-        dists = raw.get("distances", [[]])[0]
-        ids = raw.get("ids", [[]])[0]
-        return [
-            {
-                "id": ids[i],
-                "content": docs[i],
-                "metadata": metas[i] if i < len(metas) else {},
-                "distance": dists[i] if i < len(dists) else None,
+    # ── 적재 (콘텐츠 해시 ID + 임베딩 재사용) ──
+
+    @property
+    def max_batch_size(self) -> int:
+        return min(self._vocs.max_batch_size, self._guides.max_batch_size)
+
+    def _ingest(
+        self,
+        collection: VectorBackend,
+        collection_name: str,
+        contents: list[str],
+        metadatas: list[dict] | None = None,
+        ids: list[str] | None = None,
+    ) -> IngestReport:
+        if metadatas is None:
+            metadatas = [{} for _ in contents]
+        hashes = [content_hash(c) for c in contents]
+        if ids is None:
+            ids = hashes
+
+        # 백엔드의 최대 배치 크기를 넘지 않도록 나눠서 적재
+        step = collection.max_batch_size
+        report = IngestReport()
+        for start in range(0, len(contents), step):
+            end = start + step
+            report.merge(
+                self._ingest_chunk(
+                    collection,
+                    collection_name,
+                    contents[start:end],
+                    metadatas[start:end],
+                    hashes[start:end],
+                    ids[start:end],
+                )
+            )
+        return report
+
+    def _ingest_chunk(
+        self,
+        collection: VectorBackend,
+        collection_name: str,
+        contents: list[str],
+        metadatas: list[dict],
+        hashes: list[str],
+        ids: list[str],
+    ) -> IngestReport:
+        args = (collection, collection_name, contents, metadatas, hashes, ids)
+        if collection_name == COLLECTION_VOCS and self._near_dup is not None:
+            # 동시에 도는 적재 작업끼리 서로의 유사 중복을 놓치거나 같은 대표 문서의
+            # occurrences를 이중으로 올리지 않도록 VOC 청크는 하나씩 처리한다
+            with self._near_dup_lock:
+                return self._ingest_chunk_unlocked(*args)
+        return self._ingest_chunk_unlocked(*args)
+
+    def _ingest_chunk_unlocked(
+        self,
+        collection: VectorBackend,
+        collection_name: str,
+        contents: list[str],
+        metadatas: list[dict],
+        hashes: list[str],
+        ids: list[str],
+    ) -> IngestReport:
+        report = IngestReport(ids=list(ids))
+
+        # 같은 배치 안의 중복은 첫 항목만 남긴다
+        unique: dict[str, tuple[str, str, dict]] = {}
+        for doc_id, h, content, meta in zip(ids, hashes, contents, metadatas):
+            if doc_id in unique:
+                report.duplicate += 1
+                continue
+            unique[doc_id] = (h, content, meta or {})
+
+        existing_meta = collection.get_metadatas(list(unique))
+
+        new_ids: list[str] = []
+        updated_ids: list[str] = []
+        for doc_id, (_, _, meta) in unique.items():
+            if doc_id not in existing_meta:
+                new_ids.append(doc_id)
+            elif any(existing_meta[doc_id].get(k) != v for k, v in meta.items()):
+                updated_ids.append(doc_id)
+            else:
+                report.duplicate += 1
+
+        lexical = self._lexical[collection_name]
+        aliases: dict[str, str] = {}
+        occurrences: dict[str, int] = {}
+        inherited: dict[str, dict] = {}
+        if collection_name == COLLECTION_VOCS and self._near_dup is not None:
+            new_ids = self._collapse_near_duplicates(
+                unique, new_ids, aliases, occurrences, inherited, report
+            )
+
+        # 메타데이터만 바뀐 문서는 재임베딩 없이 갱신
+        if updated_ids:
+            collection.update_metadatas(
+                updated_ids, [unique[i][2] for i in updated_ids]
+            )
+            for doc_id in updated_ids:
+                lexical.update_metadata(doc_id, unique[doc_id][2])
+            report.updated = len(updated_ids)
+
+        try:
+            if new_ids:
+                embeddings = self._embed_documents(
+                    [unique[i][0] for i in new_ids],
+                    [unique[i][1] for i in new_ids],
+                    report,
+                )
+                collection.upsert(
+                    ids=new_ids,
+                    documents=[unique[i][1] for i in new_ids],
+                    metadatas=[unique[i][2] for i in new_ids],
+                    embeddings=embeddings,
+                )
+                for doc_id in new_ids:
+                    lexical.add(doc_id, unique[doc_id][1], unique[doc_id][2])
+                report.new = len(new_ids)
+        except Exception:
+            # 저장에 실패한 문서가 유사 중복의 대표로 남지 않도록 되돌린다
+            if self._near_dup is not None:
+                self._near_dup.discard(new_ids)
+            raise
+
+        if occurrences:
+            self._apply_occurrences(collection, lexical, occurrences, inherited)
+            self._near_dup.record_merges(
+                {unique[doc_id][0]: canonical for doc_id, canonical in aliases.items()}
+            )
+
+        if new_ids or updated_ids or occurrences:
+            self._bump_generation(collection_name)
+        report.ids = [aliases.get(i, i) for i in report.ids]
+        return report
+
+    def _collapse_near_duplicates(
+        self,
+        unique: dict[str, tuple[str, str, dict]],
+        new_ids: list[str],
+        aliases: dict[str, str],
+        occurrences: dict[str, int],
+        inherited: dict[str, dict],
+        report: IngestReport,
+    ) -> list[str]:
+        """새 VOC 중 기존(또는 같은 배치 앞쪽) VOC와 거의 같은 것을 걸러낸다.
+
+        걸러진 문서는 임베딩/저장하지 않고 aliases에 대표 문서 ID를,
+        occurrences에 대표 문서별 증가분을, inherited에 대표 문서로 넘길
+        메타데이터(템플릿 라벨 등)를 기록한다.
+        """
+        index = self._near_dup
+        kept: list[str] = []
+        for doc_id in new_ids:
+            h, content, meta = unique[doc_id]
+            canonical = index.merged_into(h)
+            if canonical is not None:
+                # 이미 합쳐진 적 있는 문서를 다시 올린 경우: 횟수는 그대로 둔다
+                aliases[doc_id] = canonical
+                report.duplicate += 1
+                continue
+            signature = index.signature(content)
+            match = index.find(signature)
+            if match is None:
+                # 같은 배치의 뒤쪽 문서도 이 문서에 합쳐질 수 있도록 바로 등록
+                index.add(doc_id, signature)
+                kept.append(doc_id)
+                continue
+            aliases[doc_id] = match[0]
+            occurrences[match[0]] = occurrences.get(match[0], 0) + 1
+            inherited.setdefault(match[0], {}).update(meta)
+            report.merged += 1
+        return kept
+
+    def _apply_occurrences(
+        self,
+        collection: VectorBackend,
+        lexical: BM25Index,
+        occurrences: dict[str, int],
+        inherited: dict[str, dict],
+    ) -> None:
+        canonical_ids = list(occurrences)
+        current = collection.get_metadatas(canonical_ids)
+        updates = []
+        for doc_id in canonical_ids:
+            meta = current.get(doc_id) or {}
+            # 대표 문서에 없는 키(확정 티켓의 template_id 등)만 넘겨받는다
+            update = {
+                k: v for k, v in inherited.get(doc_id, {}).items() if k not in meta
             }
-            for i in range(len(docs))
+            update["occurrences"] = meta.get("occurrences", 1) + occurrences[doc_id]
+            updates.append(update)
+        collection.update_metadatas(canonical_ids, updates)
+        for doc_id, update in zip(canonical_ids, updates):
+            lexical.update_metadata(doc_id, update)
+
+    def _embed_documents(
+        self, hashes: list[str], contents: list[str], report: IngestReport
+    ) -> list:
+        cached = self._embedding_cache.get_many(hashes)
+        missing = [
+            (h, c) for h, c in zip(hashes, contents) if h not in cached
         ]
+        if missing:
+            vectors = self._embedding_fn([c for _, c in missing])
+            computed = {h: v for (h, _), v in zip(missing, vectors)}
+            self._embedding_cache.put_many(computed)
+            cached.update(computed)
+        report.embedded += len(missing)
+        report.embedding_cache_hits += len(hashes) - len(missing)
+        return [cached[h] for h in hashes]
+
+    # ── 스냅샷 (재임베딩 없는 백업/복원) ──
+
+    def export_snapshot(self, path: str) -> dict:
+        collections = {}
+        for name, backend in self._collections().items():
+            col: dict = {"ids": [], "documents": [], "metadatas": [], "embeddings": []}
+            for batch in backend.iter_records(include_embeddings=True):
+                col["ids"].extend(batch["ids"])
+                col["documents"].extend(batch["documents"])
+                col["metadatas"].extend(batch["metadatas"])
+                col["embeddings"].append(batch["embeddings"])
+            col["embeddings"] = (
+                np.concatenate(col["embeddings"])
+                if col["embeddings"]
+                else np.zeros((0, 0), dtype=np.float32)
+            )
+            collections[name] = col
+        manifest = write_snapshot(path, self._embedding_fn.name(), collections)
+        logger.info("RAG snapshot exported to %s: %s", path, manifest["collections"])
+        return manifest
+
+    def import_snapshot(self, path: str) -> dict:
+        manifest, collections = read_snapshot(path)
+        model = manifest.get("embedding_model")
+        if model != self._embedding_fn.name():
+            raise ValueError(
+                f"Snapshot embedding model '{model}' does not match "
+                f"'{self._embedding_fn.name()}'"
+            )
+
+        targets = self._collections()
+        imported: dict[str, int] = {}
+        for name, col in collections.items():
+            backend = targets.get(name)
+            if backend is None:
+                logger.warning("Skipping unknown snapshot collection: %s", name)
+                continue
+            lexical = self._lexical[name]
+            step = backend.max_batch_size
+            for start in range(0, len(col["ids"]), step):
+                end = start + step
+                ids = col["ids"][start:end]
+                documents = col["documents"][start:end]
+                metadatas = col["metadatas"][start:end]
+                embeddings = col["embeddings"][start:end]
+                backend.upsert(ids, documents, metadatas, embeddings)
+                # 이후 같은 문서를 다시 적재할 때도 재임베딩하지 않도록 캐시에 채운다
+                self._embedding_cache.put_many(
+                    {content_hash(d): e for d, e in zip(documents, embeddings)}
+                )
+                for doc_id, doc, meta in zip(ids, documents, metadatas):
+                    lexical.add(doc_id, doc, meta)
+                    if name == COLLECTION_VOCS and self._near_dup is not None:
+                        self._near_dup.add(doc_id, self._near_dup.signature(doc))
+            imported[name] = len(col["ids"])
+            self._bump_generation(name)
+
+        logger.info("RAG snapshot imported from %s: %s", path, imported)
+        return {"imported": imported, "manifest": manifest}
+
+    def _collections(self) -> dict[str, VectorBackend]:
+        return {COLLECTION_VOCS: self._vocs, COLLECTION_GUIDES: self._guides}
+
+    # ── 검색 ──
+
+    def _search(
+        self,
+        collection: VectorBackend,
+        collection_name: str,
+        query: str,
+        top_k: int,
+        query_embedding: Embedding | None,
+        mode: str,
+    ) -> list[dict]:
+        lexical = self._lexical[collection_name]
+        if mode == SEARCH_MODE_LEXICAL:
+            return lexical.search(query, top_k=top_k)
+
+        if query_embedding is None:
+            query_embedding = self.embed_query(query)
+        if mode != SEARCH_MODE_HYBRID:
+            return collection.query(query_embedding, top_k)
+
+        # 두 순위를 넉넉히 가져와 RRF로 합친다
+        candidates = top_k * 2
+        return reciprocal_rank_fusion(
+            [
+                collection.query(query_embedding, candidates),
+                lexical.search(query, top_k=candidates),
+            ],
+            top_k=top_k,
+        )
+
+    def _load_lexical_index(
+        self, collection: VectorBackend, index: BM25Index
+    ) -> None:
+        for batch in collection.iter_records():
+            for doc_id, doc, meta in zip(
+                batch["ids"], batch["documents"], batch["metadatas"]
+            ):
+                index.add(doc_id, doc, meta)
+
+    def _load_near_duplicate_index(
+        self, collection: VectorBackend, index: NearDuplicateIndex
+    ) -> None:
+        for batch in collection.iter_records():
+            for doc_id, doc in zip(batch["ids"], batch["documents"]):
+                index.add(doc_id, index.signature(doc))
+
+    # ── 내부 유틸 ──
+
+    def _bump_generation(self, collection: str) -> None:
+        with self._generation_lock:
+            self._generations[collection] += 1
+
+    def _cache_key(self, query: str, top_k: int, mode: str) -> tuple:
+        with self._generation_lock:
+            return (
+                normalize_text(query),
+                top_k,
+                mode,
+                self._generations[COLLECTION_VOCS],
+                self._generations[COLLECTION_GUIDES],
+            )
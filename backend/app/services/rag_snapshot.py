@@ -0,0 +1,102 @@
+"""RAG 컬렉션 스냅샷 파일 형식.
+
+한 파일(.npz, 압축)에 컬렉션별로 열(column) 단위 배열을 담는다.
+문자열 열(ids, documents, metadatas)은 UTF-8 바이트를 이어 붙인 버퍼와
+오프셋 배열로 저장해 고정 폭 유니코드 배열보다 작고 pickle 없이 읽을 수 있다.
+
+    manifest                    JSON (형식 버전, 임베딩 모델, 컬렉션별 건수/차원)
+    {collection}.ids.data/.offsets
+    {collection}.documents.data/.offsets
+    {collection}.metadatas.data/.offsets   (문서별 JSON)
+    {collection}.embeddings     float32 (n, dim)
+"""
+import json
+import zipfile
+from datetime import datetime
+
+import numpy as np
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+def _pack_strings(values: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    encoded = [v.encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return data, offsets
+
+
+def _unpack_strings(data: np.ndarray, offsets: np.ndarray) -> list[str]:
+    raw = data.tobytes()
+    return [
+        raw[offsets[i]:offsets[i + 1]].decode("utf-8")
+        for i in range(len(offsets) - 1)
+    ]
+
+
+def write_snapshot(path: str, embedding_model: str, collections: dict[str, dict]) -> dict:
+    """collections: {name: {"ids", "documents", "metadatas", "embeddings"}}"""
+    arrays: dict[str, np.ndarray] = {}
+    manifest = {
+        "version": SNAPSHOT_FORMAT_VERSION,
+        "created_at": datetime.utcnow().isoformat(),
+        "embedding_model": embedding_model,
+        "collections": {},
+    }
+    for name, col in collections.items():
+        embeddings = np.asarray(col["embeddings"], dtype=np.float32)
+        if embeddings.ndim != 2:
+            embeddings = embeddings.reshape(len(col["ids"]), -1)
+        columns = {
+            "ids": col["ids"],
+            "documents": col["documents"],
+            "metadatas": [
+                json.dumps(m or {}, ensure_ascii=False) for m in col["metadatas"]
+            ],
+        }
+        for column, values in columns.items():
+            data, offsets = _pack_strings(values)
+            arrays[f"{name}.{column}.data"] = data
+            arrays[f"{name}.{column}.offsets"] = offsets
+        arrays[f"{name}.embeddings"] = embeddings
+        manifest["collections"][name] = {
+            "count": len(col["ids"]),
+            "dim": int(embeddings.shape[1]) if len(embeddings) else 0,
+        }
+
+    arrays["manifest"] = np.frombuffer(
+        json.dumps(manifest, ensure_ascii=False).encode("utf-8"), dtype=np.uint8
+    )
+    with open(path, "wb") as f:
+        np.savez_compressed(f, **arrays)
+    return manifest
+
+
+def read_snapshot(path: str) -> tuple[dict, dict[str, dict]]:
+    """스냅샷 파일을 읽는다. 손상되었거나 형식이 맞지 않으면 ValueError."""
+    try:
+        return _read_snapshot(path)
+    except (zipfile.BadZipFile, OSError, EOFError, KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"invalid snapshot: {e}") from e
+
+
+def _read_snapshot(path: str) -> tuple[dict, dict[str, dict]]:
+    with np.load(path, allow_pickle=False) as npz:
+        manifest = json.loads(npz["manifest"].tobytes().decode("utf-8"))
+        if manifest.get("version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot version: {manifest.get('version')}"
+            )
+        collections: dict[str, dict] = {}
+        for name in manifest["collections"]:
+            col = {
+                column: _unpack_strings(
+                    npz[f"{name}.{column}.data"], npz[f"{name}.{column}.offsets"]
+                )
+                for column in ("ids", "documents", "metadatas")
+            }
+            col["metadatas"] = [json.loads(m) for m in col["metadatas"]]
+            col["embeddings"] = npz[f"{name}.embeddings"]
+            collections[name] = col
+    return manifest, collections
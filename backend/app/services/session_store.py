@@ -2,6 +2,15 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
+from app.services.text_utils import estimate_tokens, split_sentences, truncate_to_tokens
+
+# role/구분자 등 메시지당 부가 토큰
+_MESSAGE_OVERHEAD_TOKENS = 4
+# 미리보기를 접을 때 필드 값 하나에 허용하는 토큰 수
+_PREVIEW_VALUE_TOKENS = 30
+# 이전 대화 요약에서 턴 하나에 허용하는 토큰 수
+_SUMMARY_LINE_TOKENS = 40
+
 
 @dataclass
 class ChatSession:
@@ -10,6 +19,7 @@ class ChatSession:
     created_at: datetime = field(default_factory=datetime.utcnow)
     pending_template_id: str | None = None
     pending_fields: dict | None = None
+    pending_voc_text: str | None = None  # 템플릿 매칭에 쓰인 VOC 원문 (확정 시 past_vocs에 저장)
 
     def add_message(
         self, role: str, content: str, msg_type: str = "text", metadata: dict | None = None
@@ -31,6 +41,88 @@ class ChatSession:
             for m in self.messages[-limit:]
         ]
 
+    def history_for_prompt(
+        self,
+        token_budget: int = 1500,
+        max_turn_tokens: int = 400,
+        summarize_older: bool = False,
+    ) -> list[dict]:
+        """토큰 예산 안에서 최근 메시지부터 담은 프롬프트용 대화 이력.
+
+        미리보기(template_preview)는 필드 요약 한 줄로, 티켓 생성 메시지는 티켓 키로
+        접고, 긴 턴은 max_turn_tokens로 자른다. summarize_older면 예산 밖으로 밀려난
+        이전 턴을 턴당 첫 문장만 모은 요약 메시지 하나로 앞에 붙인다
+        (예산의 1/4까지 사용).
+        """
+        summary_budget = token_budget // 4 if summarize_older else 0
+        budget = token_budget - summary_budget
+
+        selected: list[dict] = []
+        used = 0
+        cutoff = len(self.messages)
+        for i in range(len(self.messages) - 1, -1, -1):
+            m = self.messages[i]
+            content = _compact(m, max_turn_tokens)
+            cost = estimate_tokens(content) + _MESSAGE_OVERHEAD_TOKENS
+            if used + cost > budget:
+                if not selected:
+                    # 가장 최근 메시지는 예산에 맞춰 잘라서라도 넣는다
+                    content = truncate_to_tokens(
+                        content, max(budget - _MESSAGE_OVERHEAD_TOKENS, 1)
+                    )
+                    selected.append({"role": m["role"], "content": content})
+                    cutoff = i
+                break
+            selected.append({"role": m["role"], "content": content})
+            used += cost
+            cutoff = i
+        selected.reverse()
+
+        if summarize_older and cutoff > 0:
+            summary = _summarize(self.messages[:cutoff], summary_budget)
+            if summary:
+                selected.insert(
+                    0, {"role": "system", "content": f"이전 대화 요약:\n{summary}"}
+                )
+        return selected
+
+
+def _compact(message: dict, max_turn_tokens: int) -> str:
+    metadata = message.get("metadata") or {}
+    if message.get("type") == "template_preview" and metadata:
+        fields = metadata.get("fields") or {}
+        values = ", ".join(
+            f"{key}={truncate_to_tokens(str(value), _PREVIEW_VALUE_TOKENS)}"
+            for key, value in fields.items()
+            if value
+        )
+        return f"[{metadata.get('template_name', '')} 미리보기] {values}"
+    if message.get("type") == "ticket_created" and metadata:
+        return f"[티켓 생성됨: {metadata.get('ticket_key', '')}]"
+    return truncate_to_tokens(message["content"], max_turn_tokens)
+
+
+def _summarize(messages: list[dict], token_budget: int) -> str:
+    """턴마다 첫 문장(미리보기는 접은 형태)만 남기는 추출 요약. 오래된 턴부터 채운다."""
+    lines: list[str] = []
+    used = 0
+    for m in messages:
+        if m.get("type") in ("template_preview", "ticket_created"):
+            text = _compact(m, _SUMMARY_LINE_TOKENS)
+        else:
+            sentences = split_sentences(m["content"])
+            text = sentences[0] if sentences else ""
+        if not text:
+            continue
+        role = "고객" if m["role"] == "user" else "상담"
+        line = f"- {role}: {truncate_to_tokens(text, _SUMMARY_LINE_TOKENS)}"
+        cost = estimate_tokens(line)
+        if used + cost > token_budget:
+            break
+        lines.append(line)
+        used += cost
+    return "\n".join(lines)
+
 
 class SessionStore:
     def __init__(self, ttl_hours: int = 24):
@@ -39,6 +39,7 @@ class SettingsService:
             "ai_base_url": overrides.get("ai_base_url", self._env.ai_base_url),
             "ai_api_key": overrides.get("ai_api_key", self._env.ai_api_key),
             "ai_model_name": overrides.get("ai_model_name", self._env.ai_model_name),
+            "ai_endpoints": overrides.get("ai_endpoints", self._env.ai_endpoints),
             "jira_base_url": overrides.get("jira_base_url", self._env.jira_base_url),
             "jira_user_email": overrides.get("jira_user_email", self._env.jira_user_email),
             "jira_api_token": overrides.get("jira_api_token", self._env.jira_api_token),
@@ -0,0 +1,103 @@
+from app.schemas.template import JiraTemplate, TemplateField
+
+
+def fields_json_schema(template: JiraTemplate, partial: bool = False) -> dict:
+    """템플릿 필드 정의를 JSON Schema로 변환 (structured output 요청용).
+
+    partial이면 필수 필드 없이 일부 필드만 담은 객체를 허용한다 (변경분 추출용).
+    """
+    properties = {field.key: _field_schema(field) for field in template.fields}
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": [] if partial else [f.key for f in template.fields if f.required],
+        "additionalProperties": False,
+    }
+
+
+def validate_fields(
+    template: JiraTemplate, fields: dict, fill_defaults: bool = True
+) -> tuple[dict, int]:
+    """추출된 필드를 템플릿 정의에 맞게 정리. (정리된 필드, 수정 건수)를 반환.
+
+    - 템플릿에 없는 key는 버림
+    - select/multiselect는 options에 있는 값만 남김 (대소문자 무시로 맞춤)
+    - number는 숫자로, 나머지는 문자열로 변환
+    - 값이 없으면 default가 있을 때 default로 채움 (fill_defaults=False면 생략)
+    """
+    cleaned: dict = {}
+    fixes = sum(1 for key in fields if key not in {f.key for f in template.fields})
+    for field in template.fields:
+        if field.key not in fields:
+            if fill_defaults and field.default is not None:
+                cleaned[field.key] = field.default
+            continue
+        raw = fields[field.key]
+        value = _coerce(field, raw)
+        if value is None:
+            fixes += 1
+            if fill_defaults and field.default is not None:
+                cleaned[field.key] = field.default
+            continue
+        if value != raw:
+            fixes += 1
+        cleaned[field.key] = value
+    return cleaned, fixes
+
+
+def _field_schema(field: TemplateField) -> dict:
+    if field.type == "number":
+        return {"type": "number"}
+    if field.type == "multiselect":
+        items: dict = {"type": "string"}
+        if field.options:
+            items["enum"] = field.options
+        return {"type": "array", "items": items}
+    if field.type == "select" and field.options:
+        return {"type": "string", "enum": field.options}
+    return {"type": "string"}
+
+
+def _coerce(field: TemplateField, value):
+    if value is None or value == "":
+        return None
+    if field.type == "number":
+        if isinstance(value, bool):
+            return None
+        if isinstance(value, (int, float)):
+            return value
+        try:
+            number = float(str(value).replace(",", "").strip())
+        except ValueError:
+            return None
+        return int(number) if number.is_integer() else number
+    if field.type == "multiselect":
+        items = value if isinstance(value, list) else str(value).split(",")
+        selected = []
+        for item in items:
+            option = _match_option(field, str(item).strip())
+            if option and option not in selected:
+                selected.append(option)
+        return selected or None
+    if isinstance(value, (list, dict)):
+        return None if field.type == "select" else _to_text(value)
+    if field.type == "select":
+        return _match_option(field, str(value).strip())
+    return str(value)
+
+
+def _match_option(field: TemplateField, value: str) -> str | None:
+    if not value:
+        return None
+    if not field.options:
+        return value
+    for option in field.options:
+        if option.casefold() == value.casefold():
+            return option
+    return None
+
+
+def _to_text(value) -> str:
+    if isinstance(value, list):
+        return "\n".join(str(v) for v in value)
+    return "\n".join(f"{k}: {v}" for k, v in value.items())
@@ -1,9 +1,12 @@
+import hashlib
+import json
 import os
 from pathlib import Path
 
 import yaml
 
 from app.schemas.template import JiraTemplate, TemplateSummary
+from app.services.keyword_matcher import KeywordMatcher
 
 
 class TemplateService:
@@ -14,17 +17,31 @@ class TemplateService:
             )
         self._templates_dir = templates_dir
         self._templates: dict[str, JiraTemplate] = {}
+        self.version = ""
+        self.keyword_matcher = KeywordMatcher({})
         self._load_templates()
 
     def _load_templates(self):
-        for filename in os.listdir(self._templates_dir):
+        templates: dict[str, JiraTemplate] = {}
+        for filename in sorted(os.listdir(self._templates_dir)):
             if filename.startswith("_") or not filename.endswith(".yaml"):
                 continue
             filepath = os.path.join(self._templates_dir, filename)
             with open(filepath, "r", encoding="utf-8") as f:
                 data = yaml.safe_load(f)
             template = JiraTemplate(**data)
-            self._templates[template.id] = template
+            templates[template.id] = template
+        self._templates = templates
+        # 템플릿 정의 전체의 해시. 분류 결과 캐시 키에 포함되어 템플릿이 바뀌면 무효화된다
+        canonical = json.dumps(
+            [t.model_dump() for t in templates.values()],
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        self.version = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+        self.keyword_matcher = KeywordMatcher(
+            {t.id: t.keywords for t in templates.values()}
+        )
 
     def get_all_templates(self) -> list[JiraTemplate]:
         return list(self._templates.values())
@@ -54,6 +71,15 @@ class TemplateService:
             )
         return "\n".join(lines)
 
+    def get_all_fields_definition_text(self) -> str:
+        """모든 템플릿의 필드 정의 (분류+추출 통합 프롬프트용)"""
+        sections = []
+        for t in self._templates.values():
+            sections.append(
+                f"[{t.id}] {t.name}\n{self.get_fields_definition_text(t)}"
+            )
+        return "\n\n".join(sections)
+
     def get_fields_definition_text(self, template: JiraTemplate) -> str:
         lines = []
         for field in template.fields:
@@ -0,0 +1,54 @@
+import re
+import unicodedata
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 정규화: 유니코드 정규화, 대소문자/문장부호/공백 차이 제거."""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = "".join(
+        " " if unicodedata.category(ch).startswith("P") else ch for ch in text
+    )
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?。])\s+|\n+")
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 쓰는 대략적인 토큰 수 추정.
+
+    한글 등 비 ASCII 문자는 글자당 1토큰, ASCII는 4글자당 1토큰으로 계산한다.
+    BPE 계열 토크나이저에서 한국어는 보통 이보다 적게 나오므로 예산 관리에는
+    보수적인(큰) 값이 된다.
+    """
+    ascii_chars = 0
+    other_chars = 0
+    for ch in text:
+        if ch.isspace():
+            continue
+        if ord(ch) < 128:
+            ascii_chars += 1
+        else:
+            other_chars += 1
+    return other_chars + (ascii_chars + 3) // 4
+
+
+def split_sentences(text: str) -> list[str]:
+    return [s.strip() for s in _SENTENCE_RE.split(text) if s and s.strip()]
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """estimate_tokens 기준으로 max_tokens를 넘지 않게 앞부분만 남긴다."""
+    ascii_chars = 0
+    other_chars = 0
+    for i, ch in enumerate(text):
+        if not ch.isspace():
+            if ord(ch) < 128:
+                ascii_chars += 1
+            else:
+                other_chars += 1
+        if other_chars + (ascii_chars + 3) // 4 > max_tokens:
+            return text[:i].rstrip() + " …"
+    return text
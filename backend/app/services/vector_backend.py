@@ -0,0 +1,403 @@
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Iterator
+
+import chromadb
+import numpy as np
+from chromadb.api.types import EmbeddingFunction
+
+BACKEND_CHROMADB = "chromadb"
+BACKEND_NUMPY = "numpy"
+
+# 한 번에 float32로 복원해 내적을 계산할 행 수 (임시 메모리 상한)
+_QUERY_BLOCK_ROWS = 8192
+_INITIAL_CAPACITY = 1024
+
+
+class VectorBackend(ABC):
+    """RagService가 사용하는 벡터 저장소 인터페이스.
+
+    임베딩은 항상 RagService가 계산해 넘기므로 백엔드는 저장과 top-k 조회만 담당한다.
+    distance는 chromadb 기본값과 같은 제곱 L2 거리다.
+    """
+
+    name: str
+
+    @property
+    @abstractmethod
+    def max_batch_size(self) -> int: ...
+
+    @abstractmethod
+    def count(self) -> int: ...
+
+    @abstractmethod
+    def get_metadatas(self, ids: list[str]) -> dict[str, dict]:
+        """존재하는 ID만 {id: metadata}로 반환."""
+
+    @abstractmethod
+    def upsert(
+        self,
+        ids: list[str],
+        documents: list[str],
+        metadatas: list[dict],
+        embeddings: list,
+    ) -> None: ...
+
+    @abstractmethod
+    def update_metadatas(self, ids: list[str], metadatas: list[dict]) -> None:
+        """기존 메타데이터에 병합."""
+
+    @abstractmethod
+    def query(self, embedding, top_k: int) -> list[dict]: ...
+
+    @abstractmethod
+    def iter_records(
+        self, batch_size: int = 1000, include_embeddings: bool = False
+    ) -> Iterator[dict]:
+        """{"ids", "documents", "metadatas"[, "embeddings"]} 배치를 순회."""
+
+    def close(self) -> None:
+        pass
+
+
+class ChromaBackend(VectorBackend):
+    name = BACKEND_CHROMADB
+
+    def __init__(
+        self,
+        client: chromadb.ClientAPI,
+        collection_name: str,
+        description: str,
+        embedding_function: EmbeddingFunction,
+    ):
+        self._client = client
+        self._collection = client.get_or_create_collection(
+            name=collection_name,
+            metadata={"description": description},
+            embedding_function=embedding_function,
+        )
+
+    @property
+    def max_batch_size(self) -> int:
+        return self._client.get_max_batch_size()
+
+    def count(self) -> int:
+        return self._collection.count()
+
+    def get_metadatas(self, ids: list[str]) -> dict[str, dict]:
+        existing = self._collection.get(ids=ids, include=["metadatas"])
+        return {
+            doc_id: meta or {}
+            for doc_id, meta in zip(existing["ids"], existing["metadatas"])
+        }
+
+    def upsert(self, ids, documents, metadatas, embeddings) -> None:
+        self._collection.upsert(
+            ids=ids,
+            documents=documents,
+            # chromadb는 빈 dict 메타데이터를 허용하지 않는다
+            metadatas=[m or None for m in metadatas],
+            embeddings=embeddings,
+        )
+
+    def update_metadatas(self, ids, metadatas) -> None:
+        self._collection.update(ids=ids, metadatas=metadatas)
+
+    def query(self, embedding, top_k: int) -> list[dict]:
+        raw = self._collection.query(query_embeddings=[embedding], n_results=top_k)
+        docs = raw.get("documents", [[]])[0]
+        metas = raw.get("metadatas", [[]])[0]
+        dists = raw.get("distances", [[]])[0]
+        ids = raw.get("ids", [[]])[0]
+        return [
+            {
+                "id": ids[i],
+                "content": docs[i],
+                "metadata": (metas[i] if i < len(metas) else None) or {},
+                "distance": dists[i] if i < len(dists) else None,
+            }
+            for i in range(len(docs))
+        ]
+
+    def iter_records(self, batch_size=1000, include_embeddings=False):
+        include = ["documents", "metadatas"]
+        if include_embeddings:
+            include.append("embeddings")
+        offset = 0
+        while True:
+            batch = self._collection.get(
+                include=include, limit=batch_size, offset=offset
+            )
+            if not batch["ids"]:
+                return
+            record = {
+                "ids": batch["ids"],
+                "documents": [d or "" for d in batch["documents"]],
+                "metadatas": [m or {} for m in batch["metadatas"]],
+            }
+            if include_embeddings:
+                record["embeddings"] = np.asarray(batch["embeddings"], dtype=np.float32)
+            yield record
+            offset += len(batch["ids"])
+
+
+class NumpyBackend(VectorBackend):
+    """프로세스 내 NumPy 인덱스.
+
+    임베딩은 float16 또는 int8(행 단위 스케일)로 양자화해 memory-mapped 파일에
+    저장하고, 조회는 블록 단위 행렬곱 + argpartition으로 정확한 top-k를 구한다.
+    문서/메타데이터는 같은 디렉터리의 SQLite에 보관한다.
+    """
+
+    name = BACKEND_NUMPY
+
+    def __init__(self, directory: str, collection_name: str, dtype: str = "float16"):
+        if dtype not in ("float16", "int8", "float32"):
+            raise ValueError(f"Unsupported numpy backend dtype: {dtype}")
+        base = Path(directory)
+        base.mkdir(parents=True, exist_ok=True)
+        # 저장 형식별로 파일을 분리해 dtype을 바꿔도 기존 인덱스와 섞이지 않게 한다
+        self._vectors_path = base / f"{collection_name}.{dtype}.vectors"
+        self._dtype = np.dtype(dtype)
+        self._lock = threading.Lock()
+
+        self._db = sqlite3.connect(
+            str(base / f"{collection_name}.{dtype}.sqlite3"), check_same_thread=False
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS docs ("
+            " row INTEGER PRIMARY KEY,"
+            " id TEXT UNIQUE NOT NULL,"
+            " document TEXT NOT NULL,"
+            " metadata TEXT NOT NULL,"
+            " scale REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        self._db.commit()
+
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'dim'").fetchone()
+        self._dim = int(row[0]) if row else 0
+        self._row_of: dict[str, int] = dict(
+            self._db.execute("SELECT id, row FROM docs")
+        )
+        self._size = len(self._row_of)
+
+        self._vectors: np.memmap | None = None
+        self._scales = np.ones(self._size, dtype=np.float32)
+        self._sq_norms = np.zeros(self._size, dtype=np.float32)
+        if self._dim:
+            self._open_vectors(max(self._size, _INITIAL_CAPACITY))
+            for r, scale in self._db.execute("SELECT row, scale FROM docs"):
+                self._scales[r] = scale
+            self._recompute_norms(0, self._size)
+
+    @property
+    def max_batch_size(self) -> int:
+        return 5000
+
+    def count(self) -> int:
+        return self._size
+
+    def get_metadatas(self, ids: list[str]) -> dict[str, dict]:
+        found: dict[str, dict] = {}
+        with self._lock:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for doc_id, meta in self._db.execute(
+                    f"SELECT id, metadata FROM docs WHERE id IN ({placeholders})",
+                    chunk,
+                ):
+                    found[doc_id] = json.loads(meta)
+        return found
+
+    def upsert(self, ids, documents, metadatas, embeddings) -> None:
+        if not ids:
+            return
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        with self._lock:
+            if not self._dim:
+                self._dim = matrix.shape[1]
+                self._db.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('dim', ?)",
+                    (str(self._dim),),
+                )
+                self._open_vectors(_INITIAL_CAPACITY)
+            if matrix.shape[1] != self._dim:
+                raise ValueError(
+                    f"Embedding dimension {matrix.shape[1]} != index dimension {self._dim}"
+                )
+
+            rows = []
+            for doc_id in ids:
+                r = self._row_of.get(doc_id)
+                if r is None:
+                    r = self._size
+                    self._size += 1
+                    self._row_of[doc_id] = r
+                rows.append(r)
+            self._ensure_capacity(self._size)
+
+            quantized, scales = self._quantize(matrix)
+            row_idx = np.asarray(rows)
+            self._vectors[row_idx] = quantized
+            self._vectors.flush()
+            self._scales[row_idx] = scales
+            self._sq_norms[row_idx] = np.einsum("ij,ij->i", matrix, matrix)
+
+            self._db.executemany(
+                "INSERT OR REPLACE INTO docs (row, id, document, metadata, scale)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [
+                    (r, doc_id, doc, json.dumps(meta or {}, ensure_ascii=False), float(s))
+                    for r, doc_id, doc, meta, s in zip(
+                        rows, ids, documents, metadatas, scales
+                    )
+                ],
+            )
+            self._db.commit()
+
+    def update_metadatas(self, ids, metadatas) -> None:
+        current = self.get_metadatas(ids)
+        with self._lock:
+            self._db.executemany(
+                "UPDATE docs SET metadata = ? WHERE id = ?",
+                [
+                    (json.dumps({**current[i], **m}, ensure_ascii=False), i)
+                    for i, m in zip(ids, metadatas)
+                    if i in current
+                ],
+            )
+            self._db.commit()
+
+    def query(self, embedding, top_k: int) -> list[dict]:
+        with self._lock:
+            n = self._size
+        if n == 0 or self._vectors is None or top_k <= 0:
+            return []
+
+        q = np.asarray(embedding, dtype=np.float32)
+        dots = np.empty(n, dtype=np.float32)
+        scales = np.empty(n, dtype=np.float32)
+        sq_norms = np.empty(n, dtype=np.float32)
+        buf = np.empty((min(n, _QUERY_BLOCK_ROWS), self._dim), dtype=np.float32)
+        for start in range(0, n, _QUERY_BLOCK_ROWS):
+            end = min(start + _QUERY_BLOCK_ROWS, n)
+            block = buf[: end - start]
+            # upsert는 기존 행의 벡터/스케일/노름을 제자리에서 바꾸므로 세 값을
+            # 같은 잠금 안에서 복사해야 한 행의 값이 서로 다른 버전으로 섞이지 않는다
+            with self._lock:
+                np.copyto(block, self._vectors[start:end], casting="unsafe")
+                scales[start:end] = self._scales[start:end]
+                sq_norms[start:end] = self._sq_norms[start:end]
+            np.matmul(block, q, out=dots[start:end])
+        dots *= scales
+        dists = sq_norms + float(q @ q) - 2.0 * dots
+
+        k = min(top_k, n)
+        best = np.argpartition(dists, k - 1)[:k]
+        best = best[np.argsort(dists[best])]
+        return self._fetch_rows([int(r) for r in best], dists)
+
+    def iter_records(self, batch_size=1000, include_embeddings=False):
+        last_row = -1
+        while True:
+            with self._lock:
+                rows = self._db.execute(
+                    "SELECT row, id, document, metadata FROM docs"
+                    " WHERE row > ? ORDER BY row LIMIT ?",
+                    (last_row, batch_size),
+                ).fetchall()
+                if not rows:
+                    return
+                record = {
+                    "ids": [r[1] for r in rows],
+                    "documents": [r[2] for r in rows],
+                    "metadatas": [json.loads(r[3]) for r in rows],
+                }
+                if include_embeddings:
+                    idx = np.asarray([r[0] for r in rows])
+                    record["embeddings"] = (
+                        np.asarray(self._vectors[idx], dtype=np.float32)
+                        * self._scales[idx][:, None]
+                    )
+            last_row = rows[-1][0]
+            yield record
+
+    def close(self) -> None:
+        with self._lock:
+            if self._vectors is not None:
+                self._vectors.flush()
+            self._db.close()
+
+    # ── 내부 ──
+
+    def _quantize(self, matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if self._dtype == np.int8:
+            scales = np.abs(matrix).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            quantized = np.round(matrix / scales[:, None]).astype(np.int8)
+            return quantized, scales.astype(np.float32)
+        return matrix.astype(self._dtype), np.ones(len(matrix), dtype=np.float32)
+
+    def _open_vectors(self, capacity: int) -> None:
+        shape = (capacity, self._dim)
+        nbytes = capacity * self._dim * self._dtype.itemsize
+        mode = "r+"
+        if not self._vectors_path.exists():
+            mode = "w+"
+        elif self._vectors_path.stat().st_size < nbytes:
+            with open(self._vectors_path, "r+b") as f:
+                f.truncate(nbytes)
+        self._vectors = np.memmap(
+            self._vectors_path, dtype=self._dtype, mode=mode, shape=shape
+        )
+        if len(self._scales) < capacity:
+            self._scales = np.resize(self._scales, capacity)
+            self._scales[self._size:] = 1.0
+            self._sq_norms = np.resize(self._sq_norms, capacity)
+
+    def _ensure_capacity(self, size: int) -> None:
+        capacity = self._vectors.shape[0]
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        self._vectors.flush()
+        self._open_vectors(capacity)
+
+    def _recompute_norms(self, start: int, end: int) -> None:
+        for s in range(start, end, _QUERY_BLOCK_ROWS):
+            e = min(s + _QUERY_BLOCK_ROWS, end)
+            block = np.asarray(self._vectors[s:e], dtype=np.float32)
+            block *= self._scales[s:e, None]
+            self._sq_norms[s:e] = np.einsum("ij,ij->i", block, block)
+
+    def _fetch_rows(self, rows: list[int], dists: np.ndarray) -> list[dict]:
+        if not rows:
+            return []
+        with self._lock:
+            placeholders = ",".join("?" * len(rows))
+            fetched = {
+                r: (doc_id, doc, meta)
+                for r, doc_id, doc, meta in self._db.execute(
+                    f"SELECT row, id, document, metadata FROM docs"
+                    f" WHERE row IN ({placeholders})",
+                    rows,
+                )
+            }
+        return [
+            {
+                "id": fetched[r][0],
+                "content": fetched[r][1],
+                "metadata": json.loads(fetched[r][2]),
+                "distance": float(dists[r]),
+            }
+            for r in rows
+            if r in fetched
+        ]
@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.services.metrics import Counters, LatencyStats
+
+logger = logging.getLogger(__name__)
+
+# submit 결과
+SUBMIT_QUEUED = "queued"
+SUBMIT_DUPLICATE = "duplicate"
+SUBMIT_FULL = "full"
+
+
+@dataclass
+class WebhookJob:
+    issue_key: str
+    event_id: str
+    enqueued_at: float  # time.time()
+    row_id: int | None = None  # 영구 대기열의 행 ID
+    attempts: int = 0
+
+
+class _JobStore:
+    """대기 중인 작업을 SQLite에 보관해 재시작 후 이어서 처리."""
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS webhook_jobs ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " issue_key TEXT NOT NULL,"
+            " event_id TEXT NOT NULL,"
+            " enqueued_at REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def add(self, job: WebhookJob) -> int:
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT INTO webhook_jobs (issue_key, event_id, enqueued_at) VALUES (?, ?, ?)",
+                (job.issue_key, job.event_id, job.enqueued_at),
+            )
+            self._db.commit()
+            return cursor.lastrowid
+
+    def remove(self, row_id: int) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM webhook_jobs WHERE id = ?", (row_id,))
+            self._db.commit()
+
+    def pending(self) -> list[WebhookJob]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, issue_key, event_id, enqueued_at FROM webhook_jobs ORDER BY id"
+            ).fetchall()
+        return [WebhookJob(key, event, at, row_id) for row_id, key, event, at in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class WebhookQueue:
+    """Jira 웹훅 작업을 받아 즉시 응답하고 워커 풀이 백그라운드에서 처리.
+
+    - 대기열이 max_size만큼 차면 거절 (호출 측이 503으로 응답해 Jira가 재전송)
+    - 같은 이벤트 ID, 또는 대기/처리 중이거나 dedupe_ttl_seconds 안에 처리를
+      마친 이슈 키는 중복으로 보고 버린다 (Jira 재전송으로 인한 중복 분석 방지)
+    - retry_on 예외(LLM 과부하 등)는 max_attempts까지 간격을 늘려 재시도
+    - path를 주면 대기 중인 작업을 SQLite에 보관하고 start() 때 다시 넣는다
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[str], Awaitable[None]],
+        workers: int = 2,
+        max_size: int = 500,
+        dedupe_ttl_seconds: float = 3600.0,
+        max_attempts: int = 3,
+        retry_delay_seconds: float = 5.0,
+        retry_on: tuple[type[BaseException], ...] = (),
+        path: str | None = None,
+    ):
+        self._handler = handler
+        self._num_workers = max(1, workers)
+        self.max_size = max_size
+        self.dedupe_ttl_seconds = dedupe_ttl_seconds
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay_seconds = retry_delay_seconds
+        self._retry_on = retry_on
+        self._store = _JobStore(path) if path else None
+        self._queue: asyncio.Queue[WebhookJob] = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+        # 처리 중/최근 처리한 dedupe 키 → 만료 시각 (None이면 대기/처리 중)
+        self._recent: OrderedDict[str, float | None] = OrderedDict()
+        self._in_flight = 0
+        self._counters = Counters(
+            "received", "queued", "duplicate", "rejected", "succeeded", "failed", "retried"
+        )
+        self._wait = LatencyStats()
+        self._processing = LatencyStats()
+
+    async def start(self) -> None:
+        """워커를 띄우고, 영구 대기열에 남은 작업이 있으면 다시 넣는다."""
+        if self._store is not None and not self._workers:
+            restored = self._store.pending()
+            for job in restored:
+                self._mark_pending(job)
+                self._queue.put_nowait(job)
+            if restored:
+                logger.info("Restored %d pending webhook jobs", len(restored))
+        self._ensure_workers()
+
+    def submit(self, issue_key: str, event_id: str = "") -> str:
+        self._counters.incr("received")
+        self._prune()
+        keys = self._dedupe_keys(issue_key, event_id)
+        if any(key in self._recent for key in keys):
+            self._counters.incr("duplicate")
+            return SUBMIT_DUPLICATE
+        if self._queue.qsize() >= self.max_size:
+            self._counters.incr("rejected")
+            return SUBMIT_FULL
+
+        job = WebhookJob(issue_key, event_id, time.time())
+        if self._store is not None:
+            job.row_id = self._store.add(job)
+        self._mark_pending(job)
+        self._queue.put_nowait(job)
+        self._counters.incr("queued")
+        self._ensure_workers()
+        return SUBMIT_QUEUED
+
+    def stats(self) -> dict:
+        return {
+            "workers": self._num_workers,
+            "depth": self._queue.qsize(),
+            "max_size": self.max_size,
+            "in_flight": self._in_flight,
+            "persistent": self._store is not None,
+            **self._counters.snapshot(),
+            "queue_wait": self._wait.snapshot(),
+            "processing": self._processing.snapshot(),
+        }
+
+    async def close(self) -> None:
+        """워커를 멈춘다. 영구 대기열의 미처리 작업은 다음 start()에서 이어진다."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._store is not None:
+            self._store.close()
+
+    # ── 내부 ──
+
+    @staticmethod
+    def _dedupe_keys(issue_key: str, event_id: str) -> list[str]:
+        keys = [f"issue:{issue_key}"]
+        if event_id:
+            keys.append(f"event:{event_id}")
+        return keys
+
+    def _mark_pending(self, job: WebhookJob) -> None:
+        for key in self._dedupe_keys(job.issue_key, job.event_id):
+            self._recent[key] = None
+            self._recent.move_to_end(key)
+
+    def _finish(self, job: WebhookJob, succeeded: bool) -> None:
+        expires_at = time.monotonic() + self.dedupe_ttl_seconds
+        for key in self._dedupe_keys(job.issue_key, job.event_id):
+            if succeeded:
+                # 처리 완료 시각 순으로 두어 _prune이 앞에서부터 지울 수 있게 한다
+                self._recent[key] = expires_at
+                self._recent.move_to_end(key)
+            else:
+                # 실패한 이슈는 Jira 재전송 등으로 다시 받을 수 있게 한다
+                self._recent.pop(key, None)
+        if self._store is not None and job.row_id is not None:
+            self._store.remove(job.row_id)
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for key, expires_at in list(self._recent.items()):
+            if expires_at is None:
+                continue
+            if expires_at > now:
+                break
+            del self._recent[key]
+
+    def _ensure_workers(self) -> None:
+        self._workers = [task for task in self._workers if not task.done()]
+        while len(self._workers) < self._num_workers:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            self._in_flight += 1
+            self._wait.record(max(0.0, time.time() - job.enqueued_at))
+            started = time.perf_counter()
+            try:
+                succeeded = await self._process(job)
+            finally:
+                self._in_flight -= 1
+                self._queue.task_done()
+            self._processing.record(time.perf_counter() - started)
+            self._finish(job, succeeded)
+
+    async def _process(self, job: WebhookJob) -> bool:
+        while True:
+            job.attempts += 1
+            try:
+                await self._handler(job.issue_key)
+            except self._retry_on as e:
+                if job.attempts >= self.max_attempts:
+                    logger.warning(
+                        "Gave up webhook analysis of %s after %d attempts: %s",
+                        job.issue_key, job.attempts, e,
+                    )
+                    self._counters.incr("failed")
+                    return False
+                self._counters.incr("retried")
+                await asyncio.sleep(self.retry_delay_seconds * job.attempts)
+            except Exception:
+                logger.exception("Failed to analyze ticket %s", job.issue_key)
+                self._counters.incr("failed")
+                return False
+            else:
+                self._counters.incr("succeeded")
+                return True
@@ -0,0 +1,112 @@
+"""첫 메시지 처리 지연 시간 비교 (two_step vs combined).
+
+사용법 (backend 디렉터리에서, .env의 AI_* 설정으로 실제 LLM 호출):
+    python -m benchmarks.chat_modes --vocs vocs.txt --repeat 3
+
+--vocs를 생략하면 내장 예시 VOC를 사용한다. RAG는 빈 임시 컬렉션으로
+실행해 LLM 호출 지연만 비교한다. 모드별로 LLM 호출 수와 combined 모드에서
+two_step으로 재시도한 비율(fallback)도 함께 출력한다.
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+import uuid
+
+from app.config import Settings
+from app.services.ai_service import CLASSIFY_MODE_COMBINED, CLASSIFY_MODE_TWO_STEP, AIService
+from app.services.chat_service import ChatService
+from app.services.jira_service import JiraService
+from app.services.metrics import LatencyStats
+from app.services.rag_service import RagService
+from app.services.session_store import SessionStore
+from app.services.template_service import TemplateService
+
+_SAMPLE_VOCS = [
+    "앱에서 로그인 버튼을 누르면 화면이 하얗게 멈춥니다. 아이폰 15, iOS 17.4입니다.",
+    "결제 완료 후에도 주문 내역에 표시되지 않아요. 카드 승인 문자는 받았습니다.",
+    "엑셀로 주문 목록을 내려받는 기능이 있으면 좋겠습니다.",
+    "회원 탈퇴를 요청합니다. 계정 이메일은 test@example.com 입니다.",
+    "검색 결과가 너무 느리게 떠요. 10초 넘게 걸립니다.",
+]
+
+
+class _CallCounter:
+    """LLM 호출 수와 combined 결과가 버려진(two_step 재시도) 횟수 집계."""
+
+    def __init__(self, ai: AIService):
+        self.calls = 0
+        self.fallbacks = 0
+        self._create = ai._create_completion
+        self._combined = ai.classify_and_extract
+        ai._create_completion = self._counted_create
+        ai.classify_and_extract = self._counted_combined
+
+    async def _counted_create(self, *args, **kwargs):
+        self.calls += 1
+        return await self._create(*args, **kwargs)
+
+    async def _counted_combined(self, *args, **kwargs):
+        result = await self._combined(*args, **kwargs)
+        self.fallbacks += result is None
+        return result
+
+
+async def _run_mode(
+    mode: str, settings: Settings, templates: TemplateService, rag: RagService,
+    vocs: list[str], repeat: int,
+) -> None:
+    ai = AIService(
+        settings.model_copy(update={"ai_classify_mode": mode}), templates, rag
+    )
+    counter = _CallCounter(ai)
+    jira = JiraService(settings)
+    chat = ChatService(ai, templates, jira, SessionStore())
+    stats = LatencyStats(window=len(vocs) * repeat)
+    previews = 0
+    for _ in range(repeat):
+        for voc in vocs:
+            t0 = time.perf_counter()
+            response = await chat.handle_message(str(uuid.uuid4()), voc)
+            stats.record(time.perf_counter() - t0)
+            previews += response.type == "template_preview"
+    await jira.close()
+
+    snap = stats.snapshot()
+    requests = snap["count"]
+    fallback = ""
+    if mode == CLASSIFY_MODE_COMBINED:
+        fallback = f" fallback={counter.fallbacks}/{requests}"
+    print(
+        f"{mode:9s} avg={snap['avg_ms']:9.1f}ms p50={snap['p50_ms']:9.1f}ms "
+        f"p95={snap['p95_ms']:9.1f}ms calls/msg={counter.calls / max(requests, 1):.2f} "
+        f"previews={previews}/{requests}{fallback}"
+    )
+
+
+async def _main(args) -> None:
+    settings = Settings()
+    templates = TemplateService()
+    if args.vocs:
+        with open(args.vocs, encoding="utf-8") as f:
+            vocs = [line.strip() for line in f if line.strip()]
+    else:
+        vocs = _SAMPLE_VOCS
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rag = RagService(persist_dir=tmp, cache_size=0)
+        for mode in (CLASSIFY_MODE_TWO_STEP, CLASSIFY_MODE_COMBINED):
+            await _run_mode(mode, settings, templates, rag, vocs, args.repeat)
+        rag.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vocs", help="줄 단위 VOC 텍스트 파일")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""서비스 전체 흐름 처리량/지연 시간 벤치마크.
+
+사용법 (backend 디렉터리에서):
+    # 서비스를 모의 서버로 향하게 실행 (benchmarks.mock_servers 참고)
+    AI_BASE_URL=http://localhost:9001/v1 JIRA_BASE_URL=http://localhost:9002 \\
+        uvicorn app.main:app --port 8000 &
+    python -m benchmarks.e2e --start-mocks --concurrency 16 --duration 60 --output run.json
+    python -m benchmarks.e2e --start-mocks --concurrency 16 --duration 60 --compare run.json
+
+가상 사용자 --concurrency명이 --duration초 동안 다음 흐름을 반복한다.
+  POST /api/chat (또는 --stream이면 /api/chat/stream)
+  → 미리보기가 오면 --confirm-ratio 확률로 POST /api/chat/{id}/confirm
+  → 생성된 티켓으로 POST /api/webhooks/jira (--no-webhook으로 생략)
+  → POST /api/rag/vocs/search, /api/rag/guides/search (--no-rag으로 생략)
+
+엔드포인트별 p50/p95/p99, 초당 요청 수, 오류 수를 출력한다. --stream이면
+SSE 이벤트 도착 시각으로 서비스 내부 단계(분류/추출/첫 필드/완료)까지의
+시간도 집계하고, 종료 시 GET /api/metrics 스냅샷(스케줄러 대기, LLM 서버별
+지연 등)을 결과에 함께 저장한다. --compare로 이전 결과 JSON과 비교하며
+--threshold(%) 이상 나빠진 항목을 표시한다.
+"""
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+
+import httpx
+
+from benchmarks import mock_servers
+from app.services.metrics import LatencyStats
+
+_SAMPLE_VOCS = [
+    "앱에서 로그인 버튼을 누르면 화면이 하얗게 멈춥니다. 아이폰 15, iOS 17.4입니다.",
+    "결제 완료 후에도 주문 내역에 표시되지 않아요. 카드 승인 문자는 받았습니다.",
+    "엑셀로 주문 목록을 내려받는 기능이 있으면 좋겠습니다.",
+    "회원 탈퇴를 요청합니다. 계정 이메일은 test@example.com 입니다.",
+    "검색 결과가 너무 느리게 떠요. 10초 넘게 걸립니다.",
+    "관리자 계정 권한 변경을 요청드립니다.",
+    "푸시 알림이 두 번씩 와요. 안드로이드 14입니다.",
+]
+_QUERIES = ["로그인 오류", "결제 실패", "알림 중복", "권한 요청", "검색 속도"]
+_LATENCY_KEYS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+class Recorder:
+    def __init__(self):
+        self.latency: dict[str, LatencyStats] = {}
+        self.errors: Counter[str] = Counter()
+        self.statuses: dict[str, Counter[str]] = {}
+        self.recording = False
+
+    def record(self, name: str, seconds: float, status: str) -> None:
+        if not self.recording:
+            return
+        self.latency.setdefault(name, LatencyStats(window=1_000_000)).record(seconds)
+        self.statuses.setdefault(name, Counter())[status] += 1
+        if not status.startswith("2"):
+            self.errors[name] += 1
+
+    def summary(self, elapsed: float) -> dict:
+        result = {}
+        for name, stats in sorted(self.latency.items()):
+            snap = stats.snapshot()
+            result[name] = {
+                **snap,
+                "rps": round(snap["count"] / elapsed, 3) if elapsed else 0.0,
+                "errors": self.errors[name],
+                "status_codes": dict(self.statuses[name]),
+            }
+        return result
+
+
+async def _timed(
+    recorder: Recorder, name: str, client: httpx.AsyncClient, path: str, body: dict
+) -> httpx.Response | None:
+    started = time.perf_counter()
+    try:
+        response = await client.post(path, json=body)
+    except httpx.HTTPError as e:
+        recorder.record(name, time.perf_counter() - started, type(e).__name__)
+        return None
+    recorder.record(name, time.perf_counter() - started, str(response.status_code))
+    return response
+
+
+async def _chat_stream(
+    recorder: Recorder, stages: Recorder, client: httpx.AsyncClient, body: dict
+) -> dict | None:
+    """SSE 이벤트별 도착 시각을 단계 지연으로 기록하고 최종 message를 반환."""
+    started = time.perf_counter()
+    final = None
+    seen: set[str] = set()
+    try:
+        async with client.stream("POST", "/api/chat/stream", json=body) as response:
+            event = ""
+            async for line in response.aiter_lines():
+                if line.startswith("event: "):
+                    event = line[len("event: "):]
+                    continue
+                if not line.startswith("data: "):
+                    continue
+                data = json.loads(line[len("data: "):])
+                if event == "stage":
+                    stage = f"stage:{data.get('stage')}"
+                elif event == "fields":
+                    stage = "first_fields"
+                else:
+                    stage = event
+                if stage not in seen:
+                    seen.add(stage)
+                    stages.record(stage, time.perf_counter() - started, "200")
+                if event == "message":
+                    final = data
+            status = str(response.status_code) if "error" not in seen else "error"
+    except httpx.HTTPError as e:
+        recorder.record("chat_stream", time.perf_counter() - started, type(e).__name__)
+        return None
+    recorder.record("chat_stream", time.perf_counter() - started, status)
+    return final
+
+
+async def _user_loop(
+    args, client: httpx.AsyncClient, recorder: Recorder, stages: Recorder,
+    deadline: float, rng: random.Random,
+) -> None:
+    while time.perf_counter() < deadline:
+        session_id = f"bench-{uuid.uuid4().hex[:12]}"
+        message = rng.choice(_SAMPLE_VOCS)
+        if not args.repeat_messages:
+            # 같은 문장이 반복되면 분류 캐시에 적중해 LLM 지연이 빠지므로 매번 다르게 만든다
+            message += f" (주문번호 {rng.randint(100000, 999999)})"
+        body = {"session_id": session_id, "message": message}
+        if args.stream:
+            reply = await _chat_stream(recorder, stages, client, body)
+        else:
+            response = await _timed(recorder, "chat", client, "/api/chat", body)
+            reply = response.json() if response is not None and response.is_success else None
+
+        if (
+            reply
+            and reply.get("type") == "template_preview"
+            and rng.random() < args.confirm_ratio
+        ):
+            meta = reply.get("metadata") or {}
+            response = await _timed(
+                recorder, "confirm", client, f"/api/chat/{session_id}/confirm",
+                {"template_id": meta.get("template_id", ""), "fields": meta.get("fields", {})},
+            )
+            ticket_key = (
+                response.json().get("ticket_key")
+                if response is not None and response.is_success else None
+            )
+            if ticket_key and not args.no_webhook:
+                await _timed(
+                    recorder, "webhook", client, "/api/webhooks/jira",
+                    {"webhookEvent": "jira:issue_created", "issue": {"key": ticket_key}},
+                )
+
+        if not args.no_rag:
+            query = {"query": rng.choice(_QUERIES), "top_k": 3, "mode": args.rag_mode}
+            await _timed(recorder, "rag_vocs_search", client, "/api/rag/vocs/search", query)
+            await _timed(recorder, "rag_guides_search", client, "/api/rag/guides/search", query)
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+async def _run(args) -> dict:
+    recorder, stages = Recorder(), Recorder()
+    limits = httpx.Limits(max_connections=args.concurrency * 2)
+    async with httpx.AsyncClient(base_url=args.target, timeout=args.timeout, limits=limits) as client:
+        if args.warmup > 0:
+            warmup_deadline = time.perf_counter() + args.warmup
+            await asyncio.gather(*(
+                _user_loop(args, client, recorder, stages, warmup_deadline, random.Random(i))
+                for i in range(args.concurrency)
+            ))
+        recorder.recording = stages.recording = True
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            _user_loop(args, client, recorder, stages, deadline, random.Random(args.seed + i))
+            for i in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+        try:
+            server_metrics = (await client.get("/api/metrics")).json()
+        except (httpx.HTTPError, ValueError):
+            server_metrics = {}
+
+    return {
+        "meta": {
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "target": args.target,
+            "concurrency": args.concurrency,
+            "duration_seconds": round(elapsed, 3),
+            "stream": args.stream,
+            "rag_mode": args.rag_mode,
+        },
+        "endpoints": recorder.summary(elapsed),
+        "stages": stages.summary(elapsed),
+        "server_metrics": server_metrics,
+    }
+
+
+def _print_table(title: str, rows: dict) -> None:
+    print(f"\n[{title}]")
+    for name, row in rows.items():
+        print(
+            f"{name:20s} n={row['count']:6d} rps={row['rps']:8.2f} err={row['errors']:4d} "
+            f"p50={row['p50_ms']:9.1f}ms p95={row['p95_ms']:9.1f}ms p99={row['p99_ms']:9.1f}ms"
+        )
+
+
+def _compare(current: dict, baseline: dict, threshold: float) -> int:
+    """이전 결과와 비교해 출력하고 threshold(%) 이상 나빠진 항목 수를 반환."""
+    regressions = 0
+    print(f"\n[compare] baseline {baseline['meta'].get('git_revision') or '?'} "
+          f"→ current {current['meta'].get('git_revision') or '?'}")
+    for section in ("endpoints", "stages"):
+        for name, row in current[section].items():
+            base = baseline.get(section, {}).get(name)
+            if base is None:
+                continue
+            cells = []
+            for key in (*_LATENCY_KEYS, "rps"):
+                before, after = base[key], row[key]
+                change = (after - before) / before * 100 if before else 0.0
+                # 지연은 늘어나면, 처리량은 줄어들면 나빠진 것
+                worse = change > threshold if key != "rps" else change < -threshold
+                regressions += worse
+                cells.append(f"{key}={after:.1f}({change:+.1f}%){'!' if worse else ''}")
+            print(f"{section:9s} {name:20s} " + " ".join(cells))
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=3.0)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--stream", action="store_true", help="/api/chat/stream으로 단계별 시간 측정")
+    parser.add_argument("--confirm-ratio", type=float, default=1.0)
+    parser.add_argument(
+        "--repeat-messages", action="store_true", help="예시 VOC를 그대로 반복 (분류 캐시 적중 포함)"
+    )
+    parser.add_argument("--no-webhook", action="store_true")
+    parser.add_argument("--no-rag", action="store_true")
+    parser.add_argument("--rag-mode", default="vector", choices=["vector", "hybrid", "lexical"])
+    parser.add_argument("--output", default="", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", default="", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--start-mocks", action="store_true", help="모의 LLM/Jira 서버를 함께 실행")
+    mock_servers.add_arguments(parser.add_argument_group("mock servers"))
+    args = parser.parse_args()
+
+    async def run() -> dict:
+        if not args.start_mocks:
+            return await _run(args)
+        servers = mock_servers.build_servers(
+            mock_servers.config_from_args(args), args.host, args.llm_port, args.jira_port
+        )
+        tasks = [asyncio.create_task(server.serve()) for server in servers]
+        while not all(server.started for server in servers):
+            await asyncio.sleep(0.05)
+        try:
+            return await _run(args)
+        finally:
+            for server in servers:
+                server.should_exit = True
+            await asyncio.gather(*tasks)
+
+    result = asyncio.run(run())
+    _print_table("endpoints", result["endpoints"])
+    if result["stages"]:
+        _print_table("stages (since request start)", result["stages"])
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\nsaved {args.output}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = _compare(result, baseline, args.threshold)
+        if regressions and args.fail_on_regression:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,399 @@
+"""부하 테스트용 모의 LLM(OpenAI 호환) / Jira 서버.
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.mock_servers --llm-port 9001 --jira-port 9002 \\
+        --llm-latency-ms 400 --llm-sigma 0.4 --llm-error-rate 0.01 \\
+        --webhook-url http://localhost:8000/api/webhooks/jira
+
+서비스의 .env를 다음처럼 두면 /api/chat → confirm → 웹훅 흐름 전체를
+실제 모델 서버와 Jira Cloud 없이 돌릴 수 있다.
+    AI_BASE_URL=http://localhost:9001/v1
+    JIRA_BASE_URL=http://localhost:9002
+
+LLM 서버는 시스템 프롬프트의 첫 줄로 분류/통합/추출/수정/분석 단계를 구분하고,
+사용자 메시지를 템플릿 키워드로 매칭해(없으면 해시로) 템플릿별 고정 응답을 만든다.
+같은 입력에는 항상 같은 응답을 돌려준다. --responses로 템플릿별 필드 값을
+JSON 파일({"bug_report": {"priority": "High"}, ...})로 덮어쓸 수 있다.
+
+지연 시간은 중앙값(ms)과 sigma의 로그정규 분포로 뽑고(sigma=0이면 고정),
+오류율만큼 500/503/429를 무작위로 돌려준다. 스트리밍 요청은 첫 청크까지
+지연 시간만큼 기다린 뒤 --llm-token-ms 간격으로 나눠 보낸다.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import random
+import time
+import zlib
+from dataclasses import dataclass, field
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.prompts.field_extractor import SYSTEM_PROMPT as EXTRACTOR_PROMPT
+from app.prompts.field_updater import SYSTEM_PROMPT as UPDATER_PROMPT
+from app.prompts.ticket_analyzer import SYSTEM_PROMPT as ANALYZER_PROMPT
+from app.prompts.voc_classifier import SYSTEM_PROMPT as CLASSIFIER_PROMPT
+from app.prompts.voc_classify_extract import SYSTEM_PROMPT as CLASSIFY_EXTRACT_PROMPT
+from app.schemas.template import JiraTemplate
+from app.services.template_service import TemplateService
+
+# 시스템 프롬프트 첫 줄 → 단계
+_STAGES = {
+    CLASSIFIER_PROMPT.splitlines()[0]: "classify",
+    CLASSIFY_EXTRACT_PROMPT.splitlines()[0]: "combined",
+    EXTRACTOR_PROMPT.splitlines()[0]: "extract",
+    UPDATER_PROMPT.splitlines()[0]: "update",
+    ANALYZER_PROMPT.splitlines()[0]: "analyze",
+}
+_ERROR_STATUSES = (500, 503, 429)
+
+
+@dataclass
+class LatencyModel:
+    """로그정규 분포 지연 시간 (median_ms 중앙값, sigma 0이면 고정값)."""
+
+    median_ms: float = 0.0
+    sigma: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.median_ms <= 0:
+            return 0.0
+        return self.median_ms * math.exp(self.sigma * rng.gauss(0.0, 1.0)) / 1000
+
+
+@dataclass
+class MockConfig:
+    llm_latency: LatencyModel = field(default_factory=LatencyModel)
+    llm_token_ms: float = 0.0
+    llm_error_rate: float = 0.0
+    jira_latency: LatencyModel = field(default_factory=LatencyModel)
+    jira_error_rate: float = 0.0
+    webhook_url: str = ""
+    webhook_delay_ms: float = 0.0
+    responses: dict[str, dict] = field(default_factory=dict)
+    seed: int = 42
+
+
+class _Faults:
+    def __init__(self, latency: LatencyModel, error_rate: float, rng: random.Random):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rng = rng
+        self.requests = 0
+        self.errors = 0
+
+    async def delay(self) -> None:
+        self.requests += 1
+        seconds = self.latency.sample(self.rng)
+        if seconds:
+            await asyncio.sleep(seconds)
+
+    def error(self) -> JSONResponse | None:
+        if self.error_rate <= 0 or self.rng.random() >= self.error_rate:
+            return None
+        self.errors += 1
+        status = self.rng.choice(_ERROR_STATUSES)
+        return JSONResponse(
+            {"error": {"message": f"mock error {status}", "type": "mock"}},
+            status_code=status,
+        )
+
+    def stats(self) -> dict:
+        return {"requests": self.requests, "errors": self.errors}
+
+
+# ── LLM ──
+
+
+class CannedResponder:
+    """요청 메시지로 단계와 템플릿을 정해 항상 같은 응답을 만든다."""
+
+    def __init__(self, templates: TemplateService, overrides: dict[str, dict]):
+        self.templates = templates
+        self.overrides = overrides
+
+    def respond(self, messages: list[dict]) -> str:
+        system = messages[0].get("content", "") if messages else ""
+        stage = _STAGES.get(system.splitlines()[0] if system else "", "classify")
+        user = messages[-1].get("content", "") if messages else ""
+        if stage == "analyze":
+            return "## 분석 (mock)\n- 원인 후보: 최근 배포\n- 권장 조치: 로그 확인 후 담당 팀 배정"
+        if stage == "update":
+            return "{}"
+
+        template = self.pick_template(user)
+        fields = self.fields_for(template, user)
+        if stage == "extract":
+            return json.dumps(fields, ensure_ascii=False)
+        result = {
+            "action": "match",
+            "template_id": template.id,
+            "confidence": 0.9,
+            "reasoning": "mock",
+        }
+        if stage == "combined":
+            result["fields"] = fields
+        return json.dumps(result, ensure_ascii=False)
+
+    def pick_template(self, text: str) -> JiraTemplate:
+        # 추출 프롬프트에서는 템플릿이 시스템 프롬프트에 있지만, 같은 메시지면
+        # 분류 때와 같은 템플릿이 나오므로 사용자 메시지만 본다
+        text = text.split("[참고할 수 있는 과거 데이터]")[0]
+        templates = self.templates.get_all_templates()
+        match = self.templates.keyword_matcher.best_match(text, min_score=0.5, margin=0.0)
+        if match is not None:
+            return self.templates.get_template(match[0])
+        return templates[zlib.crc32(text.encode("utf-8")) % len(templates)]
+
+    def fields_for(self, template: JiraTemplate, text: str) -> dict:
+        first_line = text.strip().splitlines()[0] if text.strip() else "VOC"
+        fields: dict = {}
+        for f in template.fields:
+            if f.type == "select" and f.options:
+                fields[f.key] = f.options[len(f.options) // 2]
+            elif f.type == "multiselect" and f.options:
+                fields[f.key] = [f.options[0]]
+            elif f.type == "number":
+                fields[f.key] = 1
+            elif f.type == "text":
+                fields[f.key] = f"(mock) {f.label}\n\n> {text[:500]}"
+            else:
+                fields[f.key] = f"(mock) {first_line[:60]}"
+        fields.update(self.overrides.get(template.id, {}))
+        return fields
+
+
+def create_llm_app(config: MockConfig, templates: TemplateService | None = None) -> FastAPI:
+    app = FastAPI(title="Mock LLM")
+    faults = _Faults(config.llm_latency, config.llm_error_rate, random.Random(config.seed))
+    responder = CannedResponder(templates or TemplateService(), config.responses)
+    ids = itertools.count(1)
+
+    @app.get("/v1/models")
+    async def list_models():
+        return {"object": "list", "data": [{"id": "mock-model", "object": "model"}]}
+
+    @app.get("/mock/stats")
+    async def stats():
+        return faults.stats()
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        await faults.delay()
+        error = faults.error()
+        if error is not None:
+            return error
+
+        content = responder.respond(body.get("messages", []))
+        completion_id = f"chatcmpl-mock-{next(ids)}"
+        model = body.get("model", "mock-model")
+        created = int(time.time())
+        usage = {
+            "prompt_tokens": sum(len(m.get("content", "")) for m in body.get("messages", [])) // 2,
+            "completion_tokens": len(content) // 2,
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        if not body.get("stream"):
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": usage,
+            }
+
+        async def events():
+            for i in range(0, len(content), 8):
+                if i and config.llm_token_ms:
+                    await asyncio.sleep(config.llm_token_ms / 1000)
+                chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [
+                        {"index": 0, "delta": {"content": content[i : i + 8]}, "finish_reason": None}
+                    ],
+                }
+                yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+            done = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+            }
+            yield f"data: {json.dumps(done)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+# ── Jira ──
+
+
+def create_jira_app(config: MockConfig, project_key: str = "VOC") -> FastAPI:
+    app = FastAPI(title="Mock Jira")
+    faults = _Faults(config.jira_latency, config.jira_error_rate, random.Random(config.seed + 1))
+    issues: dict[str, dict] = {}
+    comments: dict[str, list[dict]] = {}
+    ids = itertools.count(10001)
+    webhook_tasks: set[asyncio.Task] = set()
+    webhook_stats = {"sent": 0, "failed": 0}
+
+    async def send_webhook(issue: dict) -> None:
+        if config.webhook_delay_ms:
+            await asyncio.sleep(config.webhook_delay_ms / 1000)
+        payload = {
+            "timestamp": int(time.time() * 1000),
+            "webhookEvent": "jira:issue_created",
+            "issue": {"id": issue["id"], "key": issue["key"]},
+        }
+        try:
+            async with httpx.AsyncClient(timeout=120.0) as client:
+                response = await client.post(
+                    config.webhook_url,
+                    json=payload,
+                    headers={"X-Atlassian-Webhook-Identifier": f"mock-{issue['id']}"},
+                )
+                response.raise_for_status()
+            webhook_stats["sent"] += 1
+        except httpx.HTTPError:
+            webhook_stats["failed"] += 1
+
+    @app.get("/mock/stats")
+    async def stats():
+        return {
+            **faults.stats(),
+            "issues": len(issues),
+            "comments": sum(len(c) for c in comments.values()),
+            "webhooks": dict(webhook_stats),
+        }
+
+    @app.post("/rest/api/3/issue", status_code=201)
+    async def create_issue(request: Request):
+        body = await request.json()
+        await faults.delay()
+        error = faults.error()
+        if error is not None:
+            return error
+        issue_id = str(next(ids))
+        key = f"{project_key}-{issue_id}"
+        issue = {
+            "id": issue_id,
+            "key": key,
+            "self": f"{request.base_url}rest/api/3/issue/{issue_id}",
+            "fields": body.get("fields", {}),
+        }
+        issues[key] = issue
+        if config.webhook_url:
+            task = asyncio.create_task(send_webhook(issue))
+            webhook_tasks.add(task)
+            task.add_done_callback(webhook_tasks.discard)
+        return {"id": issue_id, "key": key, "self": issue["self"]}
+
+    @app.get("/rest/api/3/issue/{key}")
+    async def get_issue(key: str):
+        await faults.delay()
+        error = faults.error()
+        if error is not None:
+            return error
+        if key not in issues:
+            return JSONResponse({"errorMessages": ["Issue does not exist"]}, status_code=404)
+        return issues[key]
+
+    @app.post("/rest/api/3/issue/{key}/comment", status_code=201)
+    async def add_comment(key: str, request: Request):
+        body = await request.json()
+        await faults.delay()
+        error = faults.error()
+        if error is not None:
+            return error
+        if key not in issues:
+            return JSONResponse({"errorMessages": ["Issue does not exist"]}, status_code=404)
+        comment = {"id": str(sum(len(c) for c in comments.values()) + 1), "body": body.get("body")}
+        comments.setdefault(key, []).append(comment)
+        return comment
+
+    return app
+
+
+# ── 실행 ──
+
+
+def build_servers(
+    config: MockConfig, host: str, llm_port: int, jira_port: int
+) -> list[uvicorn.Server]:
+    apps = [(create_llm_app(config), llm_port), (create_jira_app(config), jira_port)]
+    return [
+        uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+        for app, port in apps
+    ]
+
+
+async def serve(config: MockConfig, host: str, llm_port: int, jira_port: int) -> None:
+    servers = build_servers(config, host, llm_port, jira_port)
+    print(f"mock LLM  http://{host}:{llm_port}/v1")
+    print(f"mock Jira http://{host}:{jira_port}")
+    await asyncio.gather(*(server.serve() for server in servers))
+
+
+def config_from_args(args) -> MockConfig:
+    responses = {}
+    if args.responses:
+        with open(args.responses, encoding="utf-8") as f:
+            responses = json.load(f)
+    return MockConfig(
+        llm_latency=LatencyModel(args.llm_latency_ms, args.llm_sigma),
+        llm_token_ms=args.llm_token_ms,
+        llm_error_rate=args.llm_error_rate,
+        jira_latency=LatencyModel(args.jira_latency_ms, args.jira_sigma),
+        jira_error_rate=args.jira_error_rate,
+        webhook_url=args.webhook_url,
+        webhook_delay_ms=args.webhook_delay_ms,
+        responses=responses,
+        seed=args.seed,
+    )
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--llm-port", type=int, default=9001)
+    parser.add_argument("--jira-port", type=int, default=9002)
+    parser.add_argument("--llm-latency-ms", type=float, default=300.0)
+    parser.add_argument("--llm-sigma", type=float, default=0.3)
+    parser.add_argument("--llm-token-ms", type=float, default=0.0)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--jira-latency-ms", type=float, default=80.0)
+    parser.add_argument("--jira-sigma", type=float, default=0.2)
+    parser.add_argument("--jira-error-rate", type=float, default=0.0)
+    parser.add_argument("--webhook-url", default="", help="이슈 생성 후 jira:issue_created 웹훅을 보낼 주소")
+    parser.add_argument("--webhook-delay-ms", type=float, default=0.0)
+    parser.add_argument("--responses", default="", help="템플릿별 필드 값 덮어쓰기 JSON 파일")
+    parser.add_argument("--seed", type=int, default=42)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    args = parser.parse_args()
+    asyncio.run(serve(config_from_args(args), args.host, args.llm_port, args.jira_port))
+
+
+if __name__ == "__main__":
+    main()
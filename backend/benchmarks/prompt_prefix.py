@@ -0,0 +1,119 @@
+"""프롬프트 배치별 prefill 시간(첫 토큰까지 시간) 비교.
+
+사용법 (backend 디렉터리에서, .env의 AI_* 설정으로 실제 서버 호출):
+    python -m benchmarks.prompt_prefix --sessions 5 --turns 6
+
+두 배치로 같은 멀티턴 대화를 재생한다.
+  legacy  RAG 컨텍스트를 시스템 프롬프트 끝에 붙임 → 그 뒤의 대화 이력은
+          턴마다 다른 접두사 뒤에 오므로 서버 prefix 캐시를 재사용하지 못함
+  stable  고정 시스템 프롬프트 → 이력 → (메시지 + RAG) 순서 (AIService 현재 배치)
+
+각 요청은 stream=True, max_tokens=1로 보내 첫 토큰까지의 시간을 prefill
+시간으로 본다. vLLM이라면 --enable-prefix-caching 상태에서 비교해야 한다.
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from openai import AsyncOpenAI
+
+from app.config import Settings
+from app.services.ai_service import AIService
+from app.services.metrics import LatencyStats
+from app.services.template_service import TemplateService
+
+_SUBJECTS = ["로그인", "결제", "파일 업로드", "푸시 알림", "검색", "회원가입", "주문 조회"]
+_SYMPTOMS = ["이 안 됩니다", "에서 오류가 발생합니다", "이 너무 느려요", "중 앱이 종료됩니다", "이 실패합니다"]
+
+
+def _voc(rng: random.Random) -> str:
+    return (
+        f"{rng.choice(_SUBJECTS)}{rng.choice(_SYMPTOMS)}. "
+        f"어제부터 계속 그렇고, 재시도해도 같은 증상입니다. (주문번호 {rng.randint(10000, 99999)})"
+    )
+
+
+def _rag_context(rng: random.Random) -> str:
+    cases = [f"[사례 {i}]\n{_voc(rng)}" for i in range(1, 4)]
+    return "=== 유사 과거 VOC 사례 ===\n\n" + "\n\n".join(cases)
+
+
+def _legacy_messages(
+    system_prompt: str, voc: str, history: list[dict], rag_context: str
+) -> list[dict]:
+    system = f"{system_prompt}\n\n참고할 수 있는 과거 데이터:\n{rag_context}"
+    return [{"role": "system", "content": system}, *history, {"role": "user", "content": voc}]
+
+
+async def _time_to_first_token(
+    client: AsyncOpenAI, model: str, messages: list[dict]
+) -> float:
+    started = time.perf_counter()
+    stream = await client.chat.completions.create(
+        model=model, messages=messages, max_tokens=1, temperature=0.0, stream=True
+    )
+    elapsed = None
+    async for _ in stream:
+        if elapsed is None:
+            elapsed = time.perf_counter() - started
+    return elapsed if elapsed is not None else time.perf_counter() - started
+
+
+async def _run_layout(
+    layout: str, client: AsyncOpenAI, model: str, system_prompt: str, args
+) -> dict:
+    rng = random.Random(args.seed)  # 두 배치가 같은 대화를 재생하도록 동일 시드
+    stats = LatencyStats(window=args.sessions * args.turns)
+    late_turns = LatencyStats(window=args.sessions * args.turns)
+    for _ in range(args.sessions):
+        history: list[dict] = []
+        for turn in range(args.turns):
+            voc = _voc(rng)
+            rag_context = _rag_context(rng)
+            if layout == "legacy":
+                messages = _legacy_messages(system_prompt, voc, history, rag_context)
+            else:
+                messages = AIService.build_messages(system_prompt, voc, history, rag_context)
+            seconds = await _time_to_first_token(client, model, messages)
+            stats.record(seconds)
+            if turn >= args.turns // 2:
+                late_turns.record(seconds)
+            history += [
+                {"role": "user", "content": voc},
+                {"role": "assistant", "content": f"확인했습니다. {voc} 관련 티켓을 준비하겠습니다."},
+            ]
+    return {"all": stats.snapshot(), "late_turns": late_turns.snapshot()}
+
+
+async def _main(args) -> None:
+    settings = Settings()
+    client = AsyncOpenAI(base_url=settings.ai_base_url, api_key=settings.ai_api_key)
+    ai = AIService(settings, TemplateService(), rag_service=None)
+    system_prompt = ai.compiled_prompts().classifier
+
+    # 서버 워밍업 (고정 시스템 프롬프트 자체는 두 배치 모두 캐시될 수 있음)
+    await _time_to_first_token(
+        client, settings.ai_model_name, AIService.build_messages(system_prompt, "워밍업")
+    )
+    for layout in ("legacy", "stable"):
+        result = await _run_layout(layout, client, settings.ai_model_name, system_prompt, args)
+        for scope, snap in result.items():
+            print(
+                f"{layout:6s} {scope:10s} ttft avg={snap['avg_ms']:8.1f}ms "
+                f"p50={snap['p50_ms']:8.1f}ms p95={snap['p95_ms']:8.1f}ms"
+            )
+    await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=5)
+    parser.add_argument("--turns", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
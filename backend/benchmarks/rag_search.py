@@ -0,0 +1,72 @@
+"""RAG 검색 모드별 지연 시간 비교 (vector / hybrid / lexical).
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.rag_search --docs past_vocs.txt --queries 200
+
+--docs를 생략하면 합성 VOC 데이터로 임시 컬렉션을 만들어 측정한다.
+"""
+import argparse
+import random
+import tempfile
+import time
+
+from app.services.metrics import LatencyStats
+from app.services.rag_service import (
+    SEARCH_MODE_HYBRID,
+    SEARCH_MODE_LEXICAL,
+    SEARCH_MODE_VECTOR,
+    RagService,
+)
+
+_SUBJECTS = ["로그인", "결제", "업로드", "알림", "검색", "회원가입", "app", "upload", "payment"]
+_SYMPTOMS = ["안됨", "오류가 발생합니다", "너무 느려요", "crash", "멈춤", "not working", "실패"]
+
+
+def _synthetic_docs(n: int, seed: int = 42) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(_SUBJECTS)} {rng.choice(_SYMPTOMS)} (사례 {i})"
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", help="줄 단위 VOC 텍스트 파일")
+    parser.add_argument("--size", type=int, default=5000, help="합성 문서 수")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.docs:
+        with open(args.docs, encoding="utf-8") as f:
+            docs = [line.strip() for line in f if line.strip()]
+    else:
+        docs = _synthetic_docs(args.size)
+
+    rng = random.Random(7)
+    queries = [" ".join(rng.choice(docs).split()[:2]) for _ in range(args.queries)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rag = RagService(persist_dir=tmp, cache_size=0)
+        started = time.perf_counter()
+        rag.add_vocs_batch(docs, [{"source": "bench"} for _ in docs])
+        print(f"ingested {len(docs)} docs in {time.perf_counter() - started:.1f}s")
+
+        for mode in (SEARCH_MODE_VECTOR, SEARCH_MODE_HYBRID, SEARCH_MODE_LEXICAL):
+            stats = LatencyStats(window=len(queries))
+            for query in queries:
+                t0 = time.perf_counter()
+                rag.search_vocs(query, top_k=args.top_k, mode=mode)
+                stats.record(time.perf_counter() - t0)
+            snap = stats.snapshot()
+            print(
+                f"{mode:8s} avg={snap['avg_ms']:8.3f}ms "
+                f"p50={snap['p50_ms']:8.3f}ms p95={snap['p95_ms']:8.3f}ms "
+                f"p99={snap['p99_ms']:8.3f}ms"
+            )
+        rag.close()
+
+
+if __name__ == "__main__":
+    main()
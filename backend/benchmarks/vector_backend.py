@@ -0,0 +1,93 @@
+"""벡터 백엔드별 recall@k / 지연 시간 비교 (chromadb vs numpy float16/int8).
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.vector_backend --size 20000 --dim 384 --queries 200
+
+정답은 float32 전수 탐색(제곱 L2) 결과이며, 합성 벡터는 군집 구조를 갖도록 만든다.
+"""
+import argparse
+import tempfile
+import time
+
+import chromadb
+import numpy as np
+from chromadb.utils import embedding_functions
+
+from app.services.metrics import LatencyStats
+from app.services.vector_backend import ChromaBackend, NumpyBackend, VectorBackend
+
+
+def _synthetic(n: int, dim: int, clusters: int, rng: np.random.Generator) -> np.ndarray:
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, clusters, size=n)
+    vectors = centers[labels] + 0.3 * rng.normal(size=(n, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def _ground_truth(data: np.ndarray, queries: np.ndarray, k: int) -> list[set[int]]:
+    dists = (
+        (queries**2).sum(1)[:, None] + (data**2).sum(1)[None, :] - 2 * queries @ data.T
+    )
+    return [set(np.argsort(row)[:k].tolist()) for row in dists]
+
+
+def _load(backend: VectorBackend, data: np.ndarray) -> float:
+    started = time.perf_counter()
+    step = backend.max_batch_size
+    for start in range(0, len(data), step):
+        chunk = data[start:start + step]
+        ids = [str(i) for i in range(start, start + len(chunk))]
+        backend.upsert(ids, ids, [{} for _ in ids], chunk)
+    return time.perf_counter() - started
+
+
+def _run(backend: VectorBackend, queries: np.ndarray, truth: list[set[int]], k: int) -> dict:
+    stats = LatencyStats(window=len(queries))
+    hits = 0
+    for q, expected in zip(queries, truth):
+        t0 = time.perf_counter()
+        results = backend.query(q, k)
+        stats.record(time.perf_counter() - t0)
+        hits += len(expected & {int(r["id"]) for r in results})
+    return {"recall": hits / (len(queries) * k), **stats.snapshot()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--clusters", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    data = _synthetic(args.size, args.dim, args.clusters, rng)
+    queries = _synthetic(args.queries, args.dim, args.clusters, rng)
+    truth = _ground_truth(data, queries, args.top_k)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        backends: dict[str, VectorBackend] = {
+            "chromadb": ChromaBackend(
+                chromadb.PersistentClient(path=f"{tmp}/chroma"),
+                "bench",
+                "benchmark",
+                embedding_functions.DefaultEmbeddingFunction(),
+            ),
+            "numpy-float16": NumpyBackend(f"{tmp}/np16", "bench", dtype="float16"),
+            "numpy-int8": NumpyBackend(f"{tmp}/np8", "bench", dtype="int8"),
+        }
+        for name, backend in backends.items():
+            load_s = _load(backend, data)
+            r = _run(backend, queries, truth, args.top_k)
+            print(
+                f"{name:14s} load={load_s:7.2f}s recall@{args.top_k}={r['recall']:.3f} "
+                f"avg={r['avg_ms']:7.3f}ms p50={r['p50_ms']:7.3f}ms "
+                f"p95={r['p95_ms']:7.3f}ms p99={r['p99_ms']:7.3f}ms"
+            )
+            backend.close()
+
+
+if __name__ == "__main__":
+    main()
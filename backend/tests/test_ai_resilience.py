@@ -0,0 +1,191 @@
+import asyncio
+
+import pytest
+
+from app.config import Settings
+from app.services.ai_service import STAGE_CLASSIFY, AIService, LLMUnavailable
+from app.services.circuit_breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN
+from app.services.llm_scheduler import LLMScheduler, SchedulerOverloaded
+
+MESSAGES = [{"role": "user", "content": "결제 오류"}]
+
+
+class FakeCompletions:
+    """_create_completion 대역. 호출마다 behaviors에서 하나씩 꺼내 실행한다."""
+
+    def __init__(self, *behaviors):
+        self.behaviors = list(behaviors)
+        self.calls = 0
+        self.cancelled = 0
+
+    async def __call__(self, client, messages, params, on_delta):
+        behavior = self.behaviors[min(self.calls, len(self.behaviors) - 1)]
+        self.calls += 1
+        try:
+            return await behavior()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+
+def _reply(text: str, delay: float = 0.0):
+    async def behavior():
+        await asyncio.sleep(delay)
+        return text
+
+    return behavior
+
+
+def _hang():
+    async def behavior():
+        await asyncio.Event().wait()
+
+    return behavior
+
+
+def _ai(fake: FakeCompletions, scheduler: LLMScheduler | None = None, **overrides) -> AIService:
+    settings = Settings(
+        ai_api_key="x",
+        ai_classify_timeout_seconds=0.05,
+        ai_breaker_failure_rate=0.5,
+        ai_breaker_window=2,
+        ai_breaker_min_calls=2,
+        ai_breaker_open_seconds=0.1,
+        **overrides,
+    )
+    ai = AIService(settings, None, None, scheduler)
+    ai._create_completion = fake
+    return ai
+
+
+async def _complete(ai: AIService) -> str:
+    return await ai._complete(MESSAGES, 0.1, stage=STAGE_CLASSIFY)
+
+
+async def _open_breaker(ai: AIService) -> None:
+    for _ in range(2):
+        with pytest.raises(LLMUnavailable) as exc_info:
+            await _complete(ai)
+        assert exc_info.value.reason == "timeout"
+    assert ai.breaker.state == STATE_OPEN
+
+
+def test_timeouts_open_breaker_and_open_calls_fail_fast():
+    async def scenario():
+        fake = FakeCompletions(_hang())
+        ai = _ai(fake)
+        await _open_breaker(ai)
+
+        with pytest.raises(LLMUnavailable) as exc_info:
+            await _complete(ai)
+        assert exc_info.value.reason == "circuit_open"
+        assert fake.calls == 2  # 열린 동안은 백엔드를 호출하지 않음
+        stats = ai.get_resilience_stats()
+        assert stats["timeouts"] == 2
+        assert stats["short_circuited"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_half_open_allows_single_probe_and_success_closes():
+    async def scenario():
+        fake = FakeCompletions(_hang(), _hang(), _reply("probe", delay=0.02), _reply("ok"))
+        ai = _ai(fake)
+        await _open_breaker(ai)
+        await asyncio.sleep(0.1)
+        assert ai.breaker.state == STATE_HALF_OPEN
+
+        probe = asyncio.create_task(_complete(ai))
+        await asyncio.sleep(0)
+        with pytest.raises(LLMUnavailable) as exc_info:
+            await _complete(ai)
+        assert exc_info.value.reason == "circuit_open"
+
+        assert await probe == "probe"
+        assert ai.breaker.state == STATE_CLOSED
+        assert await _complete(ai) == "ok"
+
+    asyncio.run(scenario())
+
+
+def test_failed_probe_reopens_breaker():
+    async def scenario():
+        fake = FakeCompletions(_hang())
+        ai = _ai(fake)
+        await _open_breaker(ai)
+        await asyncio.sleep(0.1)
+
+        with pytest.raises(LLMUnavailable) as exc_info:
+            await _complete(ai)
+        assert exc_info.value.reason == "timeout"
+        assert ai.breaker.state == STATE_OPEN
+        assert ai.breaker.stats()["times_opened"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_overloaded_probe_releases_probe_slot():
+    async def scenario():
+        scheduler = LLMScheduler(max_concurrency=1, interactive_queue_size=0)
+        fake = FakeCompletions(_hang(), _hang(), _reply("ok"))
+        ai = _ai(fake, scheduler)
+        await _open_breaker(ai)
+        await asyncio.sleep(0.1)
+
+        async with scheduler.slot():
+            with pytest.raises(SchedulerOverloaded):
+                await _complete(ai)
+        # 과부하 거절은 실패로 세지 않고 시험 호출 자리만 되돌린다
+        assert ai.breaker.state == STATE_HALF_OPEN
+        assert await _complete(ai) == "ok"
+        assert ai.breaker.state == STATE_CLOSED
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_probe_releases_probe_slot():
+    async def scenario():
+        fake = FakeCompletions(_hang(), _hang(), _reply("slow", delay=0.04), _reply("ok"))
+        ai = _ai(fake)
+        await _open_breaker(ai)
+        await asyncio.sleep(0.1)
+
+        probe = asyncio.create_task(_complete(ai))
+        await asyncio.sleep(0.01)
+        probe.cancel()
+        await asyncio.gather(probe, return_exceptions=True)
+        assert ai.breaker.state == STATE_HALF_OPEN
+        assert await _complete(ai) == "ok"
+
+    asyncio.run(scenario())
+
+
+def test_hedge_wins_and_primary_is_cancelled():
+    async def scenario():
+        fake = FakeCompletions(_reply("primary", delay=0.04), _reply("hedge"))
+        ai = _ai(fake, ai_hedge_delay_seconds=0.01)
+
+        assert await _complete(ai) == "hedge"
+        # 남은 primary는 취소만 요청되므로 취소가 처리될 때까지 몇 차례 양보
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert fake.calls == 2
+        assert fake.cancelled == 1
+        stats = ai.get_resilience_stats()
+        assert stats["hedged"] == 1
+        assert stats["hedge_wins"] == 1
+        assert ai.scheduler.stats()["in_flight"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_no_hedge_when_primary_answers_in_time():
+    async def scenario():
+        fake = FakeCompletions(_reply("primary"))
+        ai = _ai(fake, ai_hedge_delay_seconds=0.03)
+
+        assert await _complete(ai) == "primary"
+        assert fake.calls == 1
+        assert ai.get_resilience_stats()["hedged"] == 0
+
+    asyncio.run(scenario())
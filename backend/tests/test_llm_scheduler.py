@@ -0,0 +1,171 @@
+import asyncio
+
+import pytest
+
+from app.services.llm_scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    LLMScheduler,
+    SchedulerOverloaded,
+)
+
+
+def _lane(scheduler: LLMScheduler, lane: str) -> dict:
+    return scheduler.stats()["lanes"][lane]
+
+
+async def _hold(scheduler, lane, order, name, release):
+    async with scheduler.slot(lane):
+        order.append(name)
+        await release.wait()
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_interactive_waiters_are_served_before_background():
+    async def scenario():
+        scheduler = LLMScheduler(max_concurrency=1, background_max_concurrency=1)
+        order: list[str] = []
+        gate = asyncio.Event()
+        holder = asyncio.create_task(
+            _hold(scheduler, PRIORITY_INTERACTIVE, order, "holder", gate)
+        )
+        await _settle()
+
+        done = asyncio.Event()
+        done.set()
+        # 백그라운드가 먼저 줄을 서도 나중에 온 interactive가 먼저 실행된다
+        waiters = [
+            asyncio.create_task(_hold(scheduler, PRIORITY_BACKGROUND, order, "bg1", done)),
+            asyncio.create_task(_hold(scheduler, PRIORITY_BACKGROUND, order, "bg2", done)),
+            asyncio.create_task(_hold(scheduler, PRIORITY_INTERACTIVE, order, "ia1", done)),
+        ]
+        await _settle()
+        assert _lane(scheduler, PRIORITY_BACKGROUND)["queued"] == 2
+        assert _lane(scheduler, PRIORITY_INTERACTIVE)["queued"] == 1
+
+        gate.set()
+        await asyncio.gather(holder, *waiters)
+        assert order == ["holder", "ia1", "bg1", "bg2"]
+        assert scheduler.stats()["in_flight"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_background_cap_leaves_room_for_interactive():
+    async def scenario():
+        scheduler = LLMScheduler(max_concurrency=3, background_max_concurrency=1)
+        order: list[str] = []
+        gate = asyncio.Event()
+        tasks = [
+            asyncio.create_task(_hold(scheduler, PRIORITY_BACKGROUND, order, f"bg{i}", gate))
+            for i in range(3)
+        ]
+        await _settle()
+        assert _lane(scheduler, PRIORITY_BACKGROUND)["in_flight"] == 1
+        assert _lane(scheduler, PRIORITY_BACKGROUND)["queued"] == 2
+        assert not scheduler.has_capacity(PRIORITY_BACKGROUND)
+        assert scheduler.has_capacity(PRIORITY_INTERACTIVE)
+
+        tasks.append(
+            asyncio.create_task(_hold(scheduler, PRIORITY_INTERACTIVE, order, "ia", gate))
+        )
+        await _settle()
+        assert order == ["bg0", "ia"]
+
+        gate.set()
+        await asyncio.gather(*tasks)
+        assert scheduler.stats()["in_flight"] == 0
+        assert _lane(scheduler, PRIORITY_BACKGROUND)["completed"] == 3
+
+    asyncio.run(scenario())
+
+
+def test_full_queue_sheds_with_scheduler_overloaded():
+    async def scenario():
+        scheduler = LLMScheduler(max_concurrency=1, interactive_queue_size=1)
+        order: list[str] = []
+        gate = asyncio.Event()
+        tasks = [
+            asyncio.create_task(_hold(scheduler, PRIORITY_INTERACTIVE, order, name, gate))
+            for name in ("running", "queued")
+        ]
+        await _settle()
+
+        with pytest.raises(SchedulerOverloaded) as exc_info:
+            async with scheduler.slot(PRIORITY_INTERACTIVE):
+                pass
+        assert exc_info.value.priority == PRIORITY_INTERACTIVE
+        assert _lane(scheduler, PRIORITY_INTERACTIVE)["shed"] == 1
+
+        gate.set()
+        await asyncio.gather(*tasks)
+        assert order == ["running", "queued"]
+
+    asyncio.run(scenario())
+
+
+def test_cancel_while_queued_removes_waiter():
+    async def scenario():
+        scheduler = LLMScheduler(max_concurrency=1)
+        order: list[str] = []
+        gate = asyncio.Event()
+        holder = asyncio.create_task(
+            _hold(scheduler, PRIORITY_INTERACTIVE, order, "holder", gate)
+        )
+        await _settle()
+        queued = asyncio.create_task(
+            _hold(scheduler, PRIORITY_INTERACTIVE, order, "queued", gate)
+        )
+        await _settle()
+        assert _lane(scheduler, PRIORITY_INTERACTIVE)["queued"] == 1
+
+        queued.cancel()
+        await asyncio.gather(queued, return_exceptions=True)
+        assert _lane(scheduler, PRIORITY_INTERACTIVE)["queued"] == 0
+        assert scheduler.stats()["in_flight"] == 1
+
+        gate.set()
+        await holder
+        assert scheduler.stats()["in_flight"] == 0
+        assert order == ["holder"]
+
+    asyncio.run(scenario())
+
+
+def test_cancel_right_after_grant_hands_slot_to_next_waiter():
+    async def scenario():
+        scheduler = LLMScheduler(max_concurrency=1)
+        order: list[str] = []
+        gate = asyncio.Event()
+        gate.set()
+        holder = scheduler.slot(PRIORITY_INTERACTIVE)
+        await holder.__aenter__()
+        granted = asyncio.create_task(
+            _hold(scheduler, PRIORITY_INTERACTIVE, order, "granted", gate)
+        )
+        later = asyncio.create_task(
+            _hold(scheduler, PRIORITY_INTERACTIVE, order, "later", gate)
+        )
+        await _settle()
+        assert _lane(scheduler, PRIORITY_INTERACTIVE)["queued"] == 2
+
+        # 반납하면 슬롯이 granted에 바로 배정되고, granted가 깨어나기 전에 취소
+        await holder.__aexit__(None, None, None)
+        assert scheduler.stats()["in_flight"] == 1
+        assert _lane(scheduler, PRIORITY_INTERACTIVE)["queued"] == 1
+        granted.cancel()
+        await asyncio.gather(granted, return_exceptions=True)
+        assert granted.cancelled()
+
+        await later
+        assert order == ["later"]
+        stats = _lane(scheduler, PRIORITY_INTERACTIVE)
+        assert stats["in_flight"] == 0
+        assert stats["queued"] == 0
+        assert stats["completed"] == 2
+
+    asyncio.run(scenario())
@@ -0,0 +1,85 @@
+import io
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers import admin
+from app.services.rag_snapshot import read_snapshot, write_snapshot
+
+PASSWORD = "secret"
+
+
+class _SnapshotOnlyRag:
+    """스냅샷 가져오기 경로만 쓰는 RagService 대역 (파일 읽기는 실제 구현)."""
+
+    async def aimport_snapshot(self, path: str) -> dict:
+        read_snapshot(path)
+        return {"imported": {}}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(admin, "get_rag_service", lambda: _SnapshotOnlyRag())
+    monkeypatch.setattr(
+        admin, "get_settings", lambda: type("S", (), {"admin_password": PASSWORD})()
+    )
+    app = FastAPI()
+    app.include_router(admin.router)
+    return TestClient(app)
+
+
+def _valid_snapshot_bytes(tmp_path) -> bytes:
+    path = tmp_path / "ok.npz"
+    write_snapshot(
+        str(path),
+        "model",
+        {
+            "past_vocs": {
+                "ids": ["a"],
+                "documents": ["doc"],
+                "metadatas": [{}],
+                "embeddings": np.ones((1, 4), dtype=np.float32),
+            }
+        },
+    )
+    return path.read_bytes()
+
+
+def _upload(client, data: bytes):
+    return client.post(
+        "/api/admin/rag/snapshot",
+        files={"file": ("snapshot.npz", io.BytesIO(data))},
+        headers={"X-Admin-Password": PASSWORD},
+    )
+
+
+def test_valid_snapshot_is_imported(client, tmp_path):
+    assert _upload(client, _valid_snapshot_bytes(tmp_path)).status_code == 200
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        pytest.param(lambda data: data[: len(data) // 2], id="truncated"),
+        pytest.param(lambda data: b"not a snapshot at all", id="not-npz"),
+        pytest.param(lambda data: b"", id="empty"),
+    ],
+)
+def test_corrupt_snapshot_upload_returns_400(client, tmp_path, corrupt):
+    response = _upload(client, corrupt(_valid_snapshot_bytes(tmp_path)))
+    assert response.status_code == 400
+    assert "invalid snapshot" in response.json()["detail"]
+
+
+def test_snapshot_missing_column_returns_400(client, tmp_path):
+    path = tmp_path / "ok.npz"
+    path.write_bytes(_valid_snapshot_bytes(tmp_path))
+    with np.load(path) as npz:
+        arrays = {k: npz[k] for k in npz.files if k != "past_vocs.embeddings"}
+    buf = io.BytesIO()
+    np.savez_compressed(buf, **arrays)
+    response = _upload(client, buf.getvalue())
+    assert response.status_code == 400
+    assert "invalid snapshot" in response.json()["detail"]
@@ -0,0 +1,52 @@
+import threading
+
+import numpy as np
+import pytest
+
+from app.services.vector_backend import NumpyBackend
+
+DIM = 64
+
+
+def _unit(i: int, scale: float) -> list[float]:
+    v = np.zeros(DIM, dtype=np.float32)
+    v[i] = scale
+    return v.tolist()
+
+
+def test_int8_query_sees_consistent_rows_during_upsert(tmp_path):
+    """재적재로 같은 행이 바뀌는 동안 조회해도 벡터와 스케일/노름이 섞이지 않아야 한다."""
+    backend = NumpyBackend(str(tmp_path), "vocs", dtype="int8")
+    rng = np.random.default_rng(0)
+    filler = rng.normal(size=(20000, DIM)).astype(np.float32) + 50.0
+    backend.upsert(
+        [f"f{i}" for i in range(len(filler))],
+        [""] * len(filler),
+        [{}] * len(filler),
+        filler,
+    )
+    big, small = _unit(0, 100.0), _unit(1, 0.01)
+    backend.upsert(["target"], ["t"], [{}], [big])
+
+    query = _unit(0, 1.0)
+    expected = {99.0**2, 1.0 + 0.01**2}
+    stop = threading.Event()
+
+    def writer():
+        versions = [small, big]
+        i = 0
+        while not stop.is_set():
+            backend.upsert(["target"], ["t"], [{"v": i}], [versions[i % 2]])
+            i += 1
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        for _ in range(200):
+            hits = [h for h in backend.query(query, top_k=1) if h["id"] == "target"]
+            assert len(hits) == 1
+            assert any(hits[0]["distance"] == pytest.approx(d, rel=1e-2) for d in expected)
+    finally:
+        stop.set()
+        thread.join()
+        backend.close()
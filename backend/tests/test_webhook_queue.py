@@ -0,0 +1,211 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers import jira_webhooks
+from app.services.llm_scheduler import SchedulerOverloaded
+from app.services.webhook_queue import (
+    SUBMIT_DUPLICATE,
+    SUBMIT_FULL,
+    SUBMIT_QUEUED,
+    WebhookQueue,
+)
+
+
+class FakeHandler:
+    """이슈 키별로 정해 둔 예외를 순서대로 던지고, 없으면 성공 처리."""
+
+    def __init__(self, failures: dict[str, list[BaseException]] | None = None):
+        self.failures = failures or {}
+        self.calls: list[str] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def __call__(self, issue_key: str) -> None:
+        self.calls.append(issue_key)
+        await self.gate.wait()
+        pending = self.failures.get(issue_key)
+        if pending:
+            raise pending.pop(0)
+
+
+async def _drain(queue: WebhookQueue) -> None:
+    for _ in range(100):
+        stats = queue.stats()
+        if stats["depth"] == 0 and stats["in_flight"] == 0:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("webhook queue did not drain")
+
+
+def test_dedupes_by_issue_key_and_event_id():
+    async def scenario():
+        handler = FakeHandler()
+        queue = WebhookQueue(handler, workers=1)
+        assert queue.submit("VOC-1", "evt-1") == SUBMIT_QUEUED
+        # 같은 이슈(다른 이벤트), 같은 이벤트(다른 이슈) 모두 중복
+        assert queue.submit("VOC-1", "evt-2") == SUBMIT_DUPLICATE
+        assert queue.submit("VOC-2", "evt-1") == SUBMIT_DUPLICATE
+        assert queue.submit("VOC-2", "evt-3") == SUBMIT_QUEUED
+        await _drain(queue)
+        # 처리를 마친 뒤에도 dedupe_ttl_seconds 동안은 다시 받지 않는다
+        assert queue.submit("VOC-1") == SUBMIT_DUPLICATE
+
+        assert handler.calls == ["VOC-1", "VOC-2"]
+        stats = queue.stats()
+        assert stats["duplicate"] == 3
+        assert stats["succeeded"] == 2
+        await queue.close()
+
+    asyncio.run(scenario())
+
+
+def test_dedupe_expires_after_ttl():
+    async def scenario():
+        queue = WebhookQueue(FakeHandler(), workers=1, dedupe_ttl_seconds=0.05)
+        assert queue.submit("VOC-1", "evt-1") == SUBMIT_QUEUED
+        await _drain(queue)
+        await asyncio.sleep(0.06)
+        assert queue.submit("VOC-1", "evt-1") == SUBMIT_QUEUED
+        await _drain(queue)
+        await queue.close()
+
+    asyncio.run(scenario())
+
+
+def test_retries_only_retry_on_exceptions():
+    async def scenario():
+        handler = FakeHandler(
+            {
+                "VOC-1": [SchedulerOverloaded("background")],
+                "VOC-2": [RuntimeError("boom")],
+                "VOC-3": [SchedulerOverloaded("background")] * 3,
+            }
+        )
+        queue = WebhookQueue(
+            handler,
+            workers=1,
+            max_attempts=3,
+            retry_delay_seconds=0.001,
+            retry_on=(SchedulerOverloaded,),
+        )
+        for key in ("VOC-1", "VOC-2", "VOC-3"):
+            assert queue.submit(key) == SUBMIT_QUEUED
+        await _drain(queue)
+
+        # VOC-1은 한 번 재시도 후 성공, VOC-2는 재시도 없이 실패, VOC-3은 3번 시도 후 포기
+        assert handler.calls == ["VOC-1", "VOC-1", "VOC-2", "VOC-3", "VOC-3", "VOC-3"]
+        stats = queue.stats()
+        assert stats["succeeded"] == 1
+        assert stats["failed"] == 2
+        assert stats["retried"] == 3
+        # 실패한 이슈는 Jira 재전송으로 다시 받을 수 있다
+        assert queue.submit("VOC-2") == SUBMIT_QUEUED
+        await _drain(queue)
+        await queue.close()
+
+    asyncio.run(scenario())
+
+
+def test_rejects_when_queue_is_full():
+    async def scenario():
+        handler = FakeHandler()
+        handler.gate.clear()
+        queue = WebhookQueue(handler, workers=1, max_size=2)
+        assert queue.submit("VOC-1") == SUBMIT_QUEUED
+        await asyncio.sleep(0.01)  # VOC-1은 처리 중이라 대기열에서 빠진다
+        assert queue.submit("VOC-2") == SUBMIT_QUEUED
+        assert queue.submit("VOC-3") == SUBMIT_QUEUED
+        assert queue.submit("VOC-4") == SUBMIT_FULL
+        assert queue.stats()["rejected"] == 1
+
+        handler.gate.set()
+        await _drain(queue)
+        # 거절된 이슈는 중복으로 기억되지 않아 재전송을 받을 수 있다
+        assert queue.submit("VOC-4") == SUBMIT_QUEUED
+        await _drain(queue)
+        assert handler.calls == ["VOC-1", "VOC-2", "VOC-3", "VOC-4"]
+        await queue.close()
+
+    asyncio.run(scenario())
+
+
+def test_restores_pending_jobs_from_sqlite_after_close(tmp_path):
+    path = str(tmp_path / "queue" / "webhooks.sqlite3")
+
+    async def first_run():
+        handler = FakeHandler()
+        handler.gate.clear()
+        queue = WebhookQueue(handler, workers=1, path=path)
+        await queue.start()
+        assert queue.submit("VOC-1", "evt-1") == SUBMIT_QUEUED
+        assert queue.submit("VOC-2", "evt-2") == SUBMIT_QUEUED
+        await asyncio.sleep(0.01)
+        # VOC-1은 처리 도중, VOC-2는 대기 중에 종료
+        assert handler.calls == ["VOC-1"]
+        await queue.close()
+
+    async def second_run():
+        handler = FakeHandler()
+        queue = WebhookQueue(handler, workers=1, path=path)
+        await queue.start()
+        # 복원된 작업도 중복 판단 대상이다
+        assert queue.submit("VOC-2", "evt-9") == SUBMIT_DUPLICATE
+        await _drain(queue)
+        assert handler.calls == ["VOC-1", "VOC-2"]
+        await queue.close()
+
+    async def third_run():
+        handler = FakeHandler()
+        queue = WebhookQueue(handler, workers=1, path=path)
+        await queue.start()
+        await _drain(queue)
+        assert handler.calls == []
+        await queue.close()
+
+    asyncio.run(first_run())
+    asyncio.run(second_run())
+    asyncio.run(third_run())
+
+
+def test_router_returns_503_with_retry_after_when_queue_is_full(monkeypatch):
+    handler = FakeHandler()
+    handler.gate.clear()
+    queue = WebhookQueue(handler, workers=1, max_size=0)
+    monkeypatch.setattr(jira_webhooks, "get_webhook_queue", lambda: queue)
+    app = FastAPI()
+    app.include_router(jira_webhooks.router)
+    client = TestClient(app)
+
+    response = client.post(
+        "/api/webhooks/jira",
+        json={"webhookEvent": "jira:issue_created", "issue": {"key": "VOC-1"}},
+        headers={"X-Atlassian-Webhook-Identifier": "evt-1"},
+    )
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(jira_webhooks.RETRY_AFTER_SECONDS)
+    assert response.json()["status"] == "rejected"
+    assert handler.calls == []
+
+
+def test_router_queues_and_dedupes(monkeypatch):
+    submitted: list[tuple[str, str]] = []
+
+    class RecordingQueue:
+        def submit(self, issue_key: str, event_id: str = "") -> str:
+            submitted.append((issue_key, event_id))
+            return SUBMIT_QUEUED if len(submitted) == 1 else SUBMIT_DUPLICATE
+
+    monkeypatch.setattr(jira_webhooks, "get_webhook_queue", lambda: RecordingQueue())
+    app = FastAPI()
+    app.include_router(jira_webhooks.router)
+    client = TestClient(app)
+
+    body = {"webhookEvent": "jira:issue_created", "issue": {"key": "VOC-1"}}
+    headers = {"X-Atlassian-Webhook-Identifier": "evt-1"}
+    first = client.post("/api/webhooks/jira", json=body, headers=headers)
+    second = client.post("/api/webhooks/jira", json=body, headers=headers)
+    assert (first.status_code, first.json()["status"]) == (202, SUBMIT_QUEUED)
+    assert (second.status_code, second.json()["status"]) == (202, SUBMIT_DUPLICATE)
+    assert submitted == [("VOC-1", "evt-1"), ("VOC-1", "evt-1")]
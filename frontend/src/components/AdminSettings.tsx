@@ -140,6 +140,15 @@ export default function AdminSettings({ onClose }: Props) {
                   placeholder="default-model"
                 />
               </div>
+              <div className="settings-field">
+                <label>Endpoints (url=weight, ...)</label>
+                <input
+                  type="text"
+                  value={getDisplayValue("ai_endpoints")}
+                  onChange={(e) => handleChange("ai_endpoints", e.target.value)}
+                  placeholder="비어 있으면 Base URL만 사용"
+                />
+              </div>
             </div>
 
             <div className="settings-group">
@@ -43,6 +43,7 @@ export interface AdminSettings {
   ai_base_url: string;
   ai_api_key: string;
   ai_model_name: string;
+  ai_endpoints: string;
   jira_base_url: string;
   jira_user_email: string;
   jira_api_token: string;
@@ -53,6 +54,7 @@ export interface AdminSettingsUpdate {
   ai_base_url?: string;
   ai_api_key?: string;
   ai_model_name?: string;
+  ai_endpoints?: string;
   jira_base_url?: string;
   jira_user_email?: string;
   jira_api_token?: string;